@@ -172,6 +172,45 @@ var FigureModel = widgets.DOMWidgetModel.extend({
          */
         _py2js_animate: null,
 
+        /**
+         * @typedef {null|Object} Py2JsExtendTracesMsg
+         * @property {Object} extend_data
+         *  Object from property paths to arrays of new points (one array
+         *  per trace in extend_traces), as accepted by Plotly.extendTraces
+         * @property {Array.<Number>} extend_traces
+         *  Array of indexes of the traces that the new points belong to
+         * @property {null|Number|Object} max_points
+         *  Maximum number of points to keep in each extended array, as
+         *  accepted by Plotly.extendTraces
+         * @property {Number} trace_edit_id
+         *  Edit ID to use when returning trace deltas using
+         *  the _js2py_traceDeltas message
+         * @property {Number} layout_edit_id
+         *  Edit ID to use when returning layout deltas using
+         *  the _js2py_layoutDelta message
+         */
+        _py2js_extendTraces: null,
+
+        /**
+         * @typedef {null|Object} Py2JsPrependTracesMsg
+         * @property {Object} prepend_data
+         *  Object from property paths to arrays of new points (one array
+         *  per trace in prepend_traces), as accepted by
+         *  Plotly.prependTraces
+         * @property {Array.<Number>} prepend_traces
+         *  Array of indexes of the traces that the new points belong to
+         * @property {null|Number|Object} max_points
+         *  Maximum number of points to keep in each prepended array, as
+         *  accepted by Plotly.prependTraces
+         * @property {Number} trace_edit_id
+         *  Edit ID to use when returning trace deltas using
+         *  the _js2py_traceDeltas message
+         * @property {Number} layout_edit_id
+         *  Edit ID to use when returning layout deltas using
+         *  the _js2py_layoutDelta message
+         */
+        _py2js_prependTraces: null,
+
         /**
          * @typedef {null|Object} Py2JsRemoveLayoutPropsMsg
          * @property {Array.<Array.<String|Number>>} remove_props
@@ -402,6 +441,8 @@ var FigureModel = widgets.DOMWidgetModel.extend({
         this.on("change:_py2js_relayout", this.do_relayout, this);
         this.on("change:_py2js_update", this.do_update, this);
         this.on("change:_py2js_animate", this.do_animate, this);
+        this.on("change:_py2js_extendTraces", this.do_extendTraces, this);
+        this.on("change:_py2js_prependTraces", this.do_prependTraces, this);
         this.on("change:_py2js_removeLayoutProps",
             this.do_removeLayoutProps, this);
         this.on("change:_py2js_removeTraceProps",
@@ -577,6 +618,34 @@ var FigureModel = widgets.DOMWidgetModel.extend({
         }
     },
 
+    /**
+     * Handle extendTraces message
+     */
+    do_extendTraces: function () {
+
+        /** @type {Py2JsExtendTracesMsg} */
+        var msgData = this.get("_py2js_extendTraces");
+        if (msgData !== null) {
+            performExtendTracesLike(
+                this.get("_data"), msgData.extend_data,
+                msgData.extend_traces, msgData.max_points, false);
+        }
+    },
+
+    /**
+     * Handle prependTraces message
+     */
+    do_prependTraces: function () {
+
+        /** @type {Py2JsPrependTracesMsg} */
+        var msgData = this.get("_py2js_prependTraces");
+        if (msgData !== null) {
+            performExtendTracesLike(
+                this.get("_data"), msgData.prepend_data,
+                msgData.prepend_traces, msgData.max_points, true);
+        }
+    },
+
     /**
      * Handle removeLayoutProps message
      */
@@ -625,6 +694,10 @@ var FigureModel = widgets.DOMWidgetModel.extend({
             serialize: js2py_serializer},
         _py2js_animate: { deserialize: py2js_deserializer,
             serialize: js2py_serializer},
+        _py2js_extendTraces: { deserialize: py2js_deserializer,
+            serialize: js2py_serializer},
+        _py2js_prependTraces: { deserialize: py2js_deserializer,
+            serialize: js2py_serializer},
         _py2js_removeLayoutProps: { deserialize: py2js_deserializer,
             serialize: js2py_serializer},
         _py2js_removeTraceProps: { deserialize: py2js_deserializer,
@@ -685,6 +758,10 @@ var FigureView = widgets.DOMWidgetView.extend({
             this.do_update, this);
         this.model.on("change:_py2js_animate",
             this.do_animate, this);
+        this.model.on("change:_py2js_extendTraces",
+            this.do_extendTraces, this);
+        this.model.on("change:_py2js_prependTraces",
+            this.do_prependTraces, this);
 
         // MathJax configuration
         // ---------------------
@@ -897,6 +974,22 @@ var FigureView = widgets.DOMWidgetView.extend({
                 }
             }
 
+            // Transfer numeric arrays as binary buffers. Large selections
+            // then arrive on the Python side as numpy arrays rather than
+            // as JSON lists
+            pointsObject["trace_indexes"] = packNumericArray(
+                pointsObject["trace_indexes"], Int32Array);
+            pointsObject["point_indexes"] = packNumericArray(
+                pointsObject["point_indexes"], Int32Array);
+            pointsObject["xs"] = packNumericArray(
+                pointsObject["xs"], Float64Array);
+            pointsObject["ys"] = packNumericArray(
+                pointsObject["ys"], Float64Array);
+            if (hasZ) {
+                pointsObject["zs"] = packNumericArray(
+                    pointsObject["zs"], Float64Array);
+            }
+
             return pointsObject
         } else {
             return null
@@ -1326,6 +1419,82 @@ var FigureView = widgets.DOMWidgetView.extend({
         }
     },
 
+    /**
+     * Handle Plotly.extendTraces request
+     */
+    do_extendTraces: function () {
+
+        /** @type {Py2JsExtendTracesMsg} */
+        var msgData = this.model.get("_py2js_extendTraces");
+        if (msgData !== null) {
+            this._performExtendTraces(
+                Plotly.extendTraces, msgData.extend_data,
+                msgData.extend_traces, msgData.max_points,
+                msgData.trace_edit_id, msgData.layout_edit_id);
+        }
+    },
+
+    /**
+     * Handle Plotly.prependTraces request
+     */
+    do_prependTraces: function () {
+
+        /** @type {Py2JsPrependTracesMsg} */
+        var msgData = this.model.get("_py2js_prependTraces");
+        if (msgData !== null) {
+            this._performExtendTraces(
+                Plotly.prependTraces, msgData.prepend_data,
+                msgData.prepend_traces, msgData.max_points,
+                msgData.trace_edit_id, msgData.layout_edit_id);
+        }
+    },
+
+    /**
+     * Apply a Plotly.extendTraces or Plotly.prependTraces operation to
+     * this view and report the resulting deltas back to Python
+     *
+     * Only the new points are transferred from Python, so streaming
+     * updates don't resend the full trace arrays.
+     */
+    _performExtendTraces: function (plotlyMethod, updateData, traceIndexes,
+                                    maxPoints, trace_edit_id,
+                                    layout_edit_id) {
+        var that = this;
+
+        // Plotly.extendTraces/prependTraces treat an undefined maxPoints
+        // as unbounded
+        if (maxPoints === null) {
+            maxPoints = undefined;
+        }
+
+        // Plotly mutates the update object, so pass a shallow copy to keep
+        // the model's message intact
+        updateData = _.clone(updateData);
+
+        var sendDeltas = function () {
+            // ### Send trace deltas ###
+            that._sendTraceDeltas(trace_edit_id);
+
+            // ### Send layout delta ###
+            that._sendLayoutDelta(layout_edit_id);
+        };
+
+        // The deltas are sent even if plotly.js rejects the update, so
+        // that Python doesn't keep waiting on these edit ids
+        var promise;
+        try {
+            promise = plotlyMethod(
+                this.el, updateData, traceIndexes, maxPoints);
+        } catch (err) {
+            promise = Promise.reject(err);
+        }
+
+        promise.then(sendDeltas, function (err) {
+            console.error(err);
+            sendDeltas();
+        });
+    },
+
     /**
      * Construct layout delta object and send layoutDelta message to the
      * Python side
@@ -1426,6 +1595,74 @@ function serializeTypedArray(v) {
     return res
 }
 
+/**
+ * Build a typed array over the bytes referenced by a DataView (or typed
+ * array) received from the Python side.  The bytes are only copied if they
+ * are not aligned to the element size of the typed array type.
+ *
+ * @param {DataView|ArrayBufferView} view
+ * @param {Function} typedarray_type
+ * @returns {TypedArray}
+ */
+function bufferToTypedArray(view, typedarray_type) {
+    var bytesPerElement = typedarray_type.BYTES_PER_ELEMENT;
+    var length = view.byteLength / bytesPerElement;
+    if (view.byteOffset % bytesPerElement === 0) {
+        return new typedarray_type(view.buffer, view.byteOffset, length);
+    } else {
+        var buffer = view.buffer.slice(
+            view.byteOffset, view.byteOffset + view.byteLength);
+        return new typedarray_type(buffer);
+    }
+}
+
+/**
+ * Reshape a flat, row-major typed array into nested Arrays of typed array
+ * views with the specified shape (e.g. the rows of a 2D heatmap `z`).
+ * One dimensional arrays are returned unchanged. No element data is copied.
+ *
+ * @param {TypedArray} typedArray
+ * @param {Array.<Number>} shape
+ * @returns {TypedArray|Array}
+ */
+function reshapeTypedArray(typedArray, shape) {
+    if (!shape || shape.length <= 1) {
+        return typedArray;
+    }
+
+    var rowLength = 1;
+    for (var d = 1; d < shape.length; d++) {
+        rowLength *= shape[d];
+    }
+
+    var innerShape = shape.slice(1);
+    var res = new Array(shape[0]);
+    for (var i = 0; i < shape[0]; i++) {
+        res[i] = reshapeTypedArray(
+            typedArray.subarray(i * rowLength, (i + 1) * rowLength),
+            innerShape);
+    }
+    return res;
+}
+
+/**
+ * Convert an array of numbers into a typed array of the specified type.
+ * Arrays containing any non-numeric element (e.g. category strings, dates
+ * or nested point indexes) are returned unchanged.
+ *
+ * @param {Array} values
+ * @param {Function} typedarray_type
+ * @returns {Array|TypedArray}
+ */
+function packNumericArray(values, typedarray_type) {
+    for (var i = 0; i < values.length; i++) {
+        if (typeof values[i] !== "number") {
+            return values;
+        }
+    }
+    return new typedarray_type(values);
+}
+
 /**
  * ipywidget JavaScript -> Python serializer
  */
@@ -1483,8 +1720,9 @@ function py2js_deserializer(v, widgetManager) {
             // This was renamed `value` in 3.2 to work around a naming conflict
             // when saving widget state to a notebook.
             var typedarray_type = numpy_dtype_to_typedarray_type[v.dtype];
-            var buffer = _.has(v, 'value')? v.value.buffer: v.buffer.buffer;
-            res = new typedarray_type(buffer);
+            var view = _.has(v, 'value')? v.value: v.buffer;
+            res = reshapeTypedArray(
+                bufferToTypedArray(view, typedarray_type), v.shape);
         } else {
             // Deserialize object properties recursively
             res = {};
@@ -1629,6 +1867,92 @@ function performRestyleLike(parentArray, restyleData, restyleTraces) {
     }
 }
 
+/**
+ * Perform a Plotly.extendTraces or Plotly.prependTraces like operation on an
+ * input object array
+ *
+ * @param {Array.<Object>} parentArray
+ *  The object array that the operation should be applied to
+ * @param {Object} updateData
+ *  Object from property paths to arrays of new points, one array per
+ *  trace in traceIndexes
+ * @param {Array.<Number>} traceIndexes
+ *  Array of indexes of the traces that the operation applies to
+ * @param {null|Number|Object} maxPoints
+ *  Maximum number of points to keep, either a single number or an object
+ *  from property paths to numbers
+ * @param {Boolean} prepend
+ *  Whether to prepend (true) or append (false) the new points
+ *
+ *  Examples:
+ *      var d = [{x: [1, 2]}]
+ *      performExtendTracesLike(d, {x: [[3, 4]]}, [0], 3, false)
+ *      d -> [{x: [2, 3, 4]}]
+ *
+ *      var d = [{x: [1, 2]}]
+ *      performExtendTracesLike(d, {x: [[3, 4]]}, [0], null, true)
+ *      d -> [{x: [3, 4, 1, 2]}]
+ */
+function performExtendTracesLike(parentArray, updateData, traceIndexes,
+                                 maxPoints, prepend) {
+    for (var rawKey in updateData) {
+        if (!updateData.hasOwnProperty(rawKey)) { continue }
+
+        var valArray = updateData[rawKey];
+        var keyMaxPoints = _.isPlainObject(maxPoints) ?
+            maxPoints[rawKey] : maxPoints;
+
+        for (var i = 0; i < traceIndexes.length; i++) {
+            var trace = parentArray[traceIndexes[i]];
+            var newPoints = valArray[i];
+            var currentPoints = _.get(trace, rawKey);
+
+            var combined;
+            if (currentPoints === undefined || currentPoints === null) {
+                combined = newPoints;
+            } else if (prepend) {
+                combined = concatArrays(newPoints, currentPoints);
+            } else {
+                combined = concatArrays(currentPoints, newPoints);
+            }
+
+            var traceMaxPoints = Array.isArray(keyMaxPoints) ?
+                keyMaxPoints[i] : keyMaxPoints;
+            if (traceMaxPoints !== null && traceMaxPoints !== undefined &&
+                combined.length > traceMaxPoints) {
+                if (prepend) {
+                    combined = combined.slice(0, traceMaxPoints);
+                } else {
+                    combined = combined.slice(
+                        combined.length - traceMaxPoints);
+                }
+            }
+
+            _.set(trace, rawKey, combined);
+        }
+    }
+}
+
+/**
+ * Concatenate two arrays or typed arrays. The result is a typed array if
+ * both inputs are typed arrays of the same type, and a standard array
+ * otherwise.
+ *
+ * @param {Array|TypedArray} a
+ * @param {Array|TypedArray} b
+ * @returns {Array|TypedArray}
+ */
+function concatArrays(a, b) {
+    if (isTypedArray(a) && isTypedArray(b) && a.constructor === b.constructor) {
+        var res = new a.constructor(a.length + b.length);
+        res.set(a);
+        res.set(b, a.length);
+        return res;
+    }
+    return Array.prototype.slice.call(a).concat(
+        Array.prototype.slice.call(b));
+}
+
 /**
  * Perform a Plotly.moveTraces like operation on an input object array
  * @param parentArray
@@ -2356,15 +2356,27 @@ class ImageUriValidator(BaseValidator):
         return v
 
     @staticmethod
-    def pil_image_to_uri(v):
+    def pil_image_to_uri(v, image_format="png"):
+        image_format = image_format.lower()
+        if image_format == "jpg":
+            image_format = "jpeg"
+        if image_format not in ("png", "jpeg"):
+            raise ValueError(
+                "Images can be converted to png or jpeg data URIs, "
+                "received format {image_format}".format(image_format=repr(image_format))
+            )
+        if image_format == "jpeg" and v.mode not in ("L", "RGB"):
+            # JPEG images have no transparency
+            v = v.convert("RGB")
         in_mem_file = io.BytesIO()
-        v.save(in_mem_file, format="PNG")
+        v.save(in_mem_file, format=image_format.upper())
         in_mem_file.seek(0)
         img_bytes = in_mem_file.read()
         base64_encoded_result_bytes = base64.b64encode(img_bytes)
         base64_encoded_result_str = base64_encoded_result_bytes.decode("ascii")
-        v = "data:image/png;base64,{base64_encoded_result_str}".format(
-            base64_encoded_result_str=base64_encoded_result_str
+        v = "data:image/{image_format};base64,{base64_encoded_result_str}".format(
+            image_format=image_format,
+            base64_encoded_result_str=base64_encoded_result_str,
         )
         return v
 
@@ -2717,13 +2729,13 @@ class BaseTemplateValidator(CompoundValidator):
             # Check if v is a template identifier
             # (could be any hashable object)
             if v in pio.templates:
-                return copy.deepcopy(pio.templates[v])
+                return self._copy_template(pio.templates[v])
             # Otherwise, if v is a string, check to see if it consists of
             # multiple template names joined on '+' characters
             elif isinstance(v, string_types):
                 template_names = v.split("+")
                 if all([name in pio.templates for name in template_names]):
-                    return pio.templates.merge_templates(*template_names)
+                    return self._copy_template(pio.templates[v])
 
         except TypeError:
             # v is un-hashable
@@ -2736,6 +2748,22 @@ class BaseTemplateValidator(CompoundValidator):
             # explicitly set to empty.
             return self.data_class(data_scatter=[{}])
 
+        if isinstance(v, self.data_class):
+            return self._copy_template(v)
+
         return super(BaseTemplateValidator, self).validate_coerce(
             v, skip_invalid=skip_invalid
         )
+
+    def _copy_template(self, template):
+        """
+        Copy a template object without validating its properties again
+
+        Template objects only hold valid properties, so the copy is built
+        from their properties as is, the way that the built-in templates
+        are loaded.
+        """
+        v = self.data_class(template.to_plotly_json(), _validate=False)
+        v._validate = True
+        v._plotly_name = self.plotly_name
+        return v
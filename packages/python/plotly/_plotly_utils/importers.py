@@ -1,4 +1,5 @@
 import importlib
+import sys
 
 
 def relative_import(parent_name, rel_modules=(), rel_classes=()):
@@ -34,7 +35,12 @@ def relative_import(parent_name, rel_modules=(), rel_classes=()):
             rel_module = ".".join(rel_path_parts[:-1])
             class_name = import_name
             class_module = importlib.import_module(rel_module, parent_name)
-            return getattr(class_module, class_name)
+            cls = getattr(class_module, class_name)
+
+            # Cache the class in the parent module, so that __getattr__ is
+            # only called on the first access, e.g. to go.Scatter
+            setattr(sys.modules[parent_name], import_name, cls)
+            return cls
 
         raise AttributeError(
             "module {__name__!r} has no attribute {name!r}".format(
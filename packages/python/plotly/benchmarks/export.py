@@ -0,0 +1,103 @@
+"""
+Benchmarks of JSON and HTML export of figures, with plotly.io
+"""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import plotly.express as px
+import plotly.graph_objs as go
+import plotly.io as pio
+
+from .graph_objects import _scatter_dicts
+
+
+class FigureExport:
+    """
+    JSON and HTML export of figures of large arrays and of many traces
+    """
+
+    params = [(1, 1000000), (100, 10000), (2000, 100)]
+    param_names = ["traces_points"]
+    timeout = 300
+
+    def setup(self, traces_points):
+        self.fig = go.Figure(data=_scatter_dicts(*traces_points))
+        self.json = self.fig.to_json()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown(self, traces_points):
+        shutil.rmtree(self.tmpdir)
+
+    def time_to_json(self, traces_points):
+        self.fig.to_json()
+
+    def time_to_json_without_validation(self, traces_points):
+        pio.to_json(self.fig, validate=False)
+
+    def time_from_json(self, traces_points):
+        pio.from_json(self.json)
+
+    def time_to_html(self, traces_points):
+        self.fig.to_html(include_plotlyjs=False, full_html=False)
+
+    def time_write_html(self, traces_points):
+        # plotly.js is bundled with the package, and is written next to the
+        # figure
+        self.fig.write_html(
+            os.path.join(self.tmpdir, "figure.html"), include_plotlyjs="directory"
+        )
+
+    def peakmem_to_json(self, traces_points):
+        self.fig.to_json()
+
+    def peakmem_to_html(self, traces_points):
+        self.fig.to_html(include_plotlyjs=False, full_html=False)
+
+    def track_json_size(self, traces_points):
+        return len(self.json)
+
+
+class DatasetExport:
+    """
+    HTML export of plotly express figures of the bundled datasets, including
+    the bundled plotly.js
+    """
+
+    params = ["gapminder_animation", "tips_facets", "iris_scatter_matrix"]
+    param_names = ["figure"]
+
+    def setup(self, figure):
+        if figure == "gapminder_animation":
+            self.fig = px.scatter(
+                px.data.gapminder(),
+                x="gdpPercap",
+                y="lifeExp",
+                size="pop",
+                color="continent",
+                hover_name="country",
+                animation_frame="year",
+                animation_group="country",
+                log_x=True,
+            )
+        elif figure == "tips_facets":
+            self.fig = px.histogram(
+                px.data.tips(),
+                x="total_bill",
+                color="sex",
+                facet_row="time",
+                facet_col="day",
+            )
+        else:
+            self.fig = px.scatter_matrix(px.data.iris(), color="species")
+
+    def time_to_html(self, figure):
+        self.fig.to_html(include_plotlyjs=True)
+
+    def peakmem_to_html(self, figure):
+        self.fig.to_html(include_plotlyjs=True)
+
+    def track_html_size(self, figure):
+        return len(self.fig.to_html(include_plotlyjs=False))
@@ -0,0 +1,395 @@
+"""
+Benchmarks of plotly express figure construction
+"""
+import numpy as np
+import pandas as pd
+
+import plotly.express as px
+
+
+class ExpressGroupSplitting:
+    """
+    Splitting of a data frame into one trace per group of a high-cardinality
+    color mapping
+    """
+
+    params = ([100000, 1000000], [10, 500, 5000])
+    param_names = ["n_rows", "n_groups"]
+    timeout = 300
+
+    def setup(self, n_rows, n_groups):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(
+            {
+                "x": rng.randn(n_rows),
+                "y": rng.randn(n_rows),
+                "group": rng.randint(0, n_groups, n_rows).astype(str),
+            }
+        )
+
+    def time_scatter_color_groups(self, n_rows, n_groups):
+        px.scatter(self.df, x="x", y="y", color="group")
+
+
+class ExpressTrendlines:
+    """
+    Trendline fits of many groups
+    """
+
+    params = (["ols", "lowess"], [10, 2000], ["numpy", "statsmodels"])
+    param_names = ["trendline", "n_groups", "engine"]
+    timeout = 300
+
+    def setup(self, trendline, n_groups, engine):
+        rng = np.random.RandomState(0)
+        n_rows = 100 * n_groups
+        self.df = pd.DataFrame(
+            {
+                "x": rng.randn(n_rows),
+                "y": rng.randn(n_rows),
+                "group": rng.randint(0, n_groups, n_rows).astype(str),
+            }
+        )
+
+    def time_scatter_trendlines(self, trendline, n_groups, engine):
+        px.scatter(
+            self.df,
+            x="x",
+            y="y",
+            color="group",
+            trendline=trendline,
+            trendline_engine=engine,
+        )
+
+
+class ExpressPreaggregatedHistograms:
+    """
+    Histograms and density heatmaps of large data frames, binned in the browser
+    or preaggregated in Python
+    """
+
+    params = ([100000, 10000000], [False, True])
+    param_names = ["n_rows", "preaggregate"]
+    timeout = 300
+
+    def setup(self, n_rows, preaggregate):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame({"x": rng.randn(n_rows), "y": rng.randn(n_rows)})
+
+    def time_histogram_to_json(self, n_rows, preaggregate):
+        px.histogram(self.df, x="x", preaggregate=preaggregate).to_json()
+
+    def time_density_heatmap_to_json(self, n_rows, preaggregate):
+        px.density_heatmap(self.df, x="x", y="y", preaggregate=preaggregate).to_json()
+
+    def track_histogram_json_size(self, n_rows, preaggregate):
+        return len(px.histogram(self.df, x="x", preaggregate=preaggregate).to_json())
+
+
+class ExpressRasterScatter:
+    """
+    Scatter plots of millions of points, drawn with webgl or rasterized in
+    Python
+    """
+
+    params = ([1000000, 10000000], ["webgl", "raster"])
+    param_names = ["n_rows", "render_mode"]
+    timeout = 300
+
+    def setup(self, n_rows, render_mode):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(
+            {
+                "x": rng.randn(n_rows),
+                "y": rng.randn(n_rows),
+                "group": rng.choice(list("abcde"), n_rows),
+            }
+        )
+
+    def time_scatter_to_json(self, n_rows, render_mode):
+        px.scatter(
+            self.df, x="x", y="y", color="group", render_mode=render_mode
+        ).to_json()
+
+
+class ExpressHierarchy:
+    """
+    Sunburst and treemap hierarchies of many leaves built from path columns
+    """
+
+    params = ([100000, 1000000], [3, 5])
+    param_names = ["n_rows", "n_levels"]
+    timeout = 300
+
+    def setup(self, n_rows, n_levels):
+        rng = np.random.RandomState(0)
+        self.path = ["level%d" % i for i in range(n_levels)]
+        self.df = pd.DataFrame(
+            {
+                name: rng.randint(0, 3 + 4 * i, n_rows).astype(str)
+                for i, name in enumerate(self.path)
+            }
+        )
+        self.df["values"] = rng.rand(n_rows)
+        self.df["color"] = rng.randn(n_rows)
+
+    def time_sunburst_path(self, n_rows, n_levels):
+        px.sunburst(self.df, path=self.path, values="values", color="color")
+
+    def time_treemap_path_discrete_color(self, n_rows, n_levels):
+        px.treemap(self.df, path=self.path, color=self.path[1])
+
+
+class ExpressWideDataFrames:
+    """
+    Figures of all the columns of wide data frames
+    """
+
+    params = [100000, 1000000]
+    param_names = ["n_rows"]
+    timeout = 300
+
+    def setup(self, n_rows):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame({"col%d" % i: rng.randn(n_rows) for i in range(20)})
+
+    def time_parallel_coordinates(self, n_rows):
+        px.parallel_coordinates(self.df)
+
+    def peakmem_parallel_coordinates(self, n_rows):
+        px.parallel_coordinates(self.df)
+
+    def peakmem_scatter_matrix(self, n_rows):
+        px.scatter_matrix(self.df)
+
+
+class ExpressAnimation:
+    """
+    Animations of many frames in the style of the gapminder example
+    """
+
+    params = ([50, 500], [200])
+    param_names = ["n_frames", "n_groups"]
+    timeout = 300
+
+    def setup(self, n_frames, n_groups):
+        rng = np.random.RandomState(0)
+        n_rows = n_frames * n_groups
+        self.df = pd.DataFrame(
+            {
+                "frame": np.repeat(np.arange(n_frames), n_groups),
+                "group": np.tile(np.arange(n_groups).astype(str), n_frames),
+                "category": np.tile(rng.choice(list("abcde"), n_groups), n_frames),
+                "x": rng.lognormal(8, 1, n_rows),
+                "y": rng.uniform(40, 80, n_rows),
+                "size": rng.randint(100000, 1000000000, n_rows),
+            }
+        )
+
+    def make_figure(self):
+        return px.scatter(
+            self.df,
+            x="x",
+            y="y",
+            size="size",
+            color="category",
+            hover_name="group",
+            animation_frame="frame",
+            animation_group="group",
+            log_x=True,
+        )
+
+    def time_scatter_animation(self, n_frames, n_groups):
+        self.make_figure()
+
+    def time_scatter_animation_to_json(self, n_frames, n_groups):
+        self.make_figure().to_json()
+
+    def track_json_size(self, n_frames, n_groups):
+        return len(self.make_figure().to_json())
+
+
+class ExpressImshow:
+    """
+    Photographs displayed with imshow, as arrays of values or as compressed
+    images
+    """
+
+    params = [False, True]
+    param_names = ["binary_string"]
+    timeout = 300
+
+    def setup(self, binary_string):
+        rng = np.random.RandomState(0)
+        self.img = rng.randint(0, 256, (3000, 4000, 3)).astype(np.uint8)
+
+    def time_imshow_to_json(self, binary_string):
+        px.imshow(self.img, binary_string=binary_string).to_json()
+
+    def track_json_size(self, binary_string):
+        return len(px.imshow(self.img, binary_string=binary_string).to_json())
+
+
+class ExpressDictOfArrays:
+    """
+    Small figures of dicts of numpy arrays, which do not need pandas, and of
+    data frames
+    """
+
+    params = [False, True]
+    param_names = ["data_frame"]
+
+    def setup(self, data_frame):
+        rng = np.random.RandomState(0)
+        self.data = {
+            "x": rng.randn(1000),
+            "y": rng.randn(1000),
+            "group": rng.choice(list("abcde"), 1000),
+        }
+        if data_frame:
+            self.data = pd.DataFrame(self.data)
+
+    def time_scatter(self, data_frame):
+        px.scatter(self.data, x="x", y="y")
+
+    def time_scatter_color_groups(self, data_frame):
+        px.scatter(self.data, x="x", y="y", color="group")
+
+
+class ExpressManyTraces:
+    """
+    Figures of thousands of small traces, of color and symbol groups and of
+    facets
+    """
+
+    params = [100, 1000]
+    param_names = ["n_groups"]
+    timeout = 300
+
+    def setup(self, n_groups):
+        rng = np.random.RandomState(0)
+        n_rows = 50 * n_groups
+        self.df = pd.DataFrame(
+            {
+                "x": rng.randn(n_rows),
+                "y": rng.randn(n_rows),
+                "group": rng.randint(0, n_groups, n_rows).astype(str),
+                "symbol": rng.choice(list("ab"), n_rows),
+                "facet": rng.choice(list("pqrs"), n_rows),
+            }
+        )
+
+    def time_scatter_color_symbol(self, n_groups):
+        px.scatter(self.df, x="x", y="y", color="group", symbol="symbol")
+
+    def time_bar_facets(self, n_groups):
+        px.bar(self.df, x="symbol", y="y", color="group", facet_col="facet")
+
+
+class ExpressChartTypes:
+    """
+    Chart types of plotly express across row counts and group cardinalities
+    """
+
+    params = (
+        ["scatter", "line", "bar", "histogram", "box", "violin", "scatter_3d"]
+        + ["scatter_polar", "density_heatmap", "density_contour"],
+        [1000, 100000],
+        [1, 10, 100],
+    )
+    param_names = ["chart_type", "n_rows", "n_groups"]
+    timeout = 300
+
+    def setup(self, chart_type, n_rows, n_groups):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(
+            {
+                "x": rng.randn(n_rows),
+                "y": rng.randn(n_rows),
+                "z": rng.randn(n_rows),
+                "group": rng.randint(0, n_groups, n_rows).astype(str),
+            }
+        )
+        self.kwargs = dict(x="x", y="y", color="group")
+        if chart_type == "scatter_3d":
+            self.kwargs["z"] = "z"
+        elif chart_type == "scatter_polar":
+            self.kwargs = dict(r="x", theta="y", color="group")
+        elif chart_type in ["box", "violin"]:
+            self.kwargs["x"] = "group"
+        elif chart_type == "density_heatmap":
+            del self.kwargs["color"]
+        self.chart = getattr(px, chart_type)
+
+    def time_chart(self, chart_type, n_rows, n_groups):
+        self.chart(self.df, **self.kwargs)
+
+    def peakmem_chart(self, chart_type, n_rows, n_groups):
+        self.chart(self.df, **self.kwargs)
+
+
+class ExpressDatasets:
+    """
+    Figures of the datasets bundled with plotly express
+    """
+
+    params = [
+        "gapminder_animation",
+        "tips_facets",
+        "iris_scatter_matrix",
+        "election_choropleth",
+        "carshare_mapbox",
+        "wind_bar_polar",
+    ]
+    param_names = ["figure"]
+
+    def setup(self, figure):
+        self.make_figure = {
+            "gapminder_animation": lambda: px.scatter(
+                px.data.gapminder(),
+                x="gdpPercap",
+                y="lifeExp",
+                size="pop",
+                color="continent",
+                animation_frame="year",
+                animation_group="country",
+            ),
+            "tips_facets": lambda: px.scatter(
+                px.data.tips(),
+                x="total_bill",
+                y="tip",
+                color="smoker",
+                facet_row="time",
+                facet_col="day",
+                trendline="ols",
+            ),
+            "iris_scatter_matrix": lambda: px.scatter_matrix(
+                px.data.iris(), color="species"
+            ),
+            "election_choropleth": lambda: px.choropleth(
+                px.data.election(),
+                geojson=px.data.election_geojson(),
+                locations="district",
+                featureidkey="properties.district",
+                color="winner",
+                projection="mercator",
+            ),
+            "carshare_mapbox": lambda: px.scatter_mapbox(
+                px.data.carshare(),
+                lat="centroid_lat",
+                lon="centroid_lon",
+                color="peak_hour",
+                size="car_hours",
+            ),
+            "wind_bar_polar": lambda: px.bar_polar(
+                px.data.wind(), r="frequency", theta="direction", color="strength"
+            ),
+        }[figure]
+        # Datasets are read once, outside of the timings
+        self.make_figure()
+
+    def time_figure(self, figure):
+        self.make_figure()
+
+    def peakmem_figure(self, figure):
+        self.make_figure()
@@ -0,0 +1,123 @@
+"""
+Benchmarks of graph_objects figure construction, validation and updates
+"""
+import numpy as np
+
+import plotly.graph_objs as go
+import plotly.io as pio
+
+
+def _scatter_dicts(n_traces, n_points):
+    rng = np.random.RandomState(0)
+    return [
+        dict(
+            type="scatter",
+            x=np.arange(n_points),
+            y=rng.randn(n_points),
+            mode="markers",
+            marker=dict(color=rng.rand(n_points), size=8, line=dict(width=1)),
+            name="trace %d" % i,
+        )
+        for i in range(n_traces)
+    ]
+
+
+class FigureConstruction:
+    """
+    Construction of figures from dicts and from graph objects, with and
+    without validation
+    """
+
+    params = [(1, 1000000), (100, 10000), (2000, 100)]
+    param_names = ["traces_points"]
+
+    def setup(self, traces_points):
+        self.dicts = _scatter_dicts(*traces_points)
+        self.traces = [go.Scatter(d) for d in self.dicts]
+        self.layout = dict(title_text="Construction", xaxis_title_text="x")
+
+    def time_figure_from_dicts(self, traces_points):
+        go.Figure(data=self.dicts, layout=self.layout)
+
+    def time_figure_from_objects(self, traces_points):
+        go.Figure(data=self.traces, layout=self.layout)
+
+    def time_figure_without_validation(self, traces_points):
+        go.Figure(data=self.dicts, layout=self.layout, _validate=False)
+
+    def time_traces_from_dicts(self, traces_points):
+        [go.Scatter(d) for d in self.dicts]
+
+    def peakmem_figure_from_dicts(self, traces_points):
+        go.Figure(data=self.dicts, layout=self.layout)
+
+
+class FigureUpdates:
+    """
+    Updates of the traces and layout of figures of many traces
+    """
+
+    params = [10, 1000]
+    param_names = ["n_traces"]
+
+    def setup(self, n_traces):
+        self.fig = go.Figure(data=_scatter_dicts(n_traces, 100))
+        self.opacity = 0.5
+
+    def time_update_traces(self, n_traces):
+        self.opacity = 1.5 - self.opacity
+        self.fig.update_traces(
+            marker_opacity=self.opacity, selector=dict(mode="markers")
+        )
+
+    def time_update_layout(self, n_traces):
+        self.opacity = 1.5 - self.opacity
+        self.fig.update_layout(
+            xaxis=dict(range=[0, self.opacity]), legend=dict(bgcolor="white")
+        )
+
+    def time_batch_update(self, n_traces):
+        with self.fig.batch_update():
+            for trace in self.fig.data:
+                trace.marker.size = 10
+                trace.marker.size = 8
+
+    def time_property_access(self, n_traces):
+        [trace.marker.line.width for trace in self.fig.data]
+
+
+class FigureTemplates:
+    """
+    Figures with the registered templates, whose layout is validated when
+    they are applied
+    """
+
+    params = [
+        "plotly",
+        "plotly_dark",
+        "ggplot2",
+        "seaborn",
+        "none",
+        "plotly_white+presentation",
+    ]
+    param_names = ["template"]
+
+    def setup(self, template):
+        self.template = pio.templates[template]
+
+    def time_templates_getitem(self, template):
+        pio.templates[template]
+
+    def time_templates_preload(self, template):
+        pio.templates.preload(template)
+
+    def time_figure_with_template(self, template):
+        go.Figure(go.Scatter(y=[1, 3, 2]), layout=dict(template=template))
+
+    def time_update_layout_template(self, template):
+        fig = go.Figure(go.Scatter(y=[1, 3, 2]))
+        fig.update_layout(template=template)
+
+    def time_update_layout_template_object(self, template):
+        fig = go.Figure(go.Scatter(y=[1, 3, 2]))
+        fig.update_layout(template=self.template, overwrite=True)
@@ -0,0 +1,76 @@
+"""
+Benchmarks of subplot grids of make_subplots
+"""
+import plotly.graph_objs as go
+from plotly.subplots import make_subplots
+
+
+class SubplotGrids:
+    """
+    Creation of subplot grids and placement of one trace per cell
+    """
+
+    params = [(2, 2), (10, 10), (20, 20), (40, 40), (100, 100)]
+    param_names = ["grid"]
+    timeout = 300
+
+    def setup(self, grid):
+        self.rows, self.cols = grid
+        self.fig = make_subplots(rows=self.rows, cols=self.cols)
+        self.cells = [
+            (row, col)
+            for row in range(1, self.rows + 1)
+            for col in range(1, self.cols + 1)
+        ]
+
+    def time_make_subplots(self, grid):
+        make_subplots(rows=self.rows, cols=self.cols)
+
+    def time_make_subplots_shared_axes(self, grid):
+        make_subplots(
+            rows=self.rows,
+            cols=self.cols,
+            shared_xaxes=True,
+            shared_yaxes=True,
+            subplot_titles=["%d, %d" % cell for cell in self.cells],
+        )
+
+    def time_make_subplots_secondary_y(self, grid):
+        make_subplots(
+            rows=self.rows,
+            cols=self.cols,
+            specs=[[{"secondary_y": True}] * self.cols] * self.rows,
+        )
+
+    def time_add_trace_per_cell(self, grid):
+        fig = go.Figure(self.fig)
+        for row, col in self.cells:
+            fig.add_trace(go.Scatter(y=[1, 3, 2]), row=row, col=col)
+
+    def time_add_traces_rows_cols(self, grid):
+        fig = go.Figure(self.fig)
+        fig.add_traces(
+            [go.Scatter(y=[1, 3, 2]) for _ in self.cells],
+            rows=[row for row, _ in self.cells],
+            cols=[col for _, col in self.cells],
+        )
+
+    def peakmem_make_subplots(self, grid):
+        make_subplots(rows=self.rows, cols=self.cols)
+
+    def peakmem_make_subplots_shared_axes(self, grid):
+        make_subplots(
+            rows=self.rows,
+            cols=self.cols,
+            shared_xaxes=True,
+            shared_yaxes=True,
+            subplot_titles=["%d, %d" % cell for cell in self.cells],
+        )
+
+    def time_get_subplot_per_cell(self, grid):
+        for row, col in self.cells:
+            self.fig.get_subplot(row, col)
+
+    def time_update_xaxes(self, grid):
+        fig = go.Figure(self.fig)
+        fig.update_xaxes(showgrid=False, row=1)
@@ -0,0 +1,116 @@
+"""
+Benchmarks of FigureWidget update messages
+"""
+import numpy as np
+
+import plotly.graph_objs as go
+from plotly.serializers import _py_to_js
+
+
+def _prepare_comm_message(state):
+    # Same steps that ipywidgets performs before sending a state update
+    # over a comm: custom serialization followed by buffer extraction
+    from ipywidgets.widgets.widget import _remove_buffers
+
+    return _remove_buffers(_py_to_js(state, None))
+
+
+class WidgetArraySerialization:
+    """
+    Python -> JavaScript serialization of array properties
+    """
+
+    params = ([(1000, 1000), (2000, 2000)], ["float64", "int64", "uint8"])
+    param_names = ["shape", "dtype"]
+
+    def setup(self, shape, dtype):
+        rng = np.random.RandomState(0)
+        self.z = (rng.rand(*shape) * 100).astype(dtype)
+        self.restyle_msg = {"restyle_data": {"z": [self.z]}, "restyle_traces": [0]}
+
+    def time_serialize_heatmap_restyle(self, shape, dtype):
+        _prepare_comm_message(self.restyle_msg)
+
+    def peakmem_serialize_heatmap_restyle(self, shape, dtype):
+        _prepare_comm_message(self.restyle_msg)
+
+
+class WidgetUpdateLatency:
+    """
+    Python side of a FigureWidget restyle: validation, change detection and
+    preparation of the outgoing comm message
+    """
+
+    params = [(500, 500), (2000, 2000)]
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        rng = np.random.RandomState(0)
+        self.fig = go.FigureWidget(go.Heatmap(z=rng.rand(*shape)))
+        self.new_z = rng.rand(*shape)
+
+        # Message traits are reset to None right after being sent, so
+        # capture the messages as they are sent
+        self.msgs = []
+        self.fig.observe(
+            lambda change: change["new"] and self.msgs.append(change["new"]),
+            names="_py2js_restyle",
+        )
+
+    def time_heatmap_z_update(self, shape):
+        self.fig.data[0].z = self.new_z
+        _prepare_comm_message(self.msgs.pop())
+
+
+class WidgetRestyleRoundTrip:
+    """
+    Round trip of a restyle of every trace: the Python side restyle followed
+    by processing of the trace deltas that the frontend sends back
+    """
+
+    params = [100, 1000, 3000]
+    param_names = ["n_traces"]
+
+    def setup(self, n_traces):
+        self.fig = go.FigureWidget([go.Scatter(y=[1, 2, 3]) for _ in range(n_traces)])
+        self.trace_deltas = [
+            {"uid": trace.uid, "mode": "lines+markers"} for trace in self.fig.data
+        ]
+        self.opacity = 0.5
+
+    def time_restyle_all_traces(self, n_traces):
+        self.opacity = 1.5 - self.opacity
+        self.fig.plotly_restyle({"opacity": self.opacity})
+        self.fig._js2py_traceDeltas = {
+            "trace_deltas": self.trace_deltas,
+            "trace_edit_id": self.fig._last_trace_edit_id,
+        }
+
+
+class WidgetConstruction:
+    """
+    Construction of a FigureWidget from a figure, followed by the
+    serialization of its initial state
+    """
+
+    params = [(1, 1000000), (100, 10000), (2000, 100)]
+    param_names = ["traces_points"]
+    timeout = 300
+
+    def setup(self, traces_points):
+        n_traces, n_points = traces_points
+        rng = np.random.RandomState(0)
+        self.fig = go.Figure(
+            [
+                go.Scattergl(x=np.arange(n_points), y=rng.randn(n_points))
+                for _ in range(n_traces)
+            ]
+        )
+
+    def time_figure_widget(self, traces_points):
+        widget = go.FigureWidget(self.fig)
+        _prepare_comm_message({"_data": widget._data, "_layout": widget._layout})
+
+    def peakmem_figure_widget(self, traces_points):
+        widget = go.FigureWidget(self.fig)
+        _prepare_comm_message({"_data": widget._data, "_layout": widget._layout})
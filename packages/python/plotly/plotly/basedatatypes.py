@@ -179,6 +179,12 @@ class BaseFigure(object):
             # Set trace index
             trace._trace_ind = trace_ind
 
+        # ### Index trace uids ###
+        # Map from trace uid to trace index, used to look up the traces
+        # referenced by frontend messages
+        self._trace_uid_inds = {}
+        self._index_trace_uids()
+
         # Layout
         # ------
         # ### Construct layout validator ###
@@ -257,6 +263,13 @@ class BaseFigure(object):
         self._animation_duration_validator = animation.DurationValidator()
         self._animation_easing_validator = animation.EasingValidator()
 
+        # Display binding
+        # ---------------
+        # When the figure is shown by a renderer with incremental updates
+        # enabled, this is the plotly.io DisplayBinding that records the
+        # changes made to the figure since it was last displayed in full
+        self._display_binding = None
+
         # Template
         # --------
         # ### Check for default template ###
@@ -608,7 +621,7 @@ class BaseFigure(object):
                 delete_inds.append(i)
 
                 # Unparent trace object to be removed
-                old_trace = self.data[i]
+                old_trace = self._data_objs[i]
                 old_trace._orphan_props.update(deepcopy(old_trace._props))
                 old_trace._parent = None
                 old_trace._trace_ind = None
@@ -634,9 +647,8 @@ class BaseFigure(object):
         # -----------
 
         # ### Compute new index for each remaining trace ###
-        new_inds = []
-        for uid in uids_post_removal:
-            new_inds.append(new_uids.index(uid))
+        new_inds_by_uid = {uid: i for i, uid in enumerate(new_uids)}
+        new_inds = [new_inds_by_uid[uid] for uid in uids_post_removal]
 
         # ### Compute current index for each remaining trace ###
         current_inds = list(range(len(traces_props_post_removal)))
@@ -685,6 +697,8 @@ class BaseFigure(object):
         for trace_ind, trace in enumerate(self._data_objs):
             trace._trace_ind = trace_ind
 
+        self._index_trace_uids()
+
     def select_traces(self, selector=None, row=None, col=None, secondary_y=None):
         """
         Select traces from a particular subplot cell and/or traces
@@ -934,6 +948,44 @@ class BaseFigure(object):
         self.layout.update(dict1, overwrite=overwrite, **kwargs)
         return self
 
+    def _update_validated_layout(self, layout):
+        """
+        Set top-level properties of the figure's layout to plain values
+        without validating or copying them
+
+        Parameters
+        ----------
+        layout : dict
+            Valid layout properties built by the caller, e.g. the subplot
+            axes and annotations of make_subplots, as dicts and lists of
+            plain values. Each property replaces the current value of the
+            property. The values are used as is and must not be shared with
+            other figures.
+
+        Returns
+        -------
+        BaseFigure
+        """
+        layout_obj = self._layout_obj
+        for prop, val in layout.items():
+            match = layout_obj._subplot_re_match(prop)
+            if match:
+                # e.g. xaxis2, whose object is created when it is accessed
+                if int(match.group(2)) == 1:
+                    prop = match.group(1)
+                layout_obj._valid_props.add(prop)
+                layout_obj._subplotid_props.add(prop)
+            elif prop not in layout_obj._valid_props:
+                raise KeyError(prop)
+
+            # Objects of the previous values no longer reflect the layout
+            layout_obj._compound_props.pop(prop, None)
+            layout_obj._compound_array_props.pop(prop, None)
+            self._layout[prop] = val
+
+        self._send_relayout_msg(layout)
+        return self
+
     def _select_layout_subplots_by_prefix(
         self, prefix, selector=None, row=None, col=None, secondary_y=None
     ):
@@ -1213,7 +1265,7 @@ because subplot does not have a secondary y-axis"""
                 if trace_v is not Undefined:
 
                     # Get trace being updated
-                    trace_obj = self.data[trace_ind]
+                    trace_obj = self._data_objs[trace_ind]
 
                     # Validate key_path_str
                     if not BaseFigure._is_key_path_compatible(key_path_str, trace_obj):
@@ -1298,11 +1350,357 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         list[int]
         """
         if trace_indexes is None:
-            trace_indexes = list(range(len(self.data)))
+            trace_indexes = list(range(len(self._data)))
         if not isinstance(trace_indexes, (list, tuple)):
             trace_indexes = [trace_indexes]
         return list(trace_indexes)
 
+    def _index_trace_uids(self, start=0):
+        """
+        Update the map from trace uid to trace index
+
+        Parameters
+        ----------
+        start : int
+            Index of the first trace to update. Traces before this index
+            are assumed to be indexed already. If 0, the map is rebuilt.
+
+        Returns
+        -------
+        None
+        """
+        if start == 0:
+            self._trace_uid_inds = {}
+
+        for trace_ind in range(start, len(self._data)):
+            uid = self._get_trace_uid(trace_ind)
+            if uid is not None:
+                self._trace_uid_inds[uid] = trace_ind
+
+    def _get_trace_uid(self, trace_ind):
+        """
+        Return the uid of the trace at index trace_ind, or None if the
+        trace has no uid
+        """
+        uid = self._data[trace_ind].get("uid", None)
+        if uid is None and trace_ind < len(self._data_defaults):
+            uid = self._data_defaults[trace_ind].get("uid", None)
+        return uid
+
+    def _get_trace_index_by_uid(self, uid):
+        """
+        Return the index of the trace with the specified uid
+
+        Parameters
+        ----------
+        uid : str
+            Trace uid
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        ValueError
+            If the figure has no trace with the specified uid
+        """
+        trace_ind = self._trace_uid_inds.get(uid, None)
+        if (
+            trace_ind is None
+            or trace_ind >= len(self._data)
+            or self._get_trace_uid(trace_ind) != uid
+        ):
+            # The uid was assigned after the trace was indexed (e.g. by
+            # setting the trace's uid property), rebuild the map
+            self._index_trace_uids()
+            trace_ind = self._trace_uid_inds.get(uid, None)
+            if trace_ind is None:
+                raise ValueError("No trace with uid {uid}".format(uid=repr(uid)))
+
+        return trace_ind
+
+    # Extend / prepend traces
+    # -----------------------
+    def extend_traces(self, data, trace_indexes=None, max_points=None):
+        """
+        Append new points to array properties of the figure's traces
+
+        Only the new points are validated, and for FigureWidget instances
+        only the new points are sent to the frontend where they are applied
+        using Plotly.extendTraces. This makes extend_traces well suited for
+        streaming data into a figure.
+
+        Parameters
+        ----------
+        data : dict
+            Dict of new points.
+
+            Keys are strings that specify the array properties to be
+            extended (e.g. 'x' or 'marker.color'). Values are lists
+            containing one array of new points for each of the traces
+            specified by the `trace_indexes` parameter.
+        trace_indexes : int or list of int
+            Trace index, or list of trace indexes, that the new points
+            belong to. Defaults to all trace indexes.
+        max_points : int or dict or None
+            Maximum number of points to keep in each extended array. The
+            oldest points are discarded first. May be a dict from the keys
+            of `data` to integers to specify a separate limit for each
+            property, where keys that are left out have no limit. Defaults
+            to no limit.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> import plotly.graph_objects as go
+        >>> fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+        >>> fig.extend_traces({'x': [[3, 4]], 'y': [[5, 6]]}, 0, max_points=3)
+        >>> fig.data[0].x
+        (2, 3, 4)
+        """
+        self._perform_extend_traces(data, trace_indexes, max_points, prepend=False)
+
+    def prepend_traces(self, data, trace_indexes=None, max_points=None):
+        """
+        Prepend new points to array properties of the figure's traces
+
+        Only the new points are validated, and for FigureWidget instances
+        only the new points are sent to the frontend where they are applied
+        using Plotly.prependTraces.
+
+        Parameters
+        ----------
+        data : dict
+            Dict of new points.
+
+            Keys are strings that specify the array properties to be
+            prepended to (e.g. 'x' or 'marker.color'). Values are lists
+            containing one array of new points for each of the traces
+            specified by the `trace_indexes` parameter.
+        trace_indexes : int or list of int
+            Trace index, or list of trace indexes, that the new points
+            belong to. Defaults to all trace indexes.
+        max_points : int or dict or None
+            Maximum number of points to keep in each array. The points at
+            the end of the arrays are discarded first. May be a dict from the
+            keys of `data` to integers to specify a separate limit for each
+            property, where keys that are left out have no limit. Defaults
+            to no limit.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> import plotly.graph_objects as go
+        >>> fig = go.Figure(go.Scatter(x=[3, 4], y=[5, 6]))
+        >>> fig.prepend_traces({'x': [[1, 2]], 'y': [[3, 4]]}, 0)
+        >>> fig.data[0].x
+        (1, 2, 3, 4)
+        """
+        self._perform_extend_traces(data, trace_indexes, max_points, prepend=True)
+
+    def _perform_extend_traces(self, data, trace_indexes, max_points, prepend):
+        """
+        Add new points to the figure's trace data, then send the
+        extendTraces / prependTraces message and dispatch change callbacks
+
+        Parameters
+        ----------
+        data : dict[str, list]
+            See docstring for extend_traces
+        trace_indexes : None or int or list[int]
+            See docstring for extend_traces
+        max_points : None or int or dict[str, int]
+            See docstring for extend_traces
+        prepend : bool
+            Whether to prepend (True) or append (False) the new points
+
+        Returns
+        -------
+        None
+        """
+        # Validate inputs
+        # ---------------
+        if not isinstance(data, dict):
+            raise TypeError(
+                "The data argument must be a dict, received value of type {typ}".format(
+                    typ=type(data)
+                )
+            )
+
+        trace_indexes = self._normalize_trace_indexes(trace_indexes)
+        for trace_ind in trace_indexes:
+            if trace_ind >= len(self._data):
+                raise ValueError(
+                    "Trace index {trace_ind} out of range".format(trace_ind=trace_ind)
+                )
+
+        # Add new points to trace data
+        # ----------------------------
+        # new_data holds the validated new points that are sent to the
+        # frontend
+        new_data = {}
+        for key_path_str, vals in data.items():
+            if not isinstance(vals, (list, tuple)) or len(vals) != len(trace_indexes):
+                raise ValueError(
+                    """
+The value for '{key_path_str}' must be a list containing one array of new
+points for each of the {n} specified trace(s)""".format(
+                        key_path_str=key_path_str, n=len(trace_indexes)
+                    )
+                )
+
+            key_max_points = (
+                max_points.get(key_path_str)
+                if isinstance(max_points, dict)
+                else max_points
+            )
+            if key_max_points is not None and (
+                not isinstance(key_max_points, six.integer_types) or key_max_points < 0
+            ):
+                raise ValueError(
+                    "max_points must be a non-negative integer, "
+                    "received {val}".format(val=repr(key_max_points))
+                )
+
+            new_vals = []
+            for trace_ind, new_points in zip(trace_indexes, vals):
+                trace_obj = self._data_objs[trace_ind]
+                if not BaseFigure._is_key_path_compatible(key_path_str, trace_obj):
+                    raise ValueError(
+                        """
+Invalid property path '{key_path_str}' for trace class {trace_class}
+""".format(
+                            key_path_str=key_path_str,
+                            trace_class=trace_obj.__class__.__name__,
+                        )
+                    )
+
+                # Validate only the new points
+                validator = trace_obj._get_prop_validator(key_path_str)
+                new_points = validator.validate_coerce(new_points)
+                if not BaseFigure._is_point_array(new_points):
+                    raise ValueError(
+                        """
+Property '{key_path_str}' of trace class {trace_class} is not an array property""".format(
+                            key_path_str=key_path_str,
+                            trace_class=trace_obj.__class__.__name__,
+                        )
+                    )
+
+                BaseFigure._extend_in(
+                    self._data[trace_ind],
+                    key_path_str,
+                    new_points,
+                    key_max_points,
+                    prepend,
+                )
+                new_vals.append(new_points)
+
+            new_data[key_path_str] = new_vals
+
+        if not new_data:
+            return
+
+        # Send message and dispatch callbacks
+        # -----------------------------------
+        if prepend:
+            self._send_prependTraces_msg(new_data, trace_indexes, max_points)
+        else:
+            self._send_extendTraces_msg(new_data, trace_indexes, max_points)
+
+        self._dispatch_trace_change_callbacks(new_data, trace_indexes)
+
+    @staticmethod
+    def _is_point_array(v):
+        """
+        Return whether a validated property value is an array of points
+        """
+        np = get_module("numpy", should_load=False)
+        return isinstance(v, (list, tuple)) or (
+            np is not None and isinstance(v, np.ndarray) and v.ndim > 0
+        )
+
+    @staticmethod
+    def _extend_in(d, key_path_str, new_points, max_points, prepend):
+        """
+        Add new points to an array in a nested dict using a key path string
+        (e.g. 'marker.color')
+
+        Lists are extended in place so that only the new points are
+        copied. numpy arrays are concatenated into a new read-only array.
+
+        Parameters
+        ----------
+        d : dict
+            Input dict containing the array to extend
+        key_path_str : str
+            Key path string, where nested keys are joined on '.' characters
+        new_points : list or numpy.ndarray
+            Validated new points
+        max_points : int or None
+            Maximum number of points to keep
+        prepend : bool
+            Whether to prepend (True) or append (False) the new points
+
+        Returns
+        -------
+        None
+        """
+        # Find parent dict, creating intermediate dicts as needed
+        key_path = BaseFigure._str_to_dict_path(key_path_str)
+        parent = d
+        for key_path_el in key_path[:-1]:
+            if isinstance(parent, dict) and key_path_el not in parent:
+                parent[key_path_el] = {}
+            parent = parent[key_path_el]
+
+        last_key = key_path[-1]
+        current = parent.get(last_key, None)
+
+        np = get_module("numpy", should_load=False)
+        if current is None:
+            combined = (
+                list(new_points)
+                if isinstance(new_points, (list, tuple))
+                else new_points
+            )
+        elif np is not None and (
+            isinstance(current, np.ndarray) or isinstance(new_points, np.ndarray)
+        ):
+            parts = [new_points, current] if prepend else [current, new_points]
+            combined = np.concatenate([np.asarray(part) for part in parts])
+        else:
+            combined = current if isinstance(current, list) else list(current)
+            if prepend:
+                combined[0:0] = new_points
+            else:
+                combined.extend(new_points)
+
+        # Enforce max_points
+        if max_points is not None and len(combined) > max_points:
+            num_remove = len(combined) - max_points
+            if isinstance(combined, list):
+                if prepend:
+                    del combined[max_points:]
+                else:
+                    del combined[:num_remove]
+            elif prepend:
+                combined = combined[:max_points]
+            else:
+                combined = combined[num_remove:]
+
+        if np is not None and isinstance(combined, np.ndarray):
+            combined.flags["WRITEABLE"] = False
+
+        parent[last_key] = combined
+
     @staticmethod
     def _str_to_dict_path(key_path_str):
         """
@@ -1682,8 +2080,9 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         data = self._data_validator.validate_coerce(data)
 
         # Set trace indexes
+        num_traces = len(self._data)
         for ind, new_trace in enumerate(data):
-            new_trace._trace_ind = ind + len(self.data)
+            new_trace._trace_ind = ind + num_traces
 
         # Validate rows / cols
         n = len(data)
@@ -1715,22 +2114,76 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
 
         # Apply rows / cols
         if rows is not None:
+            from plotly.subplots import _set_trace_grid_reference
+
+            grid_ref = self._validate_get_grid_ref()
             for trace, row, col, secondary_y in zip(data, rows, cols, secondary_ys):
-                self._set_trace_grid_position(trace, row, col, secondary_y)
+                _set_trace_grid_reference(
+                    trace, self._layout_obj, grid_ref, row, col, secondary_y
+                )
 
-        # Make deep copy of trace data (Optimize later if needed)
-        new_traces_data = [deepcopy(trace._props) for trace in data]
+        # The validated traces are new objects, so their properties are moved
+        # into the figure without copying them
+        new_traces_data = [trace._props for trace in data]
 
         # Update trace parent
         for trace in data:
             trace._parent = self
-            trace._orphan_props.clear()
+            trace._orphan_props = {}
 
         # Update python side
         #  Use extend instead of assignment so we don't trigger serialization
         self._data.extend(new_traces_data)
-        self._data_defaults = self._data_defaults + [{} for _ in data]
+        self._data_defaults.extend({} for _ in data)
+        self._data_objs = self._data_objs + data
+        self._index_trace_uids(start=num_traces)
+
+        # Update messages
+        self._send_addTraces_msg(new_traces_data)
+
+        return self
+
+    def _add_validated_traces(self, data):
+        """
+        Add trace objects to the figure without validating or copying them
+        again
+
+        Parameters
+        ----------
+        data : list[BaseTraceType]
+            Validated traces without parents, e.g. built by plotly express.
+            The traces are used as is and must not be shared with other
+            figures or frames.
+
+        Returns
+        -------
+        BaseFigure
+        """
+        data = list(data)
+
+        # Set new UIDs, like the data validator
+        if self._data_validator.set_uid:
+            import uuid
+
+            for trace in data:
+                trace.uid = str(uuid.uuid4())
+
+        # Set trace indexes
+        num_traces = len(self._data)
+        for ind, new_trace in enumerate(data):
+            new_trace._trace_ind = ind + num_traces
+
+        # Move the properties of the traces into the figure
+        new_traces_data = [trace._props for trace in data]
+        for trace in data:
+            trace._parent = self
+            trace._orphan_props = {}
+
+        # Update python side
+        self._data.extend(new_traces_data)
+        self._data_defaults.extend({} for _ in data)
         self._data_objs = self._data_objs + data
+        self._index_trace_uids(start=num_traces)
 
         # Update messages
         self._send_addTraces_msg(new_traces_data)
@@ -1799,7 +2252,7 @@ Please use the add_trace method with the row and col parameters.
 
         grid_ref = self._validate_get_grid_ref()
         return _set_trace_grid_reference(
-            trace, self.layout, grid_ref, row, col, secondary_y
+            trace, self._layout_obj, grid_ref, row, col, secondary_y
         )
 
     def _validate_get_grid_ref(self):
@@ -2265,7 +2718,7 @@ Invalid property path '{key_path_str}' for layout
         # ---------------------------------------------
         for path_tuple, changed_paths in dispatch_plan.items():
             for trace_ind in trace_indexes:
-                trace = self.data[trace_ind]
+                trace = self._data_objs[trace_ind]
                 if path_tuple in trace:
                     dispatch_obj = trace[path_tuple]
                     if isinstance(dispatch_obj, BasePlotlyType):
@@ -2293,6 +2746,20 @@ Invalid property path '{key_path_str}' for layout
         # Validate frames
         self._frame_objs = self._frames_validator.validate_coerce(new_frames)
 
+    def _set_validated_frames(self, frames):
+        """
+        Set the figure's frames to Frame objects without validating or
+        copying them again
+
+        Parameters
+        ----------
+        frames : list[plotly.graph_objs.Frame]
+            Frames built by the caller, e.g. by plotly express, from
+            validated traces. The frames are used as is and must not be
+            shared with other figures.
+        """
+        self._frame_objs = list(frames)
+
     # Update
     # ------
     def plotly_update(
@@ -2402,31 +2869,77 @@ Invalid property path '{key_path_str}' for layout
 
     # Plotly message stubs
     # --------------------
-    # send-message stubs that may be overridden by the widget subclass
+    # send-message stubs that may be overridden by the widget subclass.
+    # For non-widget figures they only record changes for incremental
+    # display updates.
     def _send_addTraces_msg(self, new_traces_data):
-        pass
+        num_traces = len(self._data)
+        self._record_display_change(
+            trace_indexes=range(num_traces - len(new_traces_data), num_traces)
+        )
 
     def _send_moveTraces_msg(self, current_inds, new_inds):
-        pass
+        self._record_display_change(restructured=True)
 
     def _send_deleteTraces_msg(self, delete_inds):
-        pass
+        self._record_display_change(restructured=True)
 
     def _send_restyle_msg(self, style, trace_indexes=None, source_view_id=None):
-        pass
+        self._record_display_change(trace_indexes=trace_indexes)
 
     def _send_relayout_msg(self, layout, source_view_id=None):
-        pass
+        self._record_display_change(layout=True)
+
+    def _send_extendTraces_msg(self, extend_data, trace_indexes, max_points=None):
+        self._record_display_change(trace_indexes=trace_indexes)
+
+    def _send_prependTraces_msg(self, prepend_data, trace_indexes, max_points=None):
+        self._record_display_change(trace_indexes=trace_indexes)
 
     def _send_update_msg(
         self, restyle_data, relayout_data, trace_indexes=None, source_view_id=None
     ):
-        pass
+        if restyle_data:
+            self._record_display_change(trace_indexes=trace_indexes)
+        if relayout_data:
+            self._record_display_change(layout=True)
 
     def _send_animate_msg(
         self, styles_data, relayout_data, trace_indexes, animation_opts
     ):
-        pass
+        if styles_data:
+            self._record_display_change(trace_indexes=trace_indexes)
+        if relayout_data:
+            self._record_display_change(layout=True)
+
+    def _record_display_change(
+        self, trace_indexes=(), layout=False, restructured=False
+    ):
+        """
+        Record a change in the display binding of the figure, if any
+
+        Parameters
+        ----------
+        trace_indexes : None or int or iterable of int
+            Indexes of the traces that changed. None means all traces.
+        layout : bool
+            Whether the layout changed
+        restructured : bool
+            Whether traces were deleted or reordered
+
+        Returns
+        -------
+        None
+        """
+        if self._display_binding is None:
+            return
+
+        if trace_indexes is None or isinstance(trace_indexes, int):
+            trace_indexes = self._normalize_trace_indexes(trace_indexes)
+
+        self._display_binding.record_change(
+            trace_indexes=trace_indexes, layout=layout, restructured=restructured
+        )
 
     # Context managers
     # ----------------
@@ -4430,6 +4943,29 @@ class BasePlotlyType(object):
         self._compound_array_props[prop] = val
         return val
 
+    def _adopt_array_prop(self, prop, objs):
+        """
+        Set a compound array property to objects without parents, without
+        validating or copying them again
+
+        The properties of the objects are moved into this object's properties
+        dict, and the objects become children of this object.
+
+        Parameters
+        ----------
+        prop : str
+            Name of a compound array property, e.g. the data of a frame
+        objs : list[BasePlotlyType]
+            Validated objects without parents, e.g. traces built by plotly
+            express
+        """
+        self._init_props()
+        self._props[prop] = [obj._props for obj in objs]
+        for obj in objs:
+            obj._orphan_props = {}
+            obj._parent = self
+        self._compound_array_props[prop] = list(objs)
+
     def _send_prop_set(self, prop_path_str, val):
         """
         Notify parent that a property has been set to a new value
@@ -4866,8 +5402,8 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         """
         prop = self._strip_subplot_suffix_of_1(prop)
         if prop != "_subplotid_props" and prop in self._subplotid_props:
-            validator = self._get_validator(prop)
-            return validator.present(self._compound_props[prop])
+            # The subplot object is created on first access if needed
+            return self[prop]
         else:
             return super(BaseLayoutHierarchyType, self).__getattribute__(prop)
 
@@ -1,4 +1,5 @@
 import uuid
+from collections import OrderedDict
 from importlib import import_module
 import os
 import numbers
@@ -8,10 +9,13 @@ try:
 except ImportError:
     from urlparse import urlparse as parse
 
+import six
 import ipywidgets as widgets
 from traitlets import List, Unicode, Dict, observe, Integer
 from .basedatatypes import BaseFigure, BasePlotlyType
 from .callbacks import BoxSelector, LassoSelector, InputDeviceState, Points
+from .optional_imports import get_module
+from _plotly_utils.basevalidators import copy_to_readonly_numpy_array
 from .serializers import custom_serializers
 from .version import __frontend_version__
 
@@ -62,6 +66,8 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
     _py2js_relayout = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_update = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_animate = Dict(allow_none=True).tag(sync=True, **custom_serializers)
+    _py2js_extendTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
+    _py2js_prependTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
 
     _py2js_deleteTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_moveTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
@@ -160,6 +166,202 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # views of this widget
         self._view_count = 0
 
+        # Event coalescing
+        # ----------------
+        # Relayout and restyle events from the frontend that are waiting to
+        # be processed. See event_coalescing_window.
+        #
+        # Layout and trace deltas are not coalesced. Only the delta of the
+        # most recent edit is applied, and there is one edit per processed
+        # event, so coalescing the events already reduces the deltas.
+        # Deferring them would keep edits marked as in process and delay
+        # waiting edit callbacks.
+        self._event_coalescing_window = None
+        self._js2py_pending_events = []
+        self._js2py_flush_scheduled = False
+
+        # Incremented on every flush, so that a scheduled flush of a window
+        # that was already flushed doesn't flush the next window early
+        self._js2py_flush_generation = 0
+
+        # Resampling
+        # ----------
+        # Resampling state, None if resampling is not enabled. See
+        # enable_resampling
+        self._resampling = None
+
+    # Event coalescing
+    # ----------------
+    @property
+    def event_coalescing_window(self):
+        """
+        Time window, in seconds, over which relayout and restyle events
+        from the frontend are coalesced
+
+        Interactions like panning and zooming produce a rapid stream of
+        relayout events. When a window is set, the events received within
+        the window are merged and processed once at the end of the window,
+        so that change callbacks registered with `on_change` are called at
+        most once per window. If None or 0 (the default), events are
+        processed as soon as they are received.
+
+        Coalescing requires a running event loop, as is the case in a
+        Jupyter kernel. Without one, events are processed immediately.
+
+        Returns
+        -------
+        float or None
+        """
+        return self._event_coalescing_window
+
+    @event_coalescing_window.setter
+    def event_coalescing_window(self, val):
+        if val is not None and (
+            not isinstance(val, numbers.Number) or isinstance(val, bool) or val < 0
+        ):
+            raise ValueError(
+                "The event_coalescing_window property must be None or a "
+                "non-negative number of seconds.\n"
+                "    Received value: {val}".format(val=repr(val))
+            )
+
+        self._event_coalescing_window = val
+
+        if not val:
+            # Process any events that were waiting on the previous window
+            self._flush_js2py_events()
+
+    def _queue_js2py_event(self, method, data, trace_indexes, source_view_id):
+        """
+        Process a relayout or restyle event from the frontend, coalescing it
+        with other events received within the event_coalescing_window
+
+        Parameters
+        ----------
+        method : str
+            Either 'relayout' or 'restyle'
+        data : dict
+            Relayout or restyle data
+        trace_indexes : list[int] or None
+            Trace indexes of a restyle event, None for relayout events
+        source_view_id : str
+            UID of view that triggered the event
+
+        Returns
+        -------
+        None
+        """
+        window = self._event_coalescing_window
+        if window and not self._js2py_flush_scheduled:
+            generation = self._js2py_flush_generation
+            self._js2py_flush_scheduled = self._call_later(
+                window, lambda: self._flush_js2py_events(generation)
+            )
+
+        if not self._js2py_flush_scheduled:
+            # Coalescing disabled, or no event loop available
+            self._apply_js2py_event(method, data, trace_indexes, source_view_id)
+            return
+
+        pending = self._js2py_pending_events
+        event_key = (method, trace_indexes, source_view_id)
+        if pending and pending[-1][0] == event_key:
+            # Merge into the previous event. Keys are moved to the end so
+            # that the merged event applies the most recent value of each
+            # key in the order they were last set
+            merged_data = pending[-1][1]
+            for key, val in data.items():
+                merged_data.pop(key, None)
+                merged_data[key] = val
+        else:
+            pending.append((event_key, OrderedDict(data)))
+
+    def _flush_js2py_events(self, generation=None):
+        """
+        Process all pending relayout and restyle events from the frontend
+
+        Parameters
+        ----------
+        generation : int or None
+            Flush generation that a scheduled flush was scheduled in. The
+            flush is skipped if the events were flushed since then. If None,
+            the events are flushed unconditionally
+
+        Returns
+        -------
+        None
+        """
+        if generation is not None and generation != self._js2py_flush_generation:
+            return
+
+        self._js2py_flush_generation += 1
+        self._js2py_flush_scheduled = False
+        pending = self._js2py_pending_events
+        self._js2py_pending_events = []
+
+        for (method, trace_indexes, source_view_id), data in pending:
+            self._apply_js2py_event(method, data, trace_indexes, source_view_id)
+
+    def _apply_js2py_event(self, method, data, trace_indexes, source_view_id):
+        """
+        Apply a relayout or restyle event from the frontend to the figure
+        """
+        if method == "relayout":
+            self.plotly_relayout(relayout_data=data, source_view_id=source_view_id)
+        else:
+            self.plotly_restyle(
+                restyle_data=data,
+                trace_indexes=trace_indexes,
+                source_view_id=source_view_id,
+            )
+
+    @staticmethod
+    def _call_later(delay, callback):
+        """
+        Schedule a callback on the running event loop
+
+        Parameters
+        ----------
+        delay : float
+            Delay in seconds
+        callback : callable
+            Function of zero arguments
+
+        Returns
+        -------
+        bool
+            True if the callback was scheduled, False if there is no
+            running event loop
+        """
+        # Python 3 kernels run on an asyncio event loop
+        asyncio = get_module("asyncio")
+        if asyncio is not None:
+            try:
+                if hasattr(asyncio, "get_running_loop"):
+                    loop = asyncio.get_running_loop()
+                else:
+                    loop = asyncio.get_event_loop()
+            except RuntimeError:
+                loop = None
+
+            if loop is not None and loop.is_running():
+                loop.call_later(delay, callback)
+                return True
+
+            # tornado's IOLoop runs on asyncio, and may be current without
+            # running, so there is no running event loop
+            return False
+
+        # Python 2 kernels run on the tornado IOLoop
+        tornado_ioloop = get_module("tornado.ioloop")
+        if tornado_ioloop is not None:
+            loop = tornado_ioloop.IOLoop.current(instance=False)
+            if loop is not None:
+                loop.call_later(delay, callback)
+                return True
+
+        return False
+
     # Python -> JavaScript Messages
     # -----------------------------
     def _send_relayout_msg(self, layout_data, source_view_id=None):
@@ -240,6 +442,120 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         self._py2js_restyle = restyle_msg
         self._py2js_restyle = None
 
+    def _send_extendTraces_msg(self, extend_data, trace_indexes, max_points=None):
+        """
+        Send Plotly.extendTraces message to the frontend
+
+        Parameters
+        ----------
+        extend_data : dict
+            Dict from property path strings to lists of new points arrays,
+            one per trace index
+        trace_indexes : list[int]
+            List of trace indexes that the new points belong to
+        max_points : int or dict or None
+            Maximum number of points to keep in each extended array
+        """
+        trace_edit_id, layout_edit_id = self._next_trace_layout_edit_ids()
+
+        # Build message
+        # -------------
+        extend_msg = {
+            "extend_data": extend_data,
+            "extend_traces": trace_indexes,
+            "max_points": self._max_points_msg(extend_data, trace_indexes, max_points),
+            "trace_edit_id": trace_edit_id,
+            "layout_edit_id": layout_edit_id,
+        }
+
+        # Send message
+        # ------------
+        self._py2js_extendTraces = extend_msg
+        self._py2js_extendTraces = None
+
+    def _send_prependTraces_msg(self, prepend_data, trace_indexes, max_points=None):
+        """
+        Send Plotly.prependTraces message to the frontend
+
+        Parameters
+        ----------
+        prepend_data : dict
+            Dict from property path strings to lists of new points arrays,
+            one per trace index
+        trace_indexes : list[int]
+            List of trace indexes that the new points belong to
+        max_points : int or dict or None
+            Maximum number of points to keep in each prepended array
+        """
+        trace_edit_id, layout_edit_id = self._next_trace_layout_edit_ids()
+
+        # Build message
+        # -------------
+        prepend_msg = {
+            "prepend_data": prepend_data,
+            "prepend_traces": trace_indexes,
+            "max_points": self._max_points_msg(prepend_data, trace_indexes, max_points),
+            "trace_edit_id": trace_edit_id,
+            "layout_edit_id": layout_edit_id,
+        }
+
+        # Send message
+        # ------------
+        self._py2js_prependTraces = prepend_msg
+        self._py2js_prependTraces = None
+
+    @staticmethod
+    def _max_points_msg(update_data, trace_indexes, max_points):
+        """
+        Convert max_points to the form that Plotly.extendTraces and
+        Plotly.prependTraces accept
+
+        Plotly.js requires a max_points object to map every key of the update
+        data to an array with one entry per trace index, so a dict is
+        expanded to that form with None (unbounded) for missing keys
+
+        Parameters
+        ----------
+        update_data : dict
+            Dict from property path strings to lists of new points arrays
+        trace_indexes : list[int]
+            List of trace indexes that the new points belong to
+        max_points : int or dict or None
+            Maximum number of points to keep in each array, per key if a
+            dict
+
+        Returns
+        -------
+        int or dict or None
+        """
+        if not isinstance(max_points, dict):
+            return max_points
+
+        return {
+            key_path_str: [max_points.get(key_path_str)] * len(trace_indexes)
+            for key_path_str in update_data
+        }
+
+    def _next_trace_layout_edit_ids(self):
+        """
+        Increment the trace and layout edit message IDs and mark both
+        edits as in process
+
+        Returns
+        -------
+        (int, int)
+            The new trace edit ID and layout edit ID
+        """
+        layout_edit_id = self._last_layout_edit_id + 1
+        self._last_layout_edit_id = layout_edit_id
+        self._layout_edit_in_process = True
+
+        trace_edit_id = self._last_trace_edit_id + 1
+        self._last_trace_edit_id = trace_edit_id
+        self._trace_edit_in_process = True
+
+        return trace_edit_id, layout_edit_id
+
     def _send_addTraces_msg(self, new_traces_data):
         """
         Send Plotly.addTraces message to the frontend
@@ -455,10 +771,8 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             for delta in trace_deltas:
 
                 # #### Find existing trace for uid ###
-                trace_uid = delta["uid"]
-                trace_uids = [trace.uid for trace in self.data]
-                trace_index = trace_uids.index(trace_uid)
-                uid_trace = self.data[trace_index]
+                trace_index = self._get_trace_index_by_uid(delta["uid"])
+                uid_trace = self._data_objs[trace_index]
 
                 # #### Transform defaults to delta ####
                 delta_transform = BaseFigureWidget._transform_data(
@@ -573,16 +887,12 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             return
 
         style_data = restyle_msg["style_data"]
-        style_traces = restyle_msg["style_traces"]
+        style_traces = self._normalize_trace_indexes(restyle_msg["style_traces"])
         source_view_id = restyle_msg["source_view_id"]
 
         # Perform restyle
         # ---------------
-        self.plotly_restyle(
-            restyle_data=style_data,
-            trace_indexes=style_traces,
-            source_view_id=source_view_id,
-        )
+        self._queue_js2py_event("restyle", style_data, style_traces, source_view_id)
 
         self._js2py_restyle = None
 
@@ -607,6 +917,8 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
 
         # Perform update
         # --------------
+        # Process pending events first to preserve the order of operations
+        self._flush_js2py_events()
         self.plotly_update(
             restyle_data=style,
             relayout_data=layout,
@@ -641,7 +953,7 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
 
         # Perform relayout
         # ----------------
-        self.plotly_relayout(relayout_data=relayout_data, source_view_id=source_view_id)
+        self._queue_js2py_event("relayout", relayout_data, None, source_view_id)
 
         self._js2py_relayout = None
 
@@ -686,37 +998,55 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         else:
             state = None
 
-        # Build Trace Points Dictionary
-        # -----------------------------
-        points_data = callback_data["points"]
-        trace_points = {
-            trace_ind: {
-                "point_inds": [],
-                "xs": [],
-                "ys": [],
-                "trace_name": self._data_objs[trace_ind].name,
-                "trace_index": trace_ind,
-            }
-            for trace_ind in range(len(self._data_objs))
-        }
-
-        for x, y, point_ind, trace_ind in zip(
-            points_data["xs"],
-            points_data["ys"],
-            points_data["point_indexes"],
-            points_data["trace_indexes"],
-        ):
-
-            trace_dict = trace_points[trace_ind]
-            trace_dict["xs"].append(x)
-            trace_dict["ys"].append(y)
-            trace_dict["point_inds"].append(point_ind)
+        # Group points by trace
+        # ---------------------
+        # Only traces that contain points are included
+        trace_points = self._group_points_by_trace(callback_data["points"])
+
+        # Clear selections of other traces
+        # --------------------------------
+        # Selection events update the selectedpoints property of every
+        # trace. Traces without points are updated with a single restyle
+        # operation rather than one restyle per trace
+        if event_type in ("plotly_selected", "plotly_deselect"):
+            cleared_val = [] if event_type == "plotly_selected" else None
+            cleared_inds = [
+                trace_ind
+                for trace_ind, trace in enumerate(self._data_objs)
+                if trace_ind not in trace_points
+                and "selectedpoints" in trace
+                and not BasePlotlyType._vals_equal(
+                    self._data[trace_ind].get("selectedpoints", None), cleared_val
+                )
+            ]
+            if cleared_inds:
+                self.plotly_restyle(
+                    {"selectedpoints": [cleared_val]}, trace_indexes=cleared_inds
+                )
 
         # Dispatch callbacks
         # ------------------
-        for trace_ind, trace_points_data in trace_points.items():
-            points = Points(**trace_points_data)
-            trace = self.data[trace_ind]
+        # Traces without points are only visited if they have callbacks
+        # registered for this event type
+        callbacks_attr = {
+            "plotly_click": "_click_callbacks",
+            "plotly_hover": "_hover_callbacks",
+            "plotly_unhover": "_unhover_callbacks",
+            "plotly_selected": "_select_callbacks",
+            "plotly_deselect": "_deselect_callbacks",
+        }.get(event_type, None)
+
+        for trace_ind, trace in enumerate(self._data_objs):
+            if trace_ind in trace_points:
+                points = Points(
+                    trace_name=trace.name,
+                    trace_index=trace_ind,
+                    **trace_points[trace_ind]
+                )
+            elif callbacks_attr and getattr(trace, callbacks_attr):
+                points = Points(trace_name=trace.name, trace_index=trace_ind)
+            else:
+                continue
 
             if event_type == "plotly_click":
                 trace._dispatch_on_click(points, state)
@@ -731,6 +1061,491 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
 
         self._js2py_pointsCallback = None
 
+    @staticmethod
+    def _group_points_by_trace(points_data):
+        """
+        Group the points of a points callback message by trace
+
+        Parameters
+        ----------
+        points_data : dict
+            Points object from a points callback message, with
+            'trace_indexes', 'point_indexes', 'xs' and 'ys' arrays
+
+        Returns
+        -------
+        dict[int, dict]
+            Dict from the index of each trace that contains points to a dict
+            with 'point_inds', 'xs' and 'ys' arrays of the trace's points
+        """
+        trace_indexes = points_data["trace_indexes"]
+        point_indexes = points_data["point_indexes"]
+        xs = points_data["xs"]
+        ys = points_data["ys"]
+
+        if len(trace_indexes) == 0:
+            return {}
+
+        np = get_module("numpy")
+        if np is None:
+            trace_points = {}
+            for x, y, point_ind, trace_ind in zip(xs, ys, point_indexes, trace_indexes):
+                trace_dict = trace_points.setdefault(
+                    trace_ind, {"point_inds": [], "xs": [], "ys": []}
+                )
+                trace_dict["xs"].append(x)
+                trace_dict["ys"].append(y)
+                trace_dict["point_inds"].append(point_ind)
+            return trace_points
+
+        trace_indexes = np.asarray(trace_indexes)
+        arrays = [
+            v if isinstance(v, np.ndarray) else copy_to_readonly_numpy_array(v)
+            for v in (point_indexes, xs, ys)
+        ]
+
+        # Points usually arrive ordered by trace. Otherwise, stable sort to
+        # keep the order of points within each trace
+        if np.all(trace_indexes[:-1] <= trace_indexes[1:]):
+            sorted_traces = trace_indexes
+        else:
+            order = np.argsort(trace_indexes, kind="mergesort")
+            sorted_traces = trace_indexes[order]
+            arrays = [v[order] for v in arrays]
+
+        unique_traces, starts = np.unique(sorted_traces, return_index=True)
+        stops = np.append(starts[1:], len(sorted_traces))
+
+        return {
+            int(trace_ind): {
+                "point_inds": arrays[0][start:stop],
+                "xs": arrays[1][start:stop],
+                "ys": arrays[2][start:stop],
+            }
+            for trace_ind, start, stop in zip(unique_traces, starts, stops)
+        }
+
+    # Resampling
+    # ----------
+    # Per-point array properties that are resampled along with x and y
+    _resampled_props = (
+        "x",
+        "y",
+        "text",
+        "hovertext",
+        "customdata",
+        "ids",
+        "marker.color",
+        "marker.size",
+        "marker.symbol",
+        "marker.opacity",
+    )
+
+    def enable_resampling(self, max_points=1000, method="minmax"):
+        """
+        Enable the resampling mode of the figure
+
+        In resampling mode, traces with more than `max_points` points keep
+        their full resolution data in Python, and only a downsampled view
+        of the points in the visible x-axis range is sent to the frontend.
+        The view is updated whenever the x-axis range changes (e.g. when the
+        user zooms or pans), so that zooming in reveals the data at full
+        detail.
+
+        Resampling applies to traces with `x` and `y` properties (e.g.
+        scatter and scattergl traces) whose x values are sorted numbers or
+        dates. It applies to the figure's current traces and to the traces
+        that are added afterwards. Add very large traces after enabling
+        resampling so that their full resolution data is never sent to
+        the frontend.
+
+        Note that the `x`, `y` and other per-point properties of a resampled
+        trace (e.g. `trace.x`) hold the downsampled view that is displayed,
+        not the full resolution data, because trace properties are what is
+        synced to the frontend. The full resolution data of a trace is
+        returned by the `get_full_resolution_data` method. Assigning new
+        values to these properties replaces the full resolution data.
+
+        Parameters
+        ----------
+        max_points : int
+            Maximum number of points of each trace to send to the frontend
+        method : str
+            Downsampling method. One of:
+              - 'minmax': Select the minimum and maximum y value of buckets
+                of consecutive points. Preserves spikes and is fastest.
+              - 'lttb': Largest-Triangle-Three-Buckets. Preserves the visual
+                shape of the series with fewer points.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import plotly.graph_objects as go
+        >>> fig = go.FigureWidget()
+        >>> fig.enable_resampling(max_points=2000)
+        >>> y = np.random.randn(10000000).cumsum()
+        >>> fig.add_scattergl(y=y) # doctest: +SKIP
+        """
+        from plotly.resampling import methods
+
+        if not isinstance(max_points, six.integer_types) or max_points < 3:
+            raise ValueError(
+                "max_points must be an integer greater than 2, received {val}".format(
+                    val=repr(max_points)
+                )
+            )
+        if method not in methods:
+            raise ValueError(
+                "Invalid resampling method {method}, must be one of {methods}".format(
+                    method=repr(method), methods=methods
+                )
+            )
+
+        if self._resampling is None:
+            self._resampling = {"traces": {}, "axes": set()}
+        self._resampling.update(max_points=max_points, method=method)
+
+        with self.batch_update():
+            for trace in self._data_objs:
+                full_data = self._get_resampling_data(trace)
+                if full_data is not None:
+                    self._register_resampled_trace(trace, full_data)
+
+        for trace in self._data_objs:
+            self._record_resampled_view(trace)
+
+    def get_full_resolution_data(self, trace):
+        """
+        Return the full resolution data of a resampled trace
+
+        The properties of a resampled trace hold the downsampled data that
+        is displayed, see `enable_resampling`.
+
+        Parameters
+        ----------
+        trace : int or BaseTraceType
+            Trace, or index of the trace, in this figure
+
+        Returns
+        -------
+        dict or None
+            Dict from property paths (e.g. 'x', 'y', 'marker.color') to
+            read-only numpy arrays of the full resolution data of the trace,
+            or None if the trace is not resampled
+        """
+        if isinstance(trace, numbers.Integral):
+            trace = self._data_objs[trace]
+
+        if self._resampling is None:
+            return None
+
+        full_data = self._sync_resampled_trace(trace)
+        return dict(full_data) if full_data is not None else None
+
+    def add_traces(self, data, rows=None, cols=None, secondary_ys=None):
+        if self._resampling is None:
+            return super(BaseFigureWidget, self).add_traces(
+                data, rows=rows, cols=cols, secondary_ys=secondary_ys
+            )
+
+        # Downsample large traces before they are added, so that their
+        # full resolution data is never sent to the frontend
+        data = self._data_validator.validate_coerce(data)
+        full_data = []
+        for trace in data:
+            trace_full_data = self._get_resampling_data(trace)
+            if trace_full_data is not None:
+                inds = self._get_resampling_indices(trace_full_data, None)
+                for prop, full_arr in trace_full_data.items():
+                    trace[prop] = full_arr[inds]
+            full_data.append(trace_full_data)
+
+        super(BaseFigureWidget, self).add_traces(
+            data, rows=rows, cols=cols, secondary_ys=secondary_ys
+        )
+
+        new_traces = self._data_objs[len(self._data_objs) - len(data) :]
+        for trace, trace_full_data in zip(new_traces, full_data):
+            if trace_full_data is not None:
+                self._register_resampled_trace(trace, trace_full_data, update=False)
+                self._record_resampled_view(trace)
+
+        return self
+
+    add_traces.__doc__ = BaseFigure.add_traces.__doc__
+
+    def _get_resampling_data(self, trace, overrides=None):
+        """
+        Return the full resolution data of a trace that should be resampled
+
+        Parameters
+        ----------
+        trace : BaseTraceType
+        overrides : dict or None
+            Dict from property paths to arrays that are used in place of
+            the values of these properties of the trace
+
+        Returns
+        -------
+        dict or None
+            Dict from property paths to read-only numpy arrays, or None if
+            the trace should not be resampled
+        """
+        np = get_module("numpy")
+        max_points = self._resampling["max_points"]
+        if np is None or "x" not in trace or "y" not in trace:
+            return None
+
+        overrides = overrides or {}
+
+        def get_prop(prop):
+            return overrides[prop] if prop in overrides else trace[prop]
+
+        # y must be a long numeric array
+        y = get_prop("y")
+        if y is None or len(y) <= max_points:
+            return None
+        y = np.asarray(y)
+        if y.ndim != 1 or y.dtype.kind not in "iuf":
+            return None
+
+        # x must be sorted numbers or dates
+        x = get_prop("x")
+        if x is None:
+            x0 = trace.x0 if trace.x0 is not None else 0
+            dx = trace.dx if trace.dx is not None else 1
+            if not isinstance(x0, numbers.Number):
+                return None
+            x = x0 + dx * np.arange(len(y))
+        x = np.asarray(x)
+        if x.dtype.kind == "O":
+            # Dates are stored as arrays of datetime objects
+            try:
+                x = x.astype("datetime64[us]")
+            except (TypeError, ValueError):
+                return None
+        if (
+            x.shape != y.shape
+            or x.dtype.kind not in "iufM"
+            or not np.all(x[1:] >= x[:-1])
+        ):
+            return None
+
+        full_data = {"x": x, "y": y}
+        for prop in self._resampled_props[2:]:
+            if prop in trace:
+                val = get_prop(prop)
+                if isinstance(val, (tuple, np.ndarray)) and len(val) == len(y):
+                    full_data[prop] = np.asarray(val)
+
+        for arr in full_data.values():
+            arr.flags["WRITEABLE"] = False
+
+        return full_data
+
+    def _register_resampled_trace(self, trace, full_data, update=True):
+        """
+        Store the full resolution data of a resampled trace, and listen to
+        range changes of its x-axis
+
+        Parameters
+        ----------
+        trace : BaseTraceType
+            Trace in this figure
+        full_data : dict
+            Full resolution data, as returned by _get_resampling_data
+        update : bool
+            Whether to update the trace with a downsampled view of the
+            current x-axis range
+
+        Returns
+        -------
+        None
+        """
+        xaxis = trace.xaxis if "xaxis" in trace and trace.xaxis else "x"
+        axis_name = "xaxis" + xaxis[1:]
+        self._resampling["traces"][trace.uid] = {
+            "arrays": full_data,
+            "axis_name": axis_name,
+            "view": {},
+        }
+
+        if axis_name not in self._resampling["axes"]:
+            if axis_name not in self.layout:
+                self.layout[axis_name] = {}
+            self.layout[axis_name].on_change(
+                self._handle_resampled_axis_change, "range", "autorange", append=True
+            )
+            self._resampling["axes"].add(axis_name)
+
+        if update:
+            axis = self.layout[axis_name]
+            x_range = None if axis.autorange else axis.range
+            self._update_resampled_trace(trace, full_data, x_range)
+
+    def _handle_resampled_axis_change(self, axis, x_range, autorange):
+        """
+        on_change callback that updates the resampled traces of an x-axis
+        when its range changes
+        """
+        if self._resampling is None:
+            return
+
+        if autorange:
+            x_range = None
+
+        updated_traces = []
+        with self.batch_update():
+            for uid, entry in list(self._resampling["traces"].items()):
+                if entry["axis_name"] != axis.plotly_name:
+                    continue
+
+                try:
+                    trace_ind = self._get_trace_index_by_uid(uid)
+                except ValueError:
+                    # Trace was removed from the figure
+                    del self._resampling["traces"][uid]
+                    continue
+
+                trace = self._data_objs[trace_ind]
+                full_data = self._sync_resampled_trace(trace)
+                if full_data is not None:
+                    self._update_resampled_trace(trace, full_data, x_range)
+                    updated_traces.append(trace)
+
+        # Property values are only stored once the batch is applied
+        for trace in updated_traces:
+            self._record_resampled_view(trace)
+
+    def _record_resampled_view(self, trace):
+        """
+        Record the values of the resampled properties of a trace, which hold
+        its downsampled view, so that properties that are reassigned
+        afterwards can be told apart (see _sync_resampled_trace)
+        """
+        entry = self._resampling["traces"].get(trace.uid, None)
+        if entry is not None:
+            entry["view"] = {
+                prop: self._get_stored_prop(trace, prop) for prop in entry["arrays"]
+            }
+
+    def _sync_resampled_trace(self, trace):
+        """
+        Return the full resolution data of a resampled trace, after taking
+        into account the resampled properties that were reassigned since
+        its downsampled view was last set
+
+        Reassigned values replace the full resolution data of their
+        properties. If the trace should no longer be resampled with these
+        values, the remaining properties are restored to their full
+        resolution data and the trace is no longer resampled.
+
+        Returns
+        -------
+        dict or None
+            Full resolution data, or None if the trace is not resampled
+        """
+        entry = self._resampling["traces"].get(trace.uid, None)
+        if entry is None:
+            return None
+
+        view = entry["view"]
+        unchanged = {
+            prop: full_arr
+            for prop, full_arr in entry["arrays"].items()
+            if prop in view and self._get_stored_prop(trace, prop) is view[prop]
+        }
+        if len(unchanged) == len(entry["arrays"]):
+            return entry["arrays"]
+
+        full_data = self._get_resampling_data(trace, overrides=unchanged)
+        if full_data is None:
+            del self._resampling["traces"][trace.uid]
+            for prop, full_arr in unchanged.items():
+                trace[prop] = full_arr
+            return None
+
+        entry["arrays"] = full_data
+        return full_data
+
+    @staticmethod
+    def _get_stored_prop(trace, prop):
+        """
+        Return the value of a property path that is stored in the trace's
+        property dict, without validation or conversion
+        """
+        val = trace._props
+        for key in prop.split("."):
+            if not isinstance(val, dict):
+                return None
+            val = val.get(key, None)
+        return val
+
+    def _update_resampled_trace(self, trace, full_data, x_range):
+        """
+        Update a trace with a downsampled view of its full resolution data
+        within the specified x range
+        """
+        inds = self._get_resampling_indices(full_data, x_range)
+        for prop, full_arr in full_data.items():
+            trace[prop] = full_arr[inds]
+
+    def _get_resampling_indices(self, full_data, x_range):
+        """
+        Return the indexes of the points of the downsampled view of full
+        resolution data within the specified x range (or all data if None)
+        """
+        from plotly.resampling import downsample_indices
+
+        np = get_module("numpy")
+        x, y = full_data["x"], full_data["y"]
+
+        start, stop = 0, len(x)
+        bounds = self._to_x_values(x_range, x)
+        if bounds is not None:
+            # Include one point on either side of the range so that lines
+            # extend to the edges of the plot
+            lo, hi = min(bounds), max(bounds)
+            start = max(int(np.searchsorted(x, lo, side="left")) - 1, 0)
+            stop = min(int(np.searchsorted(x, hi, side="right")) + 1, len(x))
+
+        inds = downsample_indices(
+            x[start:stop],
+            y[start:stop],
+            self._resampling["max_points"],
+            method=self._resampling["method"],
+        )
+        return inds + start
+
+    @staticmethod
+    def _to_x_values(x_range, x):
+        """
+        Convert an axis range into values comparable to the x array.
+        Returns None if the range is unset or cannot be converted.
+        """
+        np = get_module("numpy")
+        if x_range is None or len(x_range) != 2:
+            return None
+
+        try:
+            if x.dtype.kind == "M":
+                # Date axis ranges are date strings, or milliseconds since
+                # the epoch
+                return [
+                    np.datetime64(v).astype(x.dtype)
+                    if isinstance(v, six.string_types)
+                    else np.datetime64(int(v), "ms").astype(x.dtype)
+                    for v in x_range
+                ]
+            else:
+                return [float(v) for v in x_range]
+        except (TypeError, ValueError):
+            return None
+
     # Display
     # -------
     def _ipython_display_(self):
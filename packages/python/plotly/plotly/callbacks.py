@@ -1,5 +1,26 @@
 from __future__ import absolute_import
 from plotly.utils import _list_repr_elided
+from plotly.optional_imports import get_module
+from _plotly_utils.basevalidators import copy_to_readonly_numpy_array
+
+
+def _to_readonly_array(v):
+    """
+    Convert an array-like value into a read-only numpy array. numpy arrays
+    are wrapped in a read-only view without copying. If numpy is not
+    installed, v is returned unchanged.
+    """
+    np = get_module("numpy")
+    if np is None:
+        return v
+
+    if isinstance(v, np.ndarray):
+        if v.flags["WRITEABLE"]:
+            v = v.view()
+            v.flags["WRITEABLE"] = False
+        return v
+
+    return copy_to_readonly_numpy_array(v)
 
 
 class InputDeviceState:
@@ -124,9 +145,9 @@ InputDeviceState(
 class Points:
     def __init__(self, point_inds=[], xs=[], ys=[], trace_name=None, trace_index=None):
 
-        self._point_inds = point_inds
-        self._xs = xs
-        self._ys = ys
+        self._point_inds = _to_readonly_array(point_inds)
+        self._xs = _to_readonly_array(xs)
+        self._ys = _to_readonly_array(ys)
         self._trace_name = trace_name
         self._trace_index = trace_index
 
@@ -149,33 +170,42 @@ Points(point_inds={point_inds},
     @property
     def point_inds(self):
         """
-        List of selected indexes into the trace's points
+        Array of selected indexes into the trace's points
+
+        This is a read-only numpy array if numpy is installed,
+        and a list otherwise
 
         Returns
         -------
-        list[int]
+        numpy.ndarray or list[int]
         """
         return self._point_inds
 
     @property
     def xs(self):
         """
-        List of x-coordinates of selected points
+        Array of x-coordinates of selected points
+
+        This is a read-only numpy array if numpy is installed,
+        and a list otherwise
 
         Returns
         -------
-        list[float]
+        numpy.ndarray or list[float]
         """
         return self._xs
 
     @property
     def ys(self):
         """
-        List of y-coordinates of selected points
+        Array of y-coordinates of selected points
+
+        This is a read-only numpy array if numpy is installed,
+        and a list otherwise
 
         Returns
         -------
-        list[float]
+        numpy.ndarray or list[float]
         """
         return self._ys
 
@@ -3,15 +3,6 @@
 for rapid data exploration and figure generation. Learn more at https://plotly.express/
 """
 from __future__ import absolute_import
-from plotly import optional_imports
-
-pd = optional_imports.get_module("pandas")
-if pd is None:
-    raise ImportError(
-        """\
-Plotly express requires pandas to be installed."""
-    )
-
 from ._imshow import imshow
 from ._chart_types import (  # noqa: F401
     scatter,
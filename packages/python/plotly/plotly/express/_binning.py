@@ -0,0 +1,353 @@
+"""
+Binning and aggregation of plotly express histograms in Python
+
+These functions follow the automatic binning of plotly.js histogram and
+histogram2d traces (bin sizes rounded like axis ticks, shared by all the traces
+of a bingroup) and their histfunc, histnorm and cumulative options. They are
+used by the `preaggregate` mode of `px.histogram` and `px.density_heatmap`,
+which sends bar and heatmap traces whose size depends on the number of bins
+rather than on the number of rows.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+# Bins of size `size` between `start` and `end`. For category axes, bins are
+# the `categories`, in axis order.
+BinSpec = namedtuple("BinSpec", ["start", "end", "size", "nbins", "categories"])
+
+# Relative tolerance of bin lookups, as in plotly.js
+_rounding_error = 1e-9
+
+# Size of the subset of values used to check whether the minimum difference
+# between values needs to be computed from all the values
+_min_diff_sample_size = 100000
+
+
+def is_category_data(values):
+    """
+    Whether values are displayed on a category axis, rather than a linear axis.
+    Raises a ValueError for dates, which are not supported.
+    """
+    kind = np.asarray(values).dtype.kind
+    if kind == "M":
+        raise ValueError("preaggregate=True does not support date values")
+    return kind not in "iuf"
+
+
+def auto_bin(values, nbins=None, is2d=False):
+    """
+    Compute the automatic bins of values, like plotly.js
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values of all the traces that share the bins. Numeric values are
+        binned along a linear axis, other values along a category axis.
+    nbins : int
+        Maximum number of bins
+    is2d : bool
+        Whether the bins are shared with a 2D histogram
+
+    Returns
+    -------
+    BinSpec
+    """
+    if is_category_data(values):
+        categories = [v for v in _unique(values) if v is not None and v == v]
+        return BinSpec(-0.5, len(categories) - 0.5, 1, len(categories), categories)
+
+    values = values.astype("float64")
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return BinSpec(0.0, 1.0, 1.0, 1, None)
+
+    data_min, data_max = float(values.min()), float(values.max())
+    if nbins and data_max > data_min:
+        size0 = (data_max - data_min) / nbins
+    else:
+        # Large enough bins to see the shape of the distribution, and at least
+        # as large as the differences between values
+        size0 = 2 * values.std() / len(values) ** (0.25 if is2d else 0.4)
+        span = data_max - data_min
+        step = max(len(values) // _min_diff_sample_size, 1)
+        if step == 1 or _distinct_min_diff(values[::step], span, len(values)) > size0:
+            min_diff = _distinct_min_diff(values, span, len(values))
+            msexp = 10 ** math.floor(math.log10(min_diff))
+            min_size = msexp * _round_down(min_diff / msexp, [0.9, 1.9, 4.9, 9.9])
+            size0 = max(min_size, size0)
+        if not np.isfinite(size0) or size0 <= 0:
+            size0 = 1
+
+    # Bin size rounded like the ticks of an axis
+    base = 10 ** math.floor(math.log10(size0))
+    size = base * _round_up(size0 / base, [2, 5, 10])
+
+    # Bins start before the first tick of a range from data_min to data_max
+    r0 = data_min * 1.0001 - data_max * 0.0001
+    start = math.ceil(r0 / size) * size - size
+    start = _shift_bins(start, size, values, data_min, data_max)
+
+    nbins = 1 + int(math.floor((data_max - start) / size))
+    return BinSpec(start, start + nbins * size, size, nbins, None)
+
+
+def _unique(values):
+    """
+    Unique values in order of appearance
+    """
+    import pandas as pd
+
+    return list(pd.unique(values))
+
+
+def _distinct_min_diff(values, span, n):
+    """
+    Minimum difference between distinct values, ignoring differences smaller
+    than 1/10000th of the average difference between n values. The minimum
+    difference of a subset of values is an upper bound of that of all values.
+    """
+    min_diff = span or 1
+    error = min_diff / max(n - 1, 1) / 10000
+    diffs = np.diff(np.sort(values))
+    diffs = diffs[diffs > error]
+    return min(min_diff, diffs.min()) if len(diffs) else min_diff
+
+
+def _round_up(val, rounding_set):
+    """
+    First value of a sorted set greater than val
+    """
+    for v in rounding_set:
+        if v > val:
+            return v
+    return rounding_set[-1]
+
+
+def _round_down(val, rounding_set):
+    """
+    Last value of a sorted set less than or equal to val
+    """
+    result = rounding_set[0]
+    for v in rounding_set:
+        if v <= val:
+            result = v
+    return result
+
+
+def _shift_bins(start, size, values, data_min, data_max):
+    """
+    Shift bins so that values do not fall on bin edges
+    """
+
+    def near_edge(v):
+        # Within 1% of a bin edge, values being greater than start
+        v = 1 + (v - start) * (100 / size)
+        return v - np.floor(v / 100) * 100 < 2
+
+    if np.all(values == np.floor(values)):
+        if size < 1:
+            # Center bins on integers
+            return data_min - 0.5 * size
+        else:
+            start -= 0.5
+            if start + size < data_min:
+                start += size
+            return start
+
+    edge_count = np.count_nonzero(near_edge(values))
+    mid_count = np.count_nonzero(near_edge(values + size / 2))
+    if mid_count < edge_count * 0.1 and (
+        edge_count > len(values) * 0.3 or near_edge(data_min) or near_edge(data_max)
+    ):
+        shift = size / 2
+        start += shift if start + shift < data_min else -shift
+    return start
+
+
+def bin_indexes(values, spec):
+    """
+    Return the index of the bin of each value, -1 for values outside of the
+    bins or missing
+    """
+    if spec.categories is not None:
+        import pandas as pd
+
+        return pd.Index(spec.categories).get_indexer(values)
+
+    with np.errstate(invalid="ignore"):
+        inds = np.floor(
+            (values.astype("float64") - spec.start) / spec.size + _rounding_error
+        )
+        valid = (inds >= 0) & (inds < spec.nbins)
+    return np.where(valid, inds, -1).astype(np.intp)
+
+
+def aggregate(inds, values, histfunc, nbins):
+    """
+    Aggregate values by bin
+
+    Parameters
+    ----------
+    inds : numpy.ndarray
+        Bin index of each value, -1 for values outside of the bins
+    values : numpy.ndarray or None
+        Values to aggregate, or None to count
+    histfunc : str
+        One of 'count', 'sum', 'avg', 'min' or 'max'
+    nbins : int
+        Number of bins
+
+    Returns
+    -------
+    numpy.ndarray
+        Aggregate of each bin. Bins without values are 0 for 'count' and
+        'sum', and NaN otherwise.
+    """
+    valid = inds >= 0
+    if histfunc == "count" or values is None:
+        return np.bincount(inds[valid], minlength=nbins).astype("float64")
+
+    values = np.asarray(values, dtype="float64")
+    valid &= ~np.isnan(values)
+    inds, values = inds[valid], values[valid]
+
+    if histfunc == "sum":
+        return np.bincount(inds, values, minlength=nbins)
+
+    counts = np.bincount(inds, minlength=nbins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if histfunc == "avg":
+            return np.bincount(inds, values, minlength=nbins) / counts
+
+        # min or max, from the values sorted by bin
+        result = np.full(nbins, np.nan)
+        order = np.argsort(inds, kind="mergesort")
+        nonempty = np.flatnonzero(counts)
+        starts = (np.cumsum(counts) - counts)[nonempty]
+        reduce = np.minimum if histfunc == "min" else np.maximum
+        result[nonempty] = reduce.reduceat(values[order], starts)
+        return result
+
+
+def normalize(sizes, histnorm, bin_area):
+    """
+    Apply a histnorm to aggregated values
+    """
+    total = np.nansum(sizes)
+    if histnorm == "percent":
+        return sizes * 100 / total
+    elif histnorm == "probability":
+        return sizes / total
+    elif histnorm == "density":
+        return sizes / bin_area
+    elif histnorm == "probability density":
+        return sizes / (bin_area * total)
+    return sizes
+
+
+def accumulate(sizes, direction="increasing"):
+    """
+    Cumulative sums of aggregated values, for cumulative histograms
+    """
+    sizes = np.nan_to_num(sizes)
+    if direction == "decreasing":
+        return np.cumsum(sizes[::-1])[::-1]
+    return np.cumsum(sizes)
+
+
+def bin_span_labels(values, inds, spec):
+    """
+    Return hover labels of the spans of bins, e.g. '10 - 19', like plotly.js
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Numeric values of a trace
+    inds : numpy.ndarray
+        Bin index of each value, as returned by bin_indexes
+    spec : BinSpec
+
+    Returns
+    -------
+    list of str
+        Label of each bin of spec
+    """
+    valid = inds >= 0
+    values = values[valid].astype("float64")
+    inds = inds[valid]
+    edges = spec.start + spec.size * np.arange(spec.nbins + 1)
+    if not len(values):
+        return [""] * spec.nbins
+
+    # Bins that all contain a single distinct value are labeled by the value
+    first_values = np.full(spec.nbins, np.nan)
+    first_values[inds[::-1]] = values[::-1]
+    if np.all(values == first_values[inds]):
+        return [_format_number(v, None) for v in first_values]
+
+    left_gap = np.min(values - edges[inds])
+    right_gap = np.min(edges[inds + 1] - values)
+    digit, disambiguate = _bin_span_digit(left_gap, right_gap, edges[0], edges[1])
+
+    labels = []
+    for i in range(spec.nbins):
+        left = round(edges[i] / digit) * digit
+        right = round(edges[i + 1] / digit) * digit
+        if disambiguate:
+            right -= digit
+        labels.append(
+            "%s - %s" % (_format_number(left, digit), _format_number(right, digit))
+        )
+    return labels
+
+
+def _bin_span_digit(left_gap, right_gap, edge0, edge1):
+    """
+    Rounding digit of bin span labels: the largest digit that changes within
+    the gaps between the data and the bin edges
+    """
+    dv0 = -1.1 * right_gap
+    dv1 = -0.1 * right_gap
+    dv2 = left_gap - dv1
+    left_digit = min(
+        _biggest_digit_changed(edge0 + dv1, edge0 + dv2),
+        _biggest_digit_changed(edge1 + dv1, edge1 + dv2),
+    )
+    right_digit = min(
+        _biggest_digit_changed(edge0 + dv0, edge0 + dv1),
+        _biggest_digit_changed(edge1 + dv0, edge1 + dv1),
+    )
+
+    # Disambiguate the edges, unless this adds too many digits
+    if left_digit > right_digit and right_digit < abs(edge1 - edge0) / 4000:
+        return left_digit, False
+    return min(left_digit, right_digit), True
+
+
+def _biggest_digit_changed(v1, v2):
+    if v1 * v2 <= 0:
+        return np.inf
+
+    def guaranteed_digit(dv):
+        return 10 ** math.floor(math.log10(dv))
+
+    digit = guaranteed_digit(abs(v2 - v1))
+    for _ in range(10):
+        next_digit = guaranteed_digit(digit * 80)
+        if math.floor(v2 / next_digit) - math.floor(v1 / next_digit) > 0.1:
+            digit = next_digit
+        else:
+            break
+    return digit
+
+
+def _format_number(v, digit):
+    if not np.isfinite(v):
+        return ""
+    if digit is None:
+        return "%g" % v if abs(v) < 1e15 else repr(float(v))
+    decimals = max(0, -int(math.floor(math.log10(digit))))
+    label = "%.*f" % (decimals, v)
+    return label.rstrip("0").rstrip(".") if "." in label else label
@@ -38,6 +38,7 @@ def scatter(
     marginal_y=None,
     trendline=None,
     trendline_color_override=None,
+    trendline_engine="numpy",
     log_x=False,
     log_y=False,
     range_x=None,
@@ -79,6 +80,7 @@ def density_contour(
     marginal_y=None,
     trendline=None,
     trendline_color_override=None,
+    trendline_engine="numpy",
     log_x=False,
     log_y=False,
     range_x=None,
@@ -143,6 +145,8 @@ def density_heatmap(
     histnorm=None,
     nbinsx=None,
     nbinsy=None,
+    preaggregate=False,
+    render_mode="auto",
     title=None,
     template=None,
     width=None,
@@ -346,6 +350,7 @@ def histogram(
     histfunc=None,
     cumulative=None,
     nbins=None,
+    preaggregate=False,
     title=None,
     template=None,
     width=None,
@@ -0,0 +1,134 @@
+"""
+Lightweight data frames of 1-D numpy arrays
+
+Plotly express builds figures from dicts of numpy arrays with these columns
+rather than with a pandas DataFrame, so that pandas is only imported when
+pandas objects are passed to it.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from _plotly_utils.optional_imports import get_module
+
+# dtype kinds of the arrays that are kept as is: booleans, numbers and strings
+plain_kinds = "biufU"
+
+
+def is_plain_column(values):
+    """
+    Whether values is a 1-D numpy array that can be a column of Columns
+    """
+    return (
+        isinstance(values, np.ndarray)
+        and values.ndim == 1
+        and values.dtype.kind in plain_kinds
+    )
+
+
+class Columns(object):
+    """
+    Ordered mapping of column names to 1-D numpy arrays of the same length
+
+    Implements the subset of the pandas DataFrame interface used by plotly
+    express to group rows and build traces. Columns are returned as numpy
+    arrays rather than as Series.
+    """
+
+    def __init__(self, columns):
+        self._columns = OrderedDict(columns)
+        lengths = set(len(values) for values in self._columns.values())
+        if len(lengths) > 1:
+            raise ValueError("All arrays must be of the same length")
+        self._length = lengths.pop() if lengths else 0
+
+    @staticmethod
+    def accepts(data):
+        """
+        Whether data is a dict of columns that do not need pandas
+        """
+        return (
+            isinstance(data, dict)
+            and len(data) > 0
+            and all(is_plain_column(values) for values in data.values())
+        )
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def iteritems(self):
+        return iter(self._columns.items())
+
+    def take(self, rows):
+        return Columns((name, values[rows]) for name, values in self.iteritems())
+
+    def to_pandas(self):
+        """
+        pandas DataFrame of the columns, referencing their arrays
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self._columns, copy=False)
+
+
+def factorize(values):
+    """
+    Encode values with the integer positions of their first appearance, like
+    pandas.factorize. Missing values have the code -1.
+
+    Returns the codes and the unique values. pandas is used if it is already
+    imported or if values is a pandas object.
+    """
+    pd = get_module("pandas", should_load=not isinstance(values, np.ndarray))
+    if pd is not None:
+        return pd.factorize(values)
+
+    missing = _missing(values)
+    present = np.flatnonzero(~missing)
+    uniques, first, inverse = np.unique(
+        values[present], return_index=True, return_inverse=True
+    )
+    order = np.argsort(first, kind="mergesort")
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(len(order))
+    codes = np.full(len(values), -1, dtype=np.intp)
+    codes[present] = ranks[inverse.ravel()]
+    return codes, uniques[order]
+
+
+def unique(values):
+    """
+    Unique values in order of appearance, including missing values, like
+    pandas.Series.unique
+    """
+    if not isinstance(values, np.ndarray):
+        return values.unique()
+    pd = get_module("pandas", should_load=False)
+    if pd is not None:
+        return pd.unique(values)
+
+    codes, uniques = factorize(values)
+    missing = np.flatnonzero(codes < 0)
+    if len(missing) == 0:
+        return uniques
+    position = codes[: missing[0]].max() + 1 if missing[0] > 0 else 0
+    return np.insert(uniques, position, values[missing[0]])
+
+
+def _missing(values):
+    if values.dtype.kind in "fc":
+        return np.isnan(values)
+    return np.zeros(len(values), dtype=bool)
@@ -3,9 +3,21 @@ import plotly.io as pio
 from collections import namedtuple, OrderedDict
 
 from _plotly_utils.basevalidators import ColorscaleValidator
+from _plotly_utils.optional_imports import get_module
+from plotly.basedatatypes import BasePlotlyType
 from .colors import qualitative, sequential
+from ._columns import Columns, factorize, is_plain_column, unique
+from ._trendline import fit_trendlines
+from ._binning import (
+    auto_bin,
+    bin_indexes,
+    aggregate,
+    normalize,
+    accumulate,
+    bin_span_labels,
+)
+from ._raster import RasterCanvas, pixel_bins, default_width, default_height
 import math
-import pandas as pd
 import numpy as np
 
 from plotly.subplots import (
@@ -63,11 +75,17 @@ def get_trendline_results(fig):
     Arguments:
         fig: the output of a `plotly.express` charting call
     Returns:
-        A `pandas.DataFrame` with a column "px_fit_results" containing the `statsmodels`
+        A `pandas.DataFrame` with a column "px_fit_results" containing the fit
         results objects, along with columns identifying the subset of the data the
-        trendline was fit on.
+        trendline was fit on. With `trendline_engine="statsmodels"` these are
+        `statsmodels` results objects. Otherwise they provide the `params`,
+        `rsquared` and `nobs` attributes and the `predict()` method, and defer any
+        other attribute (e.g. `summary()`) to `statsmodels` results computed on
+        first access.
     """
-    return fig._px_trendlines
+    import pandas as pd
+
+    return pd.DataFrame(fig._px_trendlines)
 
 
 Mapping = namedtuple(
@@ -115,7 +133,7 @@ def make_mapping(args, variable):
             val_map={},
             sequence=[""],
             variable=variable,
-            updater=(lambda trace, v: v),
+            updater=(lambda v: {}),
             facet=None,
         )
     if variable == "facet_row" or variable == "facet_col":
@@ -126,7 +144,7 @@ def make_mapping(args, variable):
             grouper=args[variable],
             val_map={},
             sequence=[i for i in range(1, 1000)],
-            updater=(lambda trace, v: v),
+            updater=(lambda v: {}),
             facet="row" if variable == "facet_row" else "col",
         )
     (parent, variable) = variable.split(".")
@@ -143,12 +161,73 @@ def make_mapping(args, variable):
         grouper=args[arg_name],
         val_map=args[vprefix + "_map"].copy(),
         sequence=args[vprefix + "_sequence"],
-        updater=lambda trace, v: trace.update({parent: {variable: v}}),
+        updater=lambda v: {parent: {variable: v}},
         facet=None,
     )
 
 
-def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
+def map_discrete_colors(values, color_discrete_map, color_discrete_sequence):
+    """
+    Return an array of the colors of values, from color_discrete_map or else
+    from color_discrete_sequence in order of first appearance of the values
+
+    The mapping is computed once per distinct value and the colors of all the
+    values are taken from it at once.
+    """
+    codes, uniques = factorize(values)
+    values = _column_values(values)
+    # Missing values share a color
+    n_codes = len(uniques) + int((codes < 0).any())
+    codes = np.where(codes < 0, len(uniques), codes)
+
+    # Position of the first appearance of each distinct value
+    positions = np.arange(len(codes))
+    first_positions = np.empty(n_codes, dtype=positions.dtype)
+    first_positions[codes[::-1]] = positions[::-1]
+
+    mapping = color_discrete_map.copy() if color_discrete_map is not None else {}
+    colors = np.empty(n_codes, dtype=object)
+    for code in np.argsort(first_positions, kind="mergesort"):
+        cat = values[first_positions[code]]
+        if mapping.get(cat) is None:
+            mapping[cat] = color_discrete_sequence[
+                len(mapping) % len(color_discrete_sequence)
+            ]
+        colors[code] = mapping[cat]
+    return colors[codes]
+
+
+def _merge_props(props, patch):
+    """
+    Update a dict of trace properties with a patch, merging nested dicts like
+    BasePlotlyType.update and without modifying the dicts of the patch
+    """
+    for key, value in patch.items():
+        if isinstance(value, dict):
+            current = props.get(key)
+            props[key] = _merge_props(
+                current if isinstance(current, dict) else {}, value
+            )
+        else:
+            props[key] = value
+    return props
+
+
+def _accepts_props(obj, props):
+    """
+    Whether all the nested properties of a dict are valid properties of obj
+    """
+    for key, value in props.items():
+        if key not in obj:
+            return False
+        if isinstance(value, dict) and not _accepts_props(obj[key], value):
+            return False
+    return True
+
+
+def make_trace_kwargs(
+    args, trace_spec, trace_data, mapping_labels, sizeref, trendline_fit=None
+):
     """Populates a dict with arguments to update trace
 
     Parameters
@@ -164,6 +243,9 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
         to be used for hovertemplate
     sizeref : float
         marker sizeref
+    trendline_fit : tuple
+        x values, y values and fit results of the trendline of the trace, as
+        computed by fit_trendlines
 
     Returns
     -------
@@ -173,7 +255,7 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
         fit information to be used for trendlines
     """
     if "line_close" in args and args["line_close"]:
-        trace_data = trace_data.append(trace_data.iloc[0])
+        trace_data = trace_data.take(np.append(np.arange(len(trace_data)), 0))
     trace_patch = trace_spec.trace_patch.copy() or {}
     fit_results = None
     hover_header = ""
@@ -193,12 +275,12 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                 and (
                     trace_spec.constructor != go.Parcats
                     or (attr_value is not None and name in attr_value)
-                    or len(args["data_frame"][name].unique())
+                    or len(unique(args["data_frame"][name]))
                     <= args["dimensions_max_cardinality"]
                 )
             ]
             trace_patch["dimensions"] = [
-                dict(label=get_label(args, name), values=column.values)
+                dict(label=get_label(args, name), values=_column_values(column))
                 for (name, column) in dims
             ]
             if trace_spec.constructor == go.Splom:
@@ -229,37 +311,11 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                 if trace_spec.constructor == go.Histogram:
                     mapping_labels["count"] = "%{x}"
             elif attr_name == "trendline":
-                if (
-                    attr_value in ["ols", "lowess"]
-                    and args["x"]
-                    and args["y"]
-                    and len(trace_data) > 1
-                ):
-                    import statsmodels.api as sm
-
-                    # sorting is bad but trace_specs with "trendline" have no other attrs
-                    sorted_trace_data = trace_data.sort_values(by=args["x"])
-                    y = sorted_trace_data[args["y"]]
-                    x = sorted_trace_data[args["x"]]
-
-                    if x.dtype.type == np.datetime64:
-                        x = x.astype(int) / 10 ** 9  # convert to unix epoch seconds
-
+                if trendline_fit is not None and len(trace_data) > 1:
+                    trace_patch["x"], trace_patch["y"], fit_results = trendline_fit
                     if attr_value == "lowess":
-                        # missing ='drop' is the default value for lowess but not for OLS (None)
-                        # we force it here in case statsmodels change their defaults
-                        trendline = sm.nonparametric.lowess(y, x, missing="drop")
-                        trace_patch["x"] = trendline[:, 0]
-                        trace_patch["y"] = trendline[:, 1]
                         hover_header = "<b>LOWESS trendline</b><br><br>"
                     elif attr_value == "ols":
-                        fit_results = sm.OLS(
-                            y.values, sm.add_constant(x.values), missing="drop"
-                        ).fit()
-                        trace_patch["y"] = fit_results.predict()
-                        trace_patch["x"] = x[
-                            np.logical_not(np.logical_or(np.isnan(y), np.isnan(x)))
-                        ]
                         hover_header = "<b>OLS trendline</b><br>"
                         hover_header += "%s = %g * %s + %g<br>" % (
                             args["y"],
@@ -280,7 +336,7 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                     trace_patch[error_xy] = {}
                 trace_patch[error_xy][arr] = trace_data[attr_value]
             elif attr_name == "custom_data":
-                trace_patch["customdata"] = trace_data[attr_value].values
+                trace_patch["customdata"] = _stack_columns(trace_data, attr_value)
                 custom_data_len = len(attr_value)  # number of custom data columns
             elif attr_name == "hover_name":
                 if trace_spec.constructor not in [
@@ -310,13 +366,13 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                                 trace_patch["customdata"] = np.hstack(
                                     (
                                         trace_patch["customdata"],
-                                        trace_data[col].values[:, None],
+                                        _stack_columns(trace_data, [col]),
                                     )
                                 )
                             else:
-                                trace_patch["customdata"] = trace_data[col].values[
-                                    :, None
-                                ]
+                                trace_patch["customdata"] = _stack_columns(
+                                    trace_data, [col]
+                                )
                         attr_label_col = get_decorated_label(args, col, None)
                         mapping_labels[attr_label_col] = "%%{customdata[%d]}" % (
                             position
@@ -340,17 +396,11 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                         trace_patch["marker"]["coloraxis"] = "coloraxis1"
                         mapping_labels[attr_label] = "%{color}"
                     else:
-                        trace_patch["marker"]["colors"] = []
-                        if args["color_discrete_map"] is not None:
-                            mapping = args["color_discrete_map"].copy()
-                        else:
-                            mapping = {}
-                        for cat in trace_data[attr_value]:
-                            if mapping.get(cat) is None:
-                                mapping[cat] = args["color_discrete_sequence"][
-                                    len(mapping) % len(args["color_discrete_sequence"])
-                                ]
-                            trace_patch["marker"]["colors"].append(mapping[cat])
+                        trace_patch["marker"]["colors"] = map_discrete_colors(
+                            trace_data[attr_value],
+                            args["color_discrete_map"],
+                            args["color_discrete_sequence"],
+                        )
                 else:
                     colorable = "marker"
                     if trace_spec.constructor in [go.Parcats, go.Parcoords]:
@@ -620,8 +670,8 @@ def configure_mapbox(args, fig, orders):
     center = args["center"]
     if not center and "lat" in args and "lon" in args:
         center = dict(
-            lat=args["data_frame"][args["lat"]].mean(),
-            lon=args["data_frame"][args["lon"]].mean(),
+            lat=np.nanmean(args["data_frame"][args["lat"]]),
+            lon=np.nanmean(args["data_frame"][args["lon"]]),
         )
     fig.update_layout(
         mapbox=dict(
@@ -870,6 +920,8 @@ def _get_reserved_col_names(args, attrables, array_attrables):
     (pandas series type).
     """
     df = args["data_frame"]
+    # pandas objects can only be passed if pandas is already imported
+    pd = get_module("pandas", should_load=False)
     reserved_names = set()
     for field in args:
         if field not in attrables:
@@ -882,7 +934,7 @@ def _get_reserved_col_names(args, attrables, array_attrables):
                 continue
             elif isinstance(arg, str):  # no need to add ints since kw arg are not ints
                 reserved_names.add(arg)
-            elif isinstance(arg, pd.Series):
+            elif pd is not None and isinstance(arg, pd.Series):
                 arg_name = arg.name
                 if arg_name and hasattr(df, arg_name):
                     in_df = arg is df[arg_name]
@@ -933,14 +985,28 @@ def build_dataframe(args, attrables, array_attrables):
                 if isinstance(args[field], dict)
                 else list(args[field])
             )
-    # Cast data_frame argument to DataFrame (it could be a numpy array, dict etc.)
+    # pandas objects can only be passed if pandas is already imported
+    pd = get_module("pandas", should_load=False)
+    # Cast data_frame argument to DataFrame (it could be a numpy array, dict etc.),
+    # or to Columns for dicts of numpy arrays, which do not need pandas
     df_provided = args["data_frame"] is not None
-    if df_provided and not isinstance(args["data_frame"], pd.DataFrame):
-        args["data_frame"] = pd.DataFrame(args["data_frame"])
+    if Columns.accepts(args["data_frame"]):
+        args["data_frame"] = Columns(args["data_frame"])
+    elif df_provided and not (
+        pd is not None and isinstance(args["data_frame"], pd.DataFrame)
+    ):
+        import pandas as pd
+
+        args["data_frame"] = pd.DataFrame(args["data_frame"], copy=False)
     df_input = args["data_frame"]
 
-    # We start from an empty DataFrame
-    df_output = pd.DataFrame()
+    # We start from an empty mapping of column names to arrays, turned into a
+    # DataFrame at the end without copying the arrays. Assigning the columns
+    # of a DataFrame one by one would copy each of them.
+    df_output = OrderedDict()
+    length = 0
+    # Whether all the columns are numpy arrays, which do not need pandas
+    columnar = not df_provided or isinstance(df_input, Columns)
 
     # Initialize set of column names
     # These are reserved names
@@ -956,7 +1022,9 @@ def build_dataframe(args, attrables, array_attrables):
                 "No data were provided. Please provide data either with the `data_frame` or with the `dimensions` argument."
             )
         else:
-            df_output[df_input.columns] = df_input[df_input.columns]
+            for col_name in df_input.columns:
+                df_output[col_name] = _column_values(df_input[col_name])
+            length = len(df_input)
 
     # hover_data is a dict
     hover_data_is_dict = (
@@ -992,11 +1060,10 @@ def build_dataframe(args, attrables, array_attrables):
         # argument_list and field_list ready, iterate over them
         # Core of the loop starts here
         for i, (argument, field) in enumerate(zip(argument_list, field_list)):
-            length = len(df_output)
             if argument is None:
                 continue
             # Case of multiindex
-            if isinstance(argument, pd.MultiIndex):
+            if pd is not None and isinstance(argument, pd.MultiIndex):
                 raise TypeError(
                     "Argument '%s' is a pandas MultiIndex. "
                     "pandas MultiIndex is not supported by plotly express "
@@ -1013,7 +1080,13 @@ def build_dataframe(args, attrables, array_attrables):
                     and args["hover_data"][str(argument)][1] is not None
                 ):
                     col_name = str(argument)
-                    df_output[col_name] = args["hover_data"][col_name][1]
+                    columnar = columnar and is_plain_column(
+                        args["hover_data"][col_name][1]
+                    )
+                    df_output[col_name] = _column_values(
+                        args["hover_data"][col_name][1]
+                    )
+                    length = len(df_output[col_name])
                     continue
 
                 if not df_provided:
@@ -1043,15 +1116,16 @@ def build_dataframe(args, attrables, array_attrables):
                         % (
                             field,
                             len(df_input[argument]),
-                            str(list(df_output.columns)),
+                            str(list(df_output)),
                             length,
                         )
                     )
                 col_name = str(argument)
-                df_output[col_name] = df_input[argument].values
+                df_output[col_name] = _column_values(df_input[argument])
+                length = len(df_output[col_name])
             # ----------------- argument is a column / array / list.... -------
             else:
-                is_index = isinstance(argument, pd.RangeIndex)
+                is_index = pd is not None and isinstance(argument, pd.RangeIndex)
                 # First pandas
                 # pandas series have a name but it's None
                 if (
@@ -1081,12 +1155,11 @@ def build_dataframe(args, attrables, array_attrables):
                         "All arguments should have the same length. "
                         "The length of argument `%s` is %d, whereas the "
                         "length of previous arguments %s is %d"
-                        % (field, len(argument), str(list(df_output.columns)), length)
+                        % (field, len(argument), str(list(df_output)), length)
                     )
-                if hasattr(argument, "values"):
-                    df_output[str(col_name)] = argument.values
-                else:
-                    df_output[str(col_name)] = np.array(argument)
+                columnar = columnar and is_plain_column(argument)
+                df_output[str(col_name)] = _column_values(argument)
+                length = len(argument)
 
             # Finally, update argument with column name now that column exists
             if field_name not in array_attrables:
@@ -1096,39 +1169,180 @@ def build_dataframe(args, attrables, array_attrables):
             else:
                 args[field_name][i] = str(col_name)
 
-    args["data_frame"] = df_output
+    if columnar and df_output:
+        args["data_frame"] = Columns(df_output)
+    else:
+        import pandas as pd
+
+        args["data_frame"] = pd.DataFrame(df_output, copy=False)
     return args
 
 
+def _column_values(argument):
+    """
+    Array of the values of a column argument, referencing the data of pandas
+    objects and numpy arrays rather than copying it
+    """
+    if isinstance(argument, np.ndarray):
+        return argument
+    if hasattr(argument, "values"):
+        return argument.values
+    return np.array(argument)
+
+
+def _stack_columns(data, cols):
+    """
+    2-D array of the values of columns of data, like DataFrame.values, with
+    strings as objects
+    """
+    if not isinstance(data, Columns):
+        return data[cols].values
+    arrays = [data[col] for col in cols]
+    if not all(values.dtype.kind in "iuf" for values in arrays):
+        arrays = [values.astype(object) for values in arrays]
+    return np.column_stack(arrays)
+
+
 def _check_dataframe_all_leaves(df):
     df_sorted = df.sort_values(by=list(df.columns))
-    null_mask = df_sorted.isnull()
-    df_sorted = df_sorted.astype(str)
-    null_indices = np.nonzero(null_mask.any(axis=1).values)[0]
-    for null_row_index in null_indices:
-        row = null_mask.iloc[null_row_index]
-        i = np.nonzero(row.values)[0][0]
-        if not row[i:].all():
-            raise ValueError(
-                "None entries cannot have not-None children",
-                df_sorted.iloc[null_row_index],
-            )
-    df_sorted[null_mask] = ""
-    row_strings = list(df_sorted.apply(lambda x: "".join(x), axis=1))
-    for i, row in enumerate(row_strings[:-1]):
-        if row_strings[i + 1] in row and (i + 1) in null_indices:
+    # Column by column, which is much faster than a 2D mask of object columns
+    null_mask = np.column_stack([df_sorted[c].isnull().values for c in df.columns])
+    null_indices = np.nonzero(null_mask.any(axis=1))[0]
+    if not len(null_indices):
+        return
+
+    # None entries must be followed by None entries only
+    invalid_rows = np.nonzero((null_mask[:, :-1] & ~null_mask[:, 1:]).any(axis=1))[0]
+    if len(invalid_rows):
+        raise ValueError(
+            "None entries cannot have not-None children",
+            df_sorted.iloc[invalid_rows[:1]].astype(str).iloc[0],
+        )
+
+    # Rows with None entries must not be the path of another row, which is the
+    # previous row once sorted
+    rows = np.union1d(null_indices, null_indices - 1)
+    rows = rows[rows >= 0]
+    df_strings = df_sorted.iloc[rows].astype(str)
+    df_strings[null_mask[rows]] = ""
+    row_strings = dict(zip(rows, df_strings.apply(lambda x: "".join(x), axis=1)))
+    for i in null_indices:
+        if i > 0 and row_strings[i] in row_strings[i - 1]:
             raise ValueError(
                 "Non-leaves rows are not permitted in the dataframe \n",
-                df_sorted.iloc[i + 1],
+                df_strings.loc[df_sorted.index[i]],
                 "is not a leaf.",
             )
 
 
+def _build_hierarchy_levels(df, path):
+    """
+    Compute the nodes of the levels of a sunburst or treemap hierarchy
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        data frame of the leaves
+    path : list
+        names of the columns of the levels, from the leaves to the root
+
+    Returns
+    -------
+    list
+        For each level from the leaves to the root, a dict with the node of
+        each row ('row_nodes'), the parent node of each node ('parent_nodes'),
+        the labels, ids and parent ids of nodes, and the nodes to display, i.e.
+        without missing values along their path, sorted by label and then by
+        parent labels ('output_nodes').
+    """
+    import pandas as pd
+
+    levels = [None] * len(path)
+    parent_row_nodes = np.zeros(len(df), dtype=np.intp)
+    parent_level = None
+    for i in reversed(range(len(path))):
+        try:
+            codes, uniques = pd.factorize(df[path[i]], sort=True)
+        except TypeError:
+            codes, uniques = pd.factorize(df[path[i]])
+
+        # Nodes are the unique values of a level and its parent node, with
+        # missing values as code 0
+        row_nodes, node_keys = pd.factorize(
+            parent_row_nodes * (len(uniques) + 1) + (codes + 1)
+        )
+        parent_nodes = node_keys // (len(uniques) + 1)
+        value_codes = node_keys % (len(uniques) + 1) - 1
+
+        labels = np.asarray(pd.Series(uniques).astype(str), dtype=object)
+        node_labels = np.where(value_codes >= 0, labels[value_codes], "")
+        valid = value_codes >= 0
+        sort_keys = [value_codes]
+        if parent_level is None:
+            ids = node_labels
+            parents = np.full(len(node_keys), "", dtype=object)
+        else:
+            parent_ids = parent_level["ids"][parent_nodes]
+            ids = parent_ids + "/" + node_labels
+            parents = np.asarray(pd.Series(parent_ids).str.rstrip("/"), dtype=object)
+            valid &= parent_level["valid"][parent_nodes]
+            sort_keys.extend(k[parent_nodes] for k in parent_level["sort_keys"])
+
+        levels[i] = dict(
+            row_nodes=row_nodes,
+            parent_nodes=parent_nodes,
+            labels=node_labels,
+            ids=ids,
+            parents=parents,
+            valid=valid,
+            sort_keys=sort_keys,
+        )
+        parent_row_nodes = row_nodes
+        parent_level = levels[i]
+
+    for level in levels:
+        order = np.lexsort(level["sort_keys"][::-1])
+        level["output_nodes"] = order[level["valid"][order]]
+    return levels
+
+
+def _aggregate_levels(levels, values, aggregate_by_node):
+    """
+    Aggregate the values of the rows of a data frame by node of each level of
+    a hierarchy, from the leaves to the root, each level being aggregated from
+    the level below
+    """
+    result = [aggregate_by_node(values, levels[0]["row_nodes"])]
+    for i in range(1, len(levels)):
+        result.append(aggregate_by_node(result[-1], levels[i - 1]["parent_nodes"]))
+    return result
+
+
+def _sum_by_node(values, nodes):
+    return np.bincount(nodes, values)
+
+
+def _min_by_node(values, nodes):
+    import pandas as pd
+
+    return pd.Series(values).groupby(nodes).min().values
+
+
+def _max_by_node(values, nodes):
+    import pandas as pd
+
+    return pd.Series(values).groupby(nodes).max().values
+
+
 def process_dataframe_hierarchy(args):
     """
     Build dataframe for sunburst or treemap when the path argument is provided.
     """
+    import pandas as pd
+
     df = args["data_frame"]
+    if isinstance(df, Columns):
+        df = df.to_pandas()
     path = args["path"][::-1]
     _check_dataframe_all_leaves(df[path[::-1]])
     discrete_color = False
@@ -1151,13 +1365,9 @@ def process_dataframe_hierarchy(args):
                 path = [new_col_name if x == col_name else x for x in path]
                 df[new_col_name] = series_to_copy
     # ------------ Define aggregation functions --------------------------------
-
-    def aggfunc_discrete(x):
-        uniques = x.unique()
-        if len(uniques) == 1:
-            return uniques[0]
-        else:
-            return "(?)"
+    # Columns are aggregated by node, from the leaves to the root: each level
+    # is aggregated from the level below. Discrete columns are aggregated to
+    # their unique value, or "(?)" if values differ.
 
     agg_f = {}
     aggfunc_color = None
@@ -1189,48 +1399,68 @@ def process_dataframe_hierarchy(args):
 
     if args["color"]:
         if df[args["color"]].dtype.kind not in "ifc":
-            aggfunc_color = aggfunc_discrete
+            aggfunc_color = "discrete"
             discrete_color = True
         elif not aggfunc_color:
-
-            def aggfunc_continuous(x):
-                return np.average(x, weights=df.loc[x.index, count_colname])
-
-            aggfunc_color = aggfunc_continuous
+            aggfunc_color = "weighted_mean"
         agg_f[args["color"]] = aggfunc_color
 
     #  Other columns (for color, hover_data, custom_data etc.)
     cols = list(set(df.columns).difference(path))
     for col in cols:  # for hover_data, custom_data etc.
         if col not in agg_f:
-            agg_f[col] = aggfunc_discrete
+            agg_f[col] = "discrete"
     # ----------------------------------------------------------------------------
 
-    df_all_trees = pd.DataFrame(columns=["labels", "parent", "id"] + cols)
-    #  Set column type here (useful for continuous vs discrete colorscale)
-    for col in cols:
-        df_all_trees[col] = df_all_trees[col].astype(df[col].dtype)
-    for i, level in enumerate(path):
-        df_tree = pd.DataFrame(columns=df_all_trees.columns)
-        dfg = df.groupby(path[i:]).agg(agg_f)
-        dfg = dfg.reset_index()
-        # Path label massaging
-        df_tree["labels"] = dfg[level].copy().astype(str)
-        df_tree["parent"] = ""
-        df_tree["id"] = dfg[level].copy().astype(str)
-        if i < len(path) - 1:
-            j = i + 1
-            while j < len(path):
-                df_tree["parent"] = (
-                    dfg[path[j]].copy().astype(str) + "/" + df_tree["parent"]
-                )
-                df_tree["id"] = dfg[path[j]].copy().astype(str) + "/" + df_tree["id"]
-                j += 1
+    levels = _build_hierarchy_levels(df, path)
 
-        df_tree["parent"] = df_tree["parent"].str.rstrip("/")
-        if cols:
-            df_tree[cols] = dfg[cols]
-        df_all_trees = df_all_trees.append(df_tree, ignore_index=True)
+    # Aggregates of each column, by level from the leaves to the root
+    aggregates = {}
+    for col in cols:
+        if agg_f[col] == "sum":
+            values = df[col].values
+            level_values = _aggregate_levels(
+                levels, np.nan_to_num(values.astype("float64")), _sum_by_node
+            )
+            if values.dtype.kind in "iub":
+                level_values = [v.astype("int64") for v in level_values]
+        elif agg_f[col] == "weighted_mean":
+            weights = df[count_colname].values.astype("float64")
+            weighted_sums = _aggregate_levels(
+                levels, df[col].values * weights, _sum_by_node
+            )
+            weight_sums = _aggregate_levels(levels, weights, _sum_by_node)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                level_values = [s / w for s, w in zip(weighted_sums, weight_sums)]
+        else:
+            # Missing values are their own unique value
+            codes, uniques = pd.factorize(df[col])
+            uniques = np.append(np.asarray(uniques, dtype=object), np.nan)
+            codes = np.where(codes < 0, len(uniques) - 1, codes)
+            mins = _aggregate_levels(levels, codes, _min_by_node)
+            maxs = _aggregate_levels(levels, codes, _max_by_node)
+            level_values = [
+                np.where(lo == hi, uniques[lo], "(?)") for lo, hi in zip(mins, maxs)
+            ]
+        aggregates[col] = level_values
+
+    tree_columns = OrderedDict((c, []) for c in ["labels", "parent", "id"] + cols)
+    for i, level in enumerate(levels):
+        nodes = level["output_nodes"]
+        tree_columns["labels"].append(level["labels"][nodes])
+        tree_columns["parent"].append(level["parents"][nodes])
+        tree_columns["id"].append(level["ids"][nodes])
+        for col in cols:
+            tree_columns[col].append(aggregates[col][i][nodes])
+
+    df_all_trees = pd.DataFrame(
+        OrderedDict(
+            (c, pd.Series(np.concatenate(v)).infer_objects())
+            for c, v in tree_columns.items()
+        )
+    )
+    for c in ["labels", "parent", "id"]:
+        df_all_trees[c] = df_all_trees[c].astype(object)
 
     # we want to make sure than (?) is the first color of the sequence
     if args["color"] and discrete_color:
@@ -1282,7 +1512,7 @@ def infer_config(args, constructor, trace_patch):
     # Compute sizeref
     sizeref = 0
     if "size" in args and args["size"]:
-        sizeref = args["data_frame"][args["size"]].max() / args["size_max"] ** 2
+        sizeref = np.nanmax(args["data_frame"][args["size"]]) / args["size_max"] ** 2
 
     # Compute color attributes and grouping attributes
     if "color" in args:
@@ -1384,45 +1614,423 @@ def infer_config(args, constructor, trace_patch):
     return args, trace_specs, grouped_mappings, sizeref, show_colorbar
 
 
-def get_orderings(args, grouper, grouped):
+def get_groups_and_orders(args, grouper):
     """
     `orders` is the user-supplied ordering (with the remaining data-frame-supplied
     ordering appended if the column is used for grouping). It includes anything the user
     gave, for any variable, including values not present in the dataset. It is used
     downstream to set e.g. `categoryarray` for cartesian axes
 
-    `group_names` is the set of groups, ordered by the order above
+    `groups` is an OrderedDict from group names (tuples of values of the grouper
+    columns) to the integer positions of the rows of the group, ordered by the order
+    above. The positions are None for a single group of all the rows. They are
+    computed with one factorization and one stable sort of the data frame, rather
+    than once per group, and rows keep their data frame order within each group.
 
     `group_values` is a subset of `orders` in both keys and values. It contains a key
      for every grouped mapping and its values are the sorted *data* values for these
      mappings.
     """
     orders = {} if "category_orders" not in args else args["category_orders"].copy()
-    group_names = []
+    df = args["data_frame"]
     group_values = {}
-    for group_name in grouped.groups:
-        if len(grouper) == 1:
-            group_name = (group_name,)
-        group_names.append(group_name)
-        for col in grouper:
-            if col != one_group:
-                uniques = args["data_frame"][col].unique()
-                if col not in orders:
-                    orders[col] = list(uniques)
-                else:
-                    for val in uniques:
-                        if val not in orders[col]:
-                            orders[col].append(val)
-                group_values[col] = sorted(uniques, key=orders[col].index)
 
+    # Encode rows with dense codes of their group. Rows with missing values in a
+    # grouper column are left out, like with DataFrame.groupby
+    codes = np.zeros(len(df), dtype=np.intp)
+    missing = np.zeros(len(df), dtype=bool)
+    col_codes = {}
+    col_uniques = {}
+    for col in grouper:
+        if col == one_group or col in col_codes:
+            continue
+
+        col_codes[col], col_uniques[col] = factorize(df[col])
+        codes = factorize(codes * len(col_uniques[col]) + col_codes[col])[0]
+        missing |= col_codes[col] < 0
+
+        uniques = list(unique(df[col]))
+        if col not in orders:
+            orders[col] = uniques
+        else:
+            ordered = set(orders[col])
+            orders[col] = list(orders[col]) + [
+                val for val in uniques if val not in ordered and val not in orders[col]
+            ]
+        positions = _get_positions(orders[col])
+        group_values[col] = sorted(
+            uniques, key=lambda val: _get_position(positions, orders[col], val)
+        )
+
+    # Row positions of each group, from a single stable sort of the group codes
+    codes[missing] = -1
+    order = np.argsort(codes, kind="mergesort")
+    order = order[np.count_nonzero(missing) :]
+    counts = np.bincount(codes[order]) if len(order) else np.array([], dtype=int)
+    stops = np.cumsum(counts)
+    starts = stops - counts
+
+    # Skip the codes of groups that only had rows with missing values
+    nonempty = np.flatnonzero(counts)
+    counts, starts, stops = counts[nonempty], starts[nonempty], stops[nonempty]
+
+    # Group names, from the values of the first row of each group
+    first_rows = order[starts]
+    group_names = list(
+        zip(
+            *[
+                [""] * len(first_rows)
+                if col == one_group
+                else col_uniques[col].take(col_codes[col][first_rows]).tolist()
+                for col in grouper
+            ]
+        )
+    )
+
+    group_inds = list(range(len(group_names)))
     for i, col in reversed(list(enumerate(grouper))):
         if col != one_group:
-            group_names = sorted(
-                group_names,
-                key=lambda g: orders[col].index(g[i]) if g[i] in orders[col] else -1,
+            positions = _get_positions(orders[col])
+            group_inds = sorted(
+                group_inds,
+                key=lambda g: _get_position(positions, orders[col], group_names[g][i]),
             )
 
-    return orders, group_names, group_values
+    groups = OrderedDict()
+    for g in group_inds:
+        if counts[g] == len(df):
+            groups[group_names[g]] = None
+        else:
+            groups[group_names[g]] = order[starts[g] : stops[g]]
+
+    return groups, orders, group_values
+
+
+def _get_positions(values):
+    """
+    Return a dict from the hashable values of a list to the position of their
+    first occurrence
+    """
+    positions = {}
+    for i, val in enumerate(values):
+        positions.setdefault(val, i)
+    return positions
+
+
+def _get_position(positions, values, val):
+    """
+    Return the position of the first occurrence of val in values, or -1 if it
+    is not in values, using the positions computed by _get_positions
+    """
+    position = positions.get(val)
+    if position is None:
+        # Fall back on equality for values that hash differently, e.g.
+        # Timestamps and datetime64 values
+        position = values.index(val) if val in values else -1
+    return position
+
+
+def get_trendline_fits(args, groups):
+    """
+    Fit the trendlines of all groups at once
+
+    Returns a dict from group names to the x values, y values and fit results
+    of their trendline
+    """
+    if args.get("trendline") not in ["ols", "lowess"] or not (args["x"] and args["y"]):
+        return {}
+
+    engine = args["trendline_engine"]
+    if engine not in ["numpy", "statsmodels"]:
+        raise ValueError(
+            "Invalid value for argument 'trendline_engine': %s. "
+            "Must be 'numpy' or 'statsmodels'." % repr(engine)
+        )
+
+    df = args["data_frame"]
+    fits = fit_trendlines(
+        args["trendline"],
+        _column_values(df[args["x"]]),
+        _column_values(df[args["y"]]),
+        list(groups.values()),
+        engine=engine,
+    )
+    return dict(zip(groups, fits))
+
+
+def get_histogram_bin_letters(args, trace_spec):
+    """
+    Letters of the axes along which a histogram trace spec bins its rows
+    """
+    if trace_spec.constructor == go.Histogram2d:
+        return ["x", "y"]
+    if trace_spec.marginal:
+        return [trace_spec.marginal]
+    return ["x" if args["orientation"] == "v" else "y"]
+
+
+def get_histogram_bins(args, trace_specs, groups, grouped_mappings):
+    """
+    Compute the bins of preaggregated histograms
+
+    Like in plotly.js, bins are shared by all the traces of a bingroup, and are
+    computed separately for each animation frame.
+
+    Returns a dict from frame names to dicts from axis letters to BinSpec
+    """
+    raster_bins = get_raster_bins(args)
+    if not (args.get("preaggregate") or raster_bins):
+        return {}
+
+    frame_index = None
+    for i, m in enumerate(grouped_mappings):
+        if m.variable == "animation_frame":
+            frame_index = i
+    frame_rows = OrderedDict()
+    for group_name, group_rows in groups.items():
+        frame_name = "" if frame_index is None else group_name[frame_index]
+        frame_rows.setdefault(frame_name, []).append(group_rows)
+
+    letters = []
+    for trace_spec in trace_specs:
+        if trace_spec.constructor in [go.Histogram, go.Histogram2d]:
+            for letter in get_histogram_bin_letters(args, trace_spec):
+                if letter not in letters:
+                    letters.append(letter)
+    for letter in letters:
+        if args["log_" + letter]:
+            raise ValueError(
+                "preaggregate=True does not support log_%s=True on the axis of "
+                "the bins" % letter
+            )
+
+    nbins = dict(x=args.get("nbinsx"), y=args.get("nbinsy"))
+    if "nbins" in args:
+        nbins[get_histogram_bin_letters(args, trace_specs[0])[0]] = args["nbins"]
+    is2d = trace_specs[0].constructor == go.Histogram2d
+
+    df = args["data_frame"]
+    bins = {}
+    for frame_name, group_rows in frame_rows.items():
+        if raster_bins:
+            # Pixels are shared by all the frames
+            bins[frame_name] = dict(zip("xy", raster_bins))
+            continue
+        bins[frame_name] = {}
+        for letter in letters:
+            if args[letter] is None:
+                continue
+            values = np.asarray(_column_values(df[args[letter]]))
+            if all(rows is not None for rows in group_rows):
+                values = values[np.concatenate(group_rows)]
+            bins[frame_name][letter] = auto_bin(values, nbins[letter], is2d)
+    return bins
+
+
+def get_bin_positions(spec):
+    """
+    Positions of the centers of bins on their axis
+    """
+    if spec.categories is not None:
+        return np.array(spec.categories, dtype=object)
+    return spec.start + (np.arange(spec.nbins) + 0.5) * spec.size
+
+
+def make_preaggregated_trace_kwargs(args, trace_spec, trace_patch, bins):
+    """
+    Replace the rows of a histogram or 2D histogram trace patch by the bins and
+    aggregated values of a bar or heatmap trace patch
+
+    Aggregation follows the histfunc, histnorm and cumulative options of the
+    patch, like plotly.js.
+
+    Parameters
+    ----------
+    args : dict
+        args to be used for the trace
+    trace_spec : NamedTuple
+        Histogram or Histogram2d trace spec
+    trace_patch : dict
+        trace patch computed by make_trace_kwargs
+    bins : dict
+        BinSpec of each axis letter, as computed by get_histogram_bins
+
+    Returns
+    -------
+    trace_patch : dict
+        dict to be used to update a bar or heatmap trace
+    """
+    trace_patch = trace_patch.copy()
+    histfunc = trace_patch.pop("histfunc", None) or "count"
+    histnorm = trace_patch.pop("histnorm", None)
+    cumulative = (trace_patch.pop("cumulative", None) or {}).get("enabled")
+    for key in ["nbinsx", "nbinsy", "bingroup", "xbingroup", "ybingroup"]:
+        trace_patch.pop(key, None)
+
+    if trace_spec.constructor == go.Histogram2d:
+        marker = trace_patch.pop("marker", {})
+        if "opacity" in marker:
+            trace_patch["opacity"] = marker["opacity"]
+        x = trace_patch.pop("x", None)
+        y = trace_patch.pop("y", None)
+        z = trace_patch.pop("z", None)
+        if x is None or y is None:
+            return trace_patch
+
+        x_spec, y_spec = bins["x"], bins["y"]
+        x_inds = bin_indexes(np.asarray(x), x_spec)
+        y_inds = bin_indexes(np.asarray(y), y_spec)
+        inds = np.where(
+            (x_inds >= 0) & (y_inds >= 0), y_inds * x_spec.nbins + x_inds, -1
+        )
+        values = None if z is None else np.asarray(z)
+        z = aggregate(inds, values, histfunc, x_spec.nbins * y_spec.nbins)
+        z = normalize(z, histnorm, x_spec.size * y_spec.size)
+        trace_patch["x"] = get_bin_positions(x_spec)
+        trace_patch["y"] = get_bin_positions(y_spec)
+        trace_patch["z"] = z.reshape(y_spec.nbins, x_spec.nbins)
+        return trace_patch
+
+    letter = get_histogram_bin_letters(args, trace_spec)[0]
+    other_letter = "y" if letter == "x" else "x"
+    trace_patch["orientation"] = "v" if letter == "x" else "h"
+    sample = trace_patch.pop(letter, None)
+    counter = trace_patch.pop(other_letter, None)
+    if sample is None:
+        return trace_patch
+
+    spec = bins[letter]
+    sample = np.asarray(sample)
+    inds = bin_indexes(sample, spec)
+    values = None if counter is None else np.asarray(counter)
+    sizes = normalize(
+        aggregate(inds, values, histfunc, spec.nbins), histnorm, spec.size
+    )
+    if cumulative:
+        sizes = accumulate(sizes)
+
+    # Like plotly.js, empty bins at the ends are not displayed
+    nonzero = np.flatnonzero(np.nan_to_num(sizes))
+    keep = slice(nonzero[0], nonzero[-1] + 1) if len(nonzero) else slice(0, 0)
+    trace_patch[letter] = get_bin_positions(spec)[keep]
+    trace_patch[other_letter] = sizes[keep]
+    if len(nonzero) and nonzero[0] == nonzero[-1]:
+        trace_patch["width"] = spec.size
+
+    if spec.categories is None and not cumulative:
+        # Hover the span of bins rather than their centers
+        labels = bin_span_labels(sample, inds, spec)
+        trace_patch["hovertext"] = labels[keep]
+        trace_patch["hovertemplate"] = trace_patch["hovertemplate"].replace(
+            "%{" + letter + "}", "%{hovertext}"
+        )
+    return trace_patch
+
+
+def get_preaggregated_bargap(args, trace_specs, frame_list, barmode):
+    """
+    Return the default bargap of preaggregated histograms, or None
+
+    Like plotly.js histograms, bars of numeric bins have no gap, unless bars
+    of several traces are grouped on a subplot.
+    """
+    letters = [
+        get_histogram_bin_letters(args, trace_spec)[0]
+        for trace_spec in trace_specs
+        if trace_spec.constructor == go.Histogram
+    ]
+    df = args["data_frame"]
+    if not any(
+        args[letter] is not None and df[args[letter]].dtype.kind in "iuf"
+        for letter in letters
+    ):
+        return None
+
+    if barmode == "group" and frame_list:
+        subplots = [
+            (trace._subplot_row, trace._subplot_col)
+            for trace in frame_list[0]["data"]
+            if isinstance(trace, go.Bar)
+        ]
+        if len(subplots) > len(set(subplots)):
+            return None
+    return 0
+
+
+def get_raster_bins(args):
+    """
+    Return the columns and rows of pixels of rasterized figures, shared by all
+    subplots and frames, or None
+    """
+    if args.get("render_mode") != "raster":
+        return None
+
+    df = args["data_frame"]
+    for letter in ["x", "y"]:
+        if args[letter] is None or df[args[letter]].dtype.kind not in "iuf":
+            raise ValueError(
+                "render_mode='raster' requires numeric x and y columns, received "
+                "%s=%s" % (letter, repr(args[letter]))
+            )
+        if args["log_" + letter]:
+            raise ValueError(
+                "render_mode='raster' does not support log_%s=True" % letter
+            )
+
+    # Pixels of a facet of the figure
+    ncols = nrows = 1
+    if args.get("facet_col"):
+        ncols = len(factorize(df[args["facet_col"]])[1])
+        if args.get("facet_col_wrap"):
+            nrows = -(-ncols // args["facet_col_wrap"])
+            ncols = min(ncols, args["facet_col_wrap"])
+    if args.get("facet_row"):
+        nrows = len(factorize(df[args["facet_row"]])[1])
+    template_layout = args["template"].layout
+    width = args["width"] or template_layout.width or default_width
+    height = args["height"] or template_layout.height or default_height
+    return (
+        pixel_bins(
+            _column_values(df[args["x"]]), max(int(width // ncols), 1), args["range_x"]
+        ),
+        pixel_bins(
+            _column_values(df[args["y"]]), max(int(height // nrows), 1), args["range_y"]
+        ),
+    )
+
+
+def add_to_raster(args, canvas, trace_props, trace_data):
+    """
+    Add the rows of a scatter or line trace to a raster canvas, with the color
+    of the trace properties or the values of a continuous color
+    """
+    x = _column_values(trace_data[args["x"]])
+    y = _column_values(trace_data[args["y"]])
+    lines = "line_group" in args
+    if args.get("color_is_continuous"):
+        canvas.add(x, y, values=_column_values(trace_data[args["color"]]), lines=lines)
+    else:
+        color = trace_props.get("line" if lines else "marker", {}).get("color")
+        canvas.add(x, y, color=color or args["color_discrete_sequence"][0], lines=lines)
+
+
+def make_raster_trace(args, canvas):
+    """
+    Return an image trace of the blended colors of the points of a canvas, or
+    a heatmap trace of the average of their continuous color
+    """
+    hover_lines = [
+        "%s=%%{%s}" % (get_label(args, args[letter]), letter) for letter in "xy"
+    ]
+    if canvas.value_sums is not None:
+        hover_lines.append(
+            "%s=%%{z}" % get_decorated_label(args, args["color"], "color")
+        )
+        trace = go.Heatmap(canvas.to_heatmap(), coloraxis="coloraxis1")
+    else:
+        trace = go.Image(canvas.to_image(opacity=args.get("opacity")))
+    trace.hovertemplate = "<br>".join(hover_lines) + "<extra></extra>"
+    return trace
 
 
 def make_figure(args, constructor, trace_patch={}, layout_patch={}):
@@ -1432,11 +2040,7 @@ def make_figure(args, constructor, trace_patch={}, layout_patch={}):
         args, constructor, trace_patch
     )
     grouper = [x.grouper or one_group for x in grouped_mappings] or [one_group]
-    grouped = args["data_frame"].groupby(grouper, sort=False)
-
-    orders, sorted_group_names, sorted_group_values = get_orderings(
-        args, grouper, grouped
-    )
+    groups, orders, sorted_group_values = get_groups_and_orders(args, grouper)
 
     col_labels = []
     row_labels = []
@@ -1458,10 +2062,21 @@ def make_figure(args, constructor, trace_patch={}, layout_patch={}):
     trace_names_by_frame = {}
     frames = OrderedDict()
     trendline_rows = []
+    trendline_fits = get_trendline_fits(args, groups)
+    histogram_bins = get_histogram_bins(args, trace_specs, groups, grouped_mappings)
+    raster_bins = None
+    if constructor == go.Scatter:
+        raster_bins = get_raster_bins(args)
+    raster_canvases = OrderedDict()
+    prototypes = {}
+    accepted = {}
     nrows = ncols = 1
     trace_name_labels = None
-    for group_name in sorted_group_names:
-        group = grouped.get_group(group_name if len(group_name) > 1 else group_name[0])
+    for group_name, group_rows in groups.items():
+        if group_rows is None:
+            group = args["data_frame"]
+        else:
+            group = args["data_frame"].take(group_rows)
         mapping_labels = OrderedDict()
         trace_name_labels = OrderedDict()
         frame_name = ""
@@ -1494,8 +2109,19 @@ def make_figure(args, constructor, trace_patch={}, layout_patch={}):
                         if constructor_to_use == go.Scatter
                         else go.Scatterpolargl
                     )
-            # Create the trace
-            trace = constructor_to_use(name=trace_name)
+            if histogram_bins:
+                # Bins are aggregated in Python and displayed as bars or heatmaps
+                if constructor_to_use == go.Histogram:
+                    constructor_to_use = go.Bar
+                elif constructor_to_use == go.Histogram2d:
+                    constructor_to_use = go.Heatmap
+            if constructor_to_use not in prototypes:
+                prototypes[constructor_to_use] = constructor_to_use()
+            prototype = prototypes[constructor_to_use]
+
+            # The properties of the trace are gathered in a dict, and the trace
+            # is built and validated once from it
+            trace_props = dict(name=trace_name)
             if trace_spec.constructor not in [
                 go.Parcats,
                 go.Parcoords,
@@ -1506,50 +2132,53 @@ def make_figure(args, constructor, trace_patch={}, layout_patch={}):
                 go.Sunburst,
                 go.Treemap,
             ]:
-                trace.update(
+                trace_props.update(
                     legendgroup=trace_name,
                     showlegend=(trace_name != "" and trace_name not in trace_names),
                 )
             if trace_spec.constructor in [go.Bar, go.Violin, go.Box, go.Histogram]:
-                trace.update(alignmentgroup=True, offsetgroup=trace_name)
+                trace_props.update(alignmentgroup=True, offsetgroup=trace_name)
             trace_names.add(trace_name)
 
             # Init subplot row/col
-            trace._subplot_row = 1
-            trace._subplot_col = 1
+            subplot_row = 1
+            subplot_col = 1
 
             for i, m in enumerate(grouped_mappings):
                 val = group_name[i]
                 if val not in m.val_map:
                     m.val_map[val] = m.sequence[len(m.val_map) % len(m.sequence)]
-                try:
-                    m.updater(trace, m.val_map[val])  # covers most cases
-                except ValueError:
-                    # this catches some odd cases like marginals
-                    if (
-                        trace_spec != trace_specs[0]
-                        and trace_spec.constructor in [go.Violin, go.Box, go.Histogram]
-                        and m.variable == "symbol"
-                    ):
-                        pass
-                    elif (
-                        trace_spec != trace_specs[0]
-                        and trace_spec.constructor in [go.Histogram]
-                        and m.variable == "color"
-                    ):
-                        trace.update(marker=dict(color=m.val_map[val]))
-                    elif (
-                        trace_spec.constructor in [go.Choropleth, go.Choroplethmapbox]
-                        and m.variable == "color"
-                    ):
-                        trace.update(
-                            z=[1] * len(group),
-                            colorscale=[m.val_map[val]] * 2,
-                            showscale=False,
-                            showlegend=True,
-                        )
-                    else:
-                        raise
+                patch = m.updater(m.val_map[val])
+                if (constructor_to_use, i) not in accepted:
+                    accepted[constructor_to_use, i] = _accepts_props(prototype, patch)
+                if accepted[constructor_to_use, i]:
+                    _merge_props(trace_props, patch)  # covers most cases
+                # The remaining cases are some odd ones like marginals
+                elif (
+                    trace_spec != trace_specs[0]
+                    and trace_spec.constructor in [go.Violin, go.Box, go.Histogram]
+                    and m.variable == "symbol"
+                ):
+                    pass
+                elif (
+                    trace_spec != trace_specs[0]
+                    and trace_spec.constructor in [go.Histogram]
+                    and m.variable == "color"
+                ):
+                    _merge_props(trace_props, dict(marker=dict(color=m.val_map[val])))
+                elif (
+                    trace_spec.constructor in [go.Choropleth, go.Choroplethmapbox]
+                    and m.variable == "color"
+                ):
+                    trace_props.update(
+                        z=[1] * len(group),
+                        colorscale=[m.val_map[val]] * 2,
+                        showscale=False,
+                        showlegend=True,
+                    )
+                else:
+                    # Invalid properties raise when the trace is built
+                    _merge_props(trace_props, patch)
 
                 # Find row for trace, handling facet_row and marginal_x
                 if m.facet == "row":
@@ -1578,34 +2207,80 @@ def make_figure(args, constructor, trace_patch={}, layout_patch={}):
 
                 nrows = max(nrows, row)
                 if row > 1:
-                    trace._subplot_row = row
+                    subplot_row = row
 
                 ncols = max(ncols, col)
                 if col > 1:
-                    trace._subplot_col = col
+                    subplot_col = col
             if (
                 trace_specs[0].constructor == go.Histogram2dContour
                 and trace_spec.constructor == go.Box
-                and trace.line.color
+                and trace_props.get("line", {}).get("color")
             ):
-                trace.update(marker=dict(color=trace.line.color))
+                _merge_props(
+                    trace_props, dict(marker=dict(color=trace_props["line"]["color"]))
+                )
 
-            patch, fit_results = make_trace_kwargs(
-                args, trace_spec, group, mapping_labels.copy(), sizeref
-            )
-            trace.update(patch)
-            if fit_results is not None:
-                trendline_rows.append(mapping_labels.copy())
-                trendline_rows[-1]["px_fit_results"] = fit_results
+            if raster_bins and trace_spec is trace_specs[0]:
+                # The rows are drawn on the canvas of the subplot, and the
+                # trace only remains as a legend item
+                key = (frame_name, subplot_row, subplot_col)
+                if key not in raster_canvases:
+                    raster_canvases[key] = RasterCanvas(*raster_bins)
+                add_to_raster(args, raster_canvases[key], trace_props, group)
+                if not trace_props.get("showlegend"):
+                    continue
+                trace_props.update(x=[None], y=[None])
+            else:
+                patch, fit_results = make_trace_kwargs(
+                    args,
+                    trace_spec,
+                    group,
+                    mapping_labels.copy(),
+                    sizeref,
+                    trendline_fit=trendline_fits.get(group_name),
+                )
+                if histogram_bins and trace_spec.constructor in [
+                    go.Histogram,
+                    go.Histogram2d,
+                ]:
+                    patch = make_preaggregated_trace_kwargs(
+                        args, trace_spec, patch, histogram_bins[frame_name]
+                    )
+                _merge_props(trace_props, patch)
+                if fit_results is not None:
+                    trendline_rows.append(mapping_labels.copy())
+                    trendline_rows[-1]["px_fit_results"] = fit_results
+
+            # Create the trace
+            trace = constructor_to_use(trace_props)
+            trace._subplot_row = subplot_row
+            trace._subplot_col = subplot_col
             if frame_name not in frames:
                 frames[frame_name] = dict(data=[], name=frame_name)
             frames[frame_name]["data"].append(trace)
+    raster_traces_by_frame = OrderedDict()
+    for (frame_name, row, col), canvas in raster_canvases.items():
+        trace = make_raster_trace(args, canvas)
+        trace._subplot_row = row
+        trace._subplot_col = col
+        raster_traces_by_frame.setdefault(frame_name, []).append(trace)
+    for frame_name, raster_traces in raster_traces_by_frame.items():
+        if frame_name not in frames:
+            frames[frame_name] = dict(data=[], name=frame_name)
+        frames[frame_name]["data"][:0] = raster_traces
     frame_list = [f for f in frames.values()]
     if len(frame_list) > 1:
         frame_list = sorted(
             frame_list, key=lambda f: orders[args["animation_frame"]].index(f["name"])
         )
     layout_patch = layout_patch.copy()
+    if histogram_bins and args["template"].layout.bargap is None:
+        bargap = get_preaggregated_bargap(
+            args, trace_specs, frame_list, layout_patch.get("barmode")
+        )
+        if bargap is not None:
+            layout_patch["bargap"] = bargap
     if show_colorbar:
         colorvar = "z" if constructor in [go.Histogram2d, go.Densitymapbox] else "color"
         range_color = args["range_color"] or [None, None]
@@ -1659,19 +2334,78 @@ def make_figure(args, constructor, trace_patch={}, layout_patch={}):
             )
 
     # Add traces, layout and frames to figure
-    fig.add_traces(frame_list[0]["data"] if len(frame_list) > 0 else [])
+    if len(frames) > 1:
+        # The traces of the first frame are also the data of the figure
+        fig.add_traces(frame_list[0]["data"])
+    else:
+        fig._add_validated_traces(frame_list[0]["data"] if len(frame_list) > 0 else [])
     fig.update_layout(layout_patch)
     if "template" in args and args["template"] is not None:
         fig.update_layout(template=args["template"], overwrite=True)
-    fig.frames = frame_list if len(frames) > 1 else []
+    if len(frames) > 1:
+        # The traces of the first frame were copied into the figure, and the
+        # frames only keep the properties that change during the animation
+        remove_invariant_frame_props(frame_list)
+        fig._set_validated_frames(make_frames(frame_list))
 
-    fig._px_trendlines = pd.DataFrame(trendline_rows)
+    fig._px_trendlines = trendline_rows
 
     configure_axes(args, constructor, fig, orders)
     configure_animation_controls(args, constructor, fig)
+    if raster_canvases and not args["range_y"]:
+        # y axes of images are reversed by default
+        fig.update_yaxes(autorange=True)
     return fig
 
 
+def remove_invariant_frame_props(frame_list):
+    """
+    Remove from the traces of frames the properties that are the same in all
+    the frames
+
+    When animating, the traces of a frame are merged into the traces of the
+    figure, so these properties only need to be in the traces of the figure.
+    Traces at the same position in the frames are compared.
+    """
+    for i in range(min(len(frame["data"]) for frame in frame_list)):
+        traces = [frame["data"][i] for frame in frame_list]
+        if len(set(trace.type for trace in traces)) == 1:
+            _remove_invariant_props([trace._props for trace in traces])
+
+
+def _remove_invariant_props(props_list):
+    first = props_list[0]
+    for key in list(first):
+        if key == "type" or not all(key in props for props in props_list):
+            continue
+        values = [props[key] for props in props_list]
+        if all(isinstance(value, dict) for value in values):
+            # Nested properties are merged separately, e.g. marker.color
+            _remove_invariant_props(values)
+            if any(values):
+                continue
+        elif not all(
+            value is values[0] or BasePlotlyType._vals_equal(values[0], value)
+            for value in values[1:]
+        ):
+            continue
+        for props in props_list:
+            del props[key]
+
+
+def make_frames(frame_list):
+    """
+    Build Frame objects from dicts of frame names and traces, taking the
+    traces as they are rather than validating and copying them again
+    """
+    frame_objs = []
+    for frame in frame_list:
+        frame_obj = go.Frame(name=frame["name"])
+        frame_obj._adopt_array_prop("data", frame["data"])
+        frame_objs.append(frame_obj)
+    return frame_objs
+
+
 def init_figure(args, subplot_type, frame_list, nrows, ncols, col_labels, row_labels):
     # Build subplot specs
     specs = [[{}] * ncols for _ in range(nrows)]
@@ -368,13 +368,25 @@ docs = dict(
         "Valid CSS color.",
         "If provided, and if `trendline` is set, all trendlines will be drawn in this color.",
     ],
+    trendline_engine=[
+        "str (default `'numpy'`)",
+        "One of `'numpy'` or `'statsmodels'`.",
+        "If `'numpy'`, trendlines of all groups are fitted together with numpy,",
+        "and `'lowess'` trendlines of groups of more than 2000 points are fitted to the averages of 2000 bins of points.",
+        "If `'statsmodels'`, each trendline is fitted with `statsmodels` (which must be installed),",
+        "and `px.get_trendline_results` returns `statsmodels` results objects.",
+    ],
     render_mode=[
         "str",
-        "One of `'auto'`, `'svg'` or `'webgl'`, default `'auto'`",
+        "One of `'auto'`, `'svg'`, `'webgl'` or `'raster'`, default `'auto'`",
         "Controls the browser API used to draw marks.",
         "`'svg`' is appropriate for figures of less than 1000 data points, and will allow for fully-vectorized output.",
         "`'webgl'` is likely necessary for acceptable performance above 1000 points but rasterizes part of the output. ",
         "`'auto'` uses heuristics to choose the mode.",
+        "`'raster'` aggregates the rows of each subplot on a grid of `width` by `height` pixels in Python,",
+        "and draws an image of the blended colors of the points (or the average of a continuous color),",
+        "or for density heatmaps a heatmap of one bin per pixel, so that figures of millions of points stay small.",
+        "Requires numeric `x` and `y` columns without logarithmic axes.",
     ],
     direction=[
         "str",
@@ -499,6 +511,13 @@ docs = dict(
     nbins=["int", "Positive integer.", "Sets the number of bins."],
     nbinsx=["int", "Positive integer.", "Sets the number of bins along the x axis."],
     nbinsy=["int", "Positive integer.", "Sets the number of bins along the y axis."],
+    preaggregate=[
+        "boolean (default `False`)",
+        "If `True`, bins are computed and aggregated in Python like in the browser,",
+        "and the figure contains bar or heatmap traces of the bins instead of histogram traces of all the rows,",
+        "which keeps figures of large data frames small.",
+        "Bins cannot be dates or on a logarithmic axis.",
+    ],
     branchvalues=[
         "str",
         "'total' or 'remainder'",
@@ -1,15 +1,10 @@
 import plotly.graph_objs as go
-from _plotly_utils.basevalidators import ColorscaleValidator
+from _plotly_utils.basevalidators import ColorscaleValidator, ImageUriValidator
+from _plotly_utils.optional_imports import get_module
 from ._core import apply_default_cascade
+import math
 import numpy as np
 
-try:
-    import xarray
-
-    xarray_imported = True
-except ImportError:
-    xarray_imported = False
-
 _float_types = []
 
 # Adapted from skimage.util.dtype
@@ -63,6 +58,68 @@ def _infer_zmax_from_type(img):
             return 2 ** 32
 
 
+def _rescale_to_uint8(img, zmin, zmax):
+    """
+    Rescale the values of img from [zmin, zmax] to [0, 255], clipping values
+    outside of this range. zmin and zmax are scalars, or have one value per
+    channel of the image.
+    """
+    zmin = np.asarray(zmin, dtype="float32")
+    zmax = np.asarray(zmax, dtype="float32")
+    if img.dtype == np.uint8 and np.all(zmin == 0) and np.all(zmax == 255):
+        return img
+    rescaled = img.astype("float32")
+    rescaled -= zmin
+    rescaled *= 255 / np.where(zmax > zmin, zmax - zmin, 255)
+    # Values are rounded, and missing values are black
+    rescaled += 0.5
+    np.clip(rescaled, 0, 255, out=rescaled)
+    rescaled[np.isnan(rescaled)] = 0
+    return rescaled.astype(np.uint8)
+
+
+def _image_to_uri(img, binary_format, max_size):
+    """
+    Encode an array of uint8 values as a png or jpeg data URI, downscaled so
+    that its width and height are at most max_size pixels
+    """
+    pil_image_module = get_module("PIL.Image")
+    if pil_image_module is None:
+        raise ImportError("px.imshow with binary_string=True requires Pillow")
+    image = pil_image_module.fromarray(img)
+    if max_size and max(img.shape[:2]) > max_size:
+        scale = float(max_size) / max(img.shape[:2])
+        size = (
+            max(1, int(round(img.shape[1] * scale))),
+            max(1, int(round(img.shape[0] * scale))),
+        )
+        image = image.resize(size, resample=pil_image_module.BOX)
+    return ImageUriValidator.pil_image_to_uri(image, binary_format)
+
+
+def _regular_coordinates(values, n, name):
+    """
+    Return the position of the first pixel and the size of pixels along an
+    axis, from the coordinates of the pixels
+    """
+    if values is None:
+        return 0, 1
+    values = np.asarray(values)
+    if values.dtype.kind not in "iuf":
+        raise ValueError(
+            "px.imshow with binary_string=True requires numeric %s coordinates" % name
+        )
+    if n == 1:
+        return values[0], 1
+    step = (values[-1] - values[0]) / float(n - 1)
+    if not np.allclose(np.diff(values), step):
+        raise ValueError(
+            "px.imshow with binary_string=True requires evenly spaced %s "
+            "coordinates" % name
+        )
+    return values[0], step
+
+
 def imshow(
     img,
     zmin=None,
@@ -79,6 +136,10 @@ def imshow(
     width=None,
     height=None,
     aspect=None,
+    binary_string=False,
+    binary_format="png",
+    binary_max_size=None,
+    binary_hover_max_size=None,
 ):
     """
     Display an image, i.e. data on a 2D regular raster.
@@ -154,6 +215,26 @@ def imshow(
       - if None, 'equal' is used for numpy arrays and 'auto' for xarrays
         (which have typically heterogeneous coordinates)
 
+    binary_string: bool (default False)
+        If True, the image is encoded as a compressed png or jpeg image, with
+        the contrast rescaling of zmin and zmax applied, and displayed as a
+        layout image rather than sent as an array of values. Single-channel
+        images are displayed in grayscale, without a color scale. Requires
+        Pillow.
+
+    binary_format: str, 'png' (default) or 'jpg'
+        Format of the image when binary_string is True. jpg images are
+        smaller but lossy, and have no transparency.
+
+    binary_max_size: int, optional
+        If binary_string is True, images wider or higher than this number of
+        pixels are downscaled to this size before being encoded.
+
+    binary_hover_max_size: int, optional
+        If binary_string is True, values of the image are displayed on hover
+        by a transparent trace of a subsample of the pixels, with at most this
+        number of pixels along each dimension. There is no hover by default.
+
     Returns
     -------
     fig : graph_objects.Figure containing the displayed image
@@ -176,7 +257,9 @@ def imshow(
     args = locals()
     apply_default_cascade(args)
     labels = labels.copy()
-    if xarray_imported and isinstance(img, xarray.DataArray):
+    # An xarray can only be passed if xarray is already imported
+    xarray = get_module("xarray", should_load=False)
+    if xarray is not None and isinstance(img, xarray.DataArray):
         y_label, x_label = img.dims[0], img.dims[1]
         # np.datetime64 is not handled correctly by go.Heatmap
         for ax in [x_label, y_label]:
@@ -208,7 +291,7 @@ def imshow(
     img = np.asanyarray(img)
 
     # Cast bools to uint8 (also one byte)
-    if img.dtype == np.bool:
+    if img.dtype == np.bool_:
         img = 255 * img.astype(np.uint8)
 
     # For 2d data, use Heatmap trace
@@ -261,6 +344,76 @@ def imshow(
             "An image of shape %s was provided" % str(img.shape)
         )
 
+    if binary_string:
+        # The image is displayed as a compressed layout image covering the
+        # pixels of the trace, which is only kept, subsampled, for hover
+        height, width = img.shape[:2]
+        if img.ndim == 2:
+            zmin, zmax = range_color
+            if zmin is None or zmax is None:
+                finite = img[np.isfinite(img)]
+                if zmin is None:
+                    zmin = finite.min() if len(finite) else 0
+                if zmax is None:
+                    zmax = finite.max() if len(finite) else 0
+            rescaled = _rescale_to_uint8(img, zmin, zmax)
+            x0, dx = _regular_coordinates(x, width, "x")
+            y0, dy = _regular_coordinates(y, height, "y")
+            layout.pop("coloraxis1")
+        else:
+            n_channels = img.shape[-1]
+            rescaled = _rescale_to_uint8(
+                img, (zmin or [0] * 4)[:n_channels], zmax[:n_channels]
+            )
+            x0, dx, y0, dy = 0, 1, 0, 1
+        first_edges = [x0 - dx / 2.0, y0 - dy / 2.0]
+        last_edges = [x0 + (width - 0.5) * dx, y0 + (height - 0.5) * dy]
+        if origin == "lower":
+            # The first row is at the bottom of the image
+            rescaled = rescaled[::-1]
+            y_range = [first_edges[1], last_edges[1]]
+        else:
+            y_range = [last_edges[1], first_edges[1]]
+        layout["images"] = [
+            dict(
+                source=_image_to_uri(rescaled, binary_format, binary_max_size),
+                xref="x",
+                yref="y",
+                x=first_edges[0],
+                y=y_range[1],
+                sizex=abs(width * dx),
+                sizey=abs(height * dy),
+                xanchor="left",
+                yanchor="top",
+                sizing="stretch",
+                layer="below",
+            )
+        ]
+        layout["xaxis"] = dict(
+            range=[first_edges[0], last_edges[0]], showgrid=False, zeroline=False
+        )
+        layout["yaxis"] = dict(range=y_range, showgrid=False, zeroline=False)
+        if aspect == "equal":
+            layout["xaxis"].update(scaleanchor="y", constrain="domain")
+            layout["yaxis"]["constrain"] = "domain"
+
+        if binary_hover_max_size:
+            step = int(math.ceil(max(height, width) / float(binary_hover_max_size)))
+            hover_kwargs = dict(
+                z=img[::step, ::step],
+                x0=x0,
+                dx=dx * step,
+                y0=y0,
+                dy=dy * step,
+                opacity=0,
+            )
+            if img.ndim == 2:
+                trace = go.Heatmap(showscale=False, **hover_kwargs)
+            else:
+                trace = go.Image(zmin=trace.zmin, zmax=trace.zmax, **hover_kwargs)
+        else:
+            trace = []
+
     layout_patch = dict()
     for attr_name in ["height", "width"]:
         if args[attr_name]:
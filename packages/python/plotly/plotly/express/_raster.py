@@ -0,0 +1,205 @@
+"""
+Rasterization of plotly express figures
+
+With `render_mode="raster"`, the points (or line segments) of each subplot are
+aggregated onto a grid of pixels with numpy and displayed as a single image or
+heatmap trace aligned with the cartesian axes. The size of the figure then
+depends on the number of pixels rather than on the number of points.
+"""
+import numpy as np
+
+from plotly.colors import hex_to_rgb, unlabel_rgb
+from ._binning import BinSpec, bin_indexes
+
+# Size of the grid of pixels of figures without a width or height
+default_width = 700
+default_height = 450
+
+# Opacity of the pixels of a single point. Pixels of more points are more
+# opaque, on a logarithmic scale.
+min_alpha = 0.2
+
+# Maximum number of line segments drawn at once
+_segments_chunk_size = 100000
+
+
+def pixel_bins(values, n_pixels, value_range=None):
+    """
+    Return the BinSpec of a row or column of n_pixels pixels spanning
+    value_range, or the range of values
+    """
+    if value_range:
+        lo, hi = float(value_range[0]), float(value_range[1])
+    else:
+        values = np.asarray(values, dtype="float64")
+        values = values[np.isfinite(values)]
+        lo, hi = (values.min(), values.max()) if len(values) else (0.0, 1.0)
+    if hi <= lo:
+        lo, hi = lo - 0.5, hi + 0.5
+
+    # Slightly larger pixels so that values at the end of the range are in the
+    # last pixel
+    size = (hi - lo) / n_pixels * (1 + 1e-6)
+    return BinSpec(lo, lo + n_pixels * size, size, n_pixels, None)
+
+
+def parse_color(color):
+    """
+    Return the (r, g, b) values of a hex or rgb color
+    """
+    if color.startswith("#"):
+        return hex_to_rgb(color)
+    if color.startswith("rgb"):
+        return unlabel_rgb(color)
+    raise ValueError(
+        "render_mode='raster' requires hex or rgb colors, received %s" % repr(color)
+    )
+
+
+class RasterCanvas(object):
+    """
+    Aggregate of points on a grid of pixels
+
+    Parameters
+    ----------
+    x_bins : BinSpec
+        Columns of pixels
+    y_bins : BinSpec
+        Rows of pixels
+    """
+
+    def __init__(self, x_bins, y_bins):
+        self.x_bins = x_bins
+        self.y_bins = y_bins
+        n_pixels = x_bins.nbins * y_bins.nbins
+        self.counts = np.zeros(n_pixels)
+        self.rgb_sums = np.zeros((n_pixels, 3))
+        self.value_sums = None
+        self.value_counts = None
+
+    def add(self, x, y, color=None, values=None, lines=False):
+        """
+        Add points to the canvas
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Numeric x coordinates
+        y : numpy.ndarray
+            Numeric y coordinates
+        color : str
+            Hex or rgb color of the points, blended with the colors of other
+            points of the same pixels
+        values : numpy.ndarray
+            Values of the points, averaged by pixel
+        lines : bool
+            Whether to draw the segments between consecutive points
+        """
+        if lines:
+            inds = self._line_pixel_indexes(x, y)
+        else:
+            inds = self._pixel_indexes(x, y)
+        n_pixels = len(self.counts)
+        counts = np.bincount(inds[inds >= 0], minlength=n_pixels)
+        self.counts += counts
+        if color is not None:
+            self.rgb_sums += counts[:, None] * np.array(parse_color(color))[:3]
+        if values is not None:
+            values = np.asarray(values, dtype="float64")
+            valid = (inds >= 0) & ~np.isnan(values)
+            if self.value_sums is None:
+                self.value_sums = np.zeros(n_pixels)
+                self.value_counts = np.zeros(n_pixels)
+            self.value_sums += np.bincount(
+                inds[valid], values[valid], minlength=n_pixels
+            )
+            self.value_counts += np.bincount(inds[valid], minlength=n_pixels)
+
+    def _pixel_indexes(self, x, y):
+        x_inds = bin_indexes(np.asarray(x), self.x_bins)
+        y_inds = bin_indexes(np.asarray(y), self.y_bins)
+        return np.where(
+            (x_inds >= 0) & (y_inds >= 0), y_inds * self.x_bins.nbins + x_inds, -1
+        )
+
+    def _line_pixel_indexes(self, x, y):
+        """
+        Pixel indexes of points sampled along the segments between
+        consecutive points, at least one point per pixel
+        """
+        # Coordinates in pixels
+        x = (np.asarray(x, dtype="float64") - self.x_bins.start) / self.x_bins.size
+        y = (np.asarray(y, dtype="float64") - self.y_bins.start) / self.y_bins.size
+        finite = np.isfinite(x) & np.isfinite(y)
+        starts = np.flatnonzero(finite[:-1] & finite[1:])
+
+        # Points that do not start a segment, e.g. ends of lines
+        is_start = np.zeros(len(x), dtype=bool)
+        is_start[starts] = True
+        ends = np.flatnonzero(finite & ~is_start)
+        inds = [self._grid_indexes(x[ends], y[ends])]
+        for i in range(0, len(starts), _segments_chunk_size):
+            chunk = starts[i : i + _segments_chunk_size]
+            dx = x[chunk + 1] - x[chunk]
+            dy = y[chunk + 1] - y[chunk]
+            steps = np.maximum(np.ceil(np.maximum(abs(dx), abs(dy))), 1)
+            steps = steps.astype(np.intp)
+            segments = np.repeat(np.arange(len(chunk)), steps)
+            t = (
+                np.arange(len(segments)) - np.repeat(np.cumsum(steps) - steps, steps)
+            ) / steps[segments]
+            inds.append(
+                self._grid_indexes(
+                    x[chunk][segments] + t * dx[segments],
+                    y[chunk][segments] + t * dy[segments],
+                )
+            )
+        return np.concatenate(inds)
+
+    def _grid_indexes(self, x, y):
+        x = np.floor(x)
+        y = np.floor(y)
+        valid = (x >= 0) & (x < self.x_bins.nbins) & (y >= 0) & (y < self.y_bins.nbins)
+        return np.where(valid, y * self.x_bins.nbins + x, -1).astype(np.intp)
+
+    def _grid_position(self):
+        return dict(
+            x0=self.x_bins.start + self.x_bins.size / 2,
+            dx=self.x_bins.size,
+            y0=self.y_bins.start + self.y_bins.size / 2,
+            dy=self.y_bins.size,
+        )
+
+    def to_image(self, opacity=None):
+        """
+        Return the properties of an rgba image trace of the canvas, with the
+        average color of the points of each pixel, and an opacity increasing
+        with their number
+        """
+        shape = (self.y_bins.nbins, self.x_bins.nbins)
+        counts = self.counts
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rgb = self.rgb_sums / counts[:, None]
+            alpha = min_alpha + (1 - min_alpha) * np.log1p(counts) / np.log1p(
+                counts.max()
+            )
+        alpha[counts == 0] = 0
+        if opacity is not None:
+            alpha *= opacity
+        rgb[counts == 0] = 0
+
+        z = np.concatenate([np.round(rgb), np.round(alpha, 3)[:, None]], axis=1)
+        result = dict(z=z.reshape(shape + (4,)), colormodel="rgba")
+        result.update(self._grid_position())
+        return result
+
+    def to_heatmap(self):
+        """
+        Return the properties of a heatmap trace of the average value of the
+        points of each pixel, missing for pixels without points
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z = self.value_sums / self.value_counts
+        result = dict(z=z.reshape(self.y_bins.nbins, self.x_bins.nbins))
+        result.update(self._grid_position())
+        return result
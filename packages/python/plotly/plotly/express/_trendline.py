@@ -0,0 +1,312 @@
+"""
+Trendline fitting for plotly express
+
+Trendlines of all the groups of a figure are fitted together: the rows of the
+data frame are sorted once by group and x, ordinary least squares fits are
+computed for every group at once from grouped sums, and LOWESS fits are
+computed with numpy over each group's sorted rows. The "statsmodels" engine
+fits each group with statsmodels instead.
+"""
+import numpy as np
+
+# Above this number of points, LOWESS trendlines are fitted to the averages of
+# this number of equal-count bins of consecutive points
+lowess_max_points = 2000
+
+
+class OLSFitResults(object):
+    """
+    Results of an ordinary least squares trendline fit
+
+    Attributes
+    ----------
+    params : numpy.ndarray
+        Intercept and slope of the trendline
+    rsquared : float
+        Coefficient of determination of the fit
+    nobs : int
+        Number of points of the fit
+
+    Other attributes (e.g. `summary()` or `pvalues`) are those of the
+    statsmodels regression results of the same fit, which are computed on
+    first access and require the statsmodels package.
+    """
+
+    def __init__(self, x, y, params, rsquared):
+        self._x = x
+        self._y = y
+        self._statsmodels_results = None
+        self.params = params
+        self.rsquared = rsquared
+        self.nobs = len(x)
+
+    def predict(self):
+        """
+        Return the values of the trendline at the x values of the fit
+        """
+        return self.params[0] + self.params[1] * self._x
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if self._statsmodels_results is None:
+            import statsmodels.api as sm
+
+            self._statsmodels_results = sm.OLS(
+                self._y, sm.add_constant(self._x, has_constant="add")
+            ).fit()
+        return getattr(self._statsmodels_results, name)
+
+    def __repr__(self):
+        return "OLSFitResults(params={params}, rsquared={rsquared})".format(
+            params=self.params, rsquared=self.rsquared
+        )
+
+
+def fit_trendlines(trendline, x, y, group_rows, engine="numpy"):
+    """
+    Fit the trendlines of groups of rows of a data frame
+
+    Parameters
+    ----------
+    trendline : str
+        'ols' or 'lowess'
+    x : numpy.ndarray
+        x column of the data frame, numeric or datetime64
+    y : numpy.ndarray
+        y column of the data frame
+    group_rows : list
+        Integer positions of the rows of each group, or None for all the rows
+    engine : str
+        'numpy' or 'statsmodels'
+
+    Returns
+    -------
+    list
+        Tuple of (x values, trendline y values, fit results) for each group,
+        or None for groups without any row with both x and y values. Fit
+        results are None for LOWESS trendlines.
+    """
+    x_values = x
+    if x_values.dtype.kind == "M":
+        # Dates with microsecond resolution convert to datetime objects in
+        # trace properties
+        x_values = x_values.astype("datetime64[us]")
+    x = _to_float(x)
+    y = np.asarray(y, dtype="float64")
+
+    # Group of each row, -1 for rows that are not in a group or have missing
+    # values
+    codes = np.full(len(x), -1, dtype=np.intp)
+    for g, rows in enumerate(group_rows):
+        codes[slice(None) if rows is None else rows] = g
+    codes[np.isnan(x) | np.isnan(y)] = -1
+
+    # Sort the rows once, by group and then by x
+    rows = np.flatnonzero(codes >= 0)
+    order = rows[np.lexsort((x[rows], codes[rows]))]
+    codes = codes[order]
+    x_values, x, y = x_values[order], x[order], y[order]
+
+    counts = np.bincount(codes, minlength=len(group_rows))
+    stops = np.cumsum(counts)
+    starts = stops - counts
+
+    if engine == "statsmodels":
+        fit = _fit_statsmodels
+    elif trendline == "ols":
+        fit = _fit_ols_groups(x, y, codes, counts)
+    else:
+        fit = _fit_lowess
+
+    fits = []
+    for g, (start, stop) in enumerate(zip(starts, stops)):
+        if start == stop:
+            fits.append(None)
+            continue
+
+        inds, trendline_y, fit_results = fit(trendline, x[start:stop], y[start:stop], g)
+        fits.append((x_values[start:stop][inds], trendline_y, fit_results))
+    return fits
+
+
+def _to_float(x):
+    """
+    Return float64 values of a numeric or datetime64 array, with dates as
+    seconds since the epoch and NaT as NaN
+    """
+    x = np.asarray(x)
+    if x.dtype.kind == "M":
+        is_nat = np.isnat(x)
+        x = x.astype("datetime64[ns]").view("int64") / 10 ** 9
+        x[is_nat] = np.nan
+        return x
+    return x.astype("float64")
+
+
+def _fit_ols_groups(x, y, codes, counts):
+    """
+    Fit ordinary least squares lines to all groups of sorted rows at once
+
+    Returns a function that returns the fit of a group, with the same
+    signature as _fit_lowess
+    """
+    n = np.maximum(counts, 1)
+    mean_x = np.bincount(codes, x, minlength=len(counts)) / n
+    mean_y = np.bincount(codes, y, minlength=len(counts)) / n
+
+    # Sums of centered values, for numerical stability with e.g. dates
+    dx = x - mean_x[codes]
+    dy = y - mean_y[codes]
+    sxx = np.bincount(codes, dx * dx, minlength=len(counts))
+    sxy = np.bincount(codes, dx * dy, minlength=len(counts))
+    syy = np.bincount(codes, dy * dy, minlength=len(counts))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(sxx > 0, sxy / sxx, 0.0)
+        rsquared = sxy * sxy / (sxx * syy)
+    intercept = mean_y - slope * mean_x
+
+    def fit(trendline, group_x, group_y, g):
+        fit_results = OLSFitResults(
+            group_x,
+            group_y,
+            np.array([intercept[g], slope[g]]),
+            float(rsquared[g]) if sxx[g] > 0 else np.nan,
+        )
+        return slice(None), fit_results.predict(), fit_results
+
+    return fit
+
+
+def _fit_statsmodels(trendline, x, y, g):
+    """
+    Fit a trendline to sorted rows with statsmodels
+    """
+    import statsmodels.api as sm
+
+    if trendline == "lowess":
+        trendline_y = sm.nonparametric.lowess(y, x, missing="drop")[:, 1]
+        return slice(None), trendline_y, None
+    else:
+        fit_results = sm.OLS(y, sm.add_constant(x, has_constant="add")).fit()
+        return slice(None), fit_results.predict(), fit_results
+
+
+def _fit_lowess(trendline, x, y, g):
+    """
+    Fit a LOWESS trendline to sorted rows
+
+    Groups with more than lowess_max_points points are fitted to the averages
+    of equal-count bins of consecutive points, and the trendline is
+    evaluated at one point per bin.
+    """
+    n = len(x)
+    if n <= lowess_max_points:
+        return slice(None), lowess(x, y), None
+
+    edges = np.linspace(0, n, lowess_max_points + 1).astype("int64")
+    bin_counts = np.diff(edges)
+    bin_x = np.add.reduceat(x, edges[:-1]) / bin_counts
+    bin_y = np.add.reduceat(y, edges[:-1]) / bin_counts
+
+    inds = np.unique(np.concatenate([[0], (edges[:-1] + edges[1:]) // 2, [n - 1]]))
+    return inds, np.interp(x[inds], bin_x, lowess(bin_x, bin_y)), None
+
+
+def lowess(x, y, frac=2.0 / 3.0, it=3):
+    """
+    Locally weighted scatterplot smoothing, with the same algorithm and
+    defaults as `statsmodels.nonparametric.lowess` (without interpolation,
+    i.e. with `delta=0`)
+
+    Each point is estimated with a linear regression of the `frac * n`
+    nearest points, weighted by their tricube distance. The fit is then
+    repeated `it` times with additional bisquare weights of the residuals,
+    which reduce the influence of outliers.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Sorted x values, without NaN
+    y : numpy.ndarray
+        y values, without NaN
+    frac : float
+        Fraction of the points used to estimate each value
+    it : int
+        Number of robustifying iterations
+
+    Returns
+    -------
+    numpy.ndarray
+        Estimated y values
+    """
+    n = len(x)
+    k = min(max(int(frac * n + 1e-10), 2), n)
+    if n < 2:
+        return y.astype("float64")
+
+    # The k nearest neighbors of each point are the points between left and
+    # left + k, where left is the first position such that moving the window
+    # to the right would not bring it closer to the point
+    left = np.searchsorted(x[: n - k] + x[k:], 2 * x, side="left")
+    radius = np.maximum(x - x[left], x[left + k - 1] - x)
+
+    # Points with the same x value take the estimate of the first of them
+    first_tied = np.searchsorted(x, x, side="left")
+
+    resid_weights = np.ones(n)
+    offsets = np.arange(k)
+    chunk_size = max(1, 2 ** 20 // k)
+    fitted = np.empty(n)
+    for iteration in range(it + 1):
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            x_i = x[start:stop, None]
+            neighbors = left[start:stop, None] + offsets
+            x_j = x[neighbors]
+            y_j = y[neighbors]
+
+            # Tricube weights of the distances, relative to the radius. A
+            # zero radius gives NaN weights, which are not counted as
+            # positive below
+            with np.errstate(divide="ignore", invalid="ignore"):
+                dist = np.abs(x_j - x_i) / radius[start:stop, None]
+            weights = 1 - dist * dist * dist
+            weights = weights * weights * weights * resid_weights[neighbors]
+
+            # The regression needs at least two points of positive weight,
+            # otherwise the point keeps its y value
+            ok = (weights > 1e-12).sum(axis=1) >= 2
+            weights = weights[ok] / weights[ok].sum(axis=1)[:, None]
+            x_i = x_i[ok]
+            x_j = x_j[ok]
+
+            # Weighted linear regression, evaluated at x_i
+            mean_x = (weights * x_j).sum(axis=1)[:, None]
+            dx_j = x_j - mean_x
+            var_x = np.maximum((weights * (dx_j * dx_j)).sum(axis=1), 1e-12)[:, None]
+            proj = weights * (1.0 + (x_i - mean_x) * dx_j / var_x)
+
+            chunk_fitted = y[start:stop].astype("float64")
+            chunk_fitted[ok] = (proj * y_j[ok]).sum(axis=1)
+            fitted[start:stop] = chunk_fitted
+
+        fitted = fitted[first_tied]
+        if iteration == it:
+            break
+
+        # Bisquare weights of the residuals, relative to six times their
+        # median. If the median is zero, only the points with no residual
+        # keep their weight
+        residuals = np.abs(y - fitted)
+        median = np.median(residuals)
+        if median == 0:
+            residuals = (residuals > 0).astype("float64")
+        else:
+            residuals = np.minimum(residuals / (6.0 * median), 1.0)
+        resid_weights = 1 - residuals * residuals
+        resid_weights = resid_weights * resid_weights
+
+    return fitted
@@ -1,17 +1,23 @@
 from __future__ import absolute_import
+import atexit
 import base64
 import json
 import webbrowser
 import inspect
 import os
+import threading
+import uuid
+import warnings
 from os.path import isdir
 
 import six
+from six.moves import queue
 from plotly.io import to_json, to_image, write_image, write_html
 from plotly import utils, optional_imports
 from plotly.io._orca import ensure_server
 from plotly.offline.offline import _get_jconfig, get_plotlyjs
 from plotly.tools import return_figure_from_figure_or_data
+from plotly.io._utils import SerializedFigure
 
 ipython_display = optional_imports.get_module("IPython.display")
 IPython = optional_imports.get_module("IPython")
@@ -87,14 +93,16 @@ class PlotlyRenderer(MimetypeRenderer):
         self.config = dict(config) if config else {}
 
     def to_mimebundle(self, fig_dict):
-        config = _get_jconfig(self.config)
-        if config:
-            fig_dict["config"] = config
-
         json_compatible_fig_dict = json.loads(
             to_json(fig_dict, validate=False, remove_uids=False)
         )
 
+        # Add config to the decoded copy so that the figure dict shared with
+        # other renderers is left unmodified
+        config = _get_jconfig(self.config)
+        if config:
+            json_compatible_fig_dict["config"] = config
+
         return {"application/vnd.plotly.v1+json": json_compatible_fig_dict}
 
 
@@ -253,6 +261,7 @@ class HtmlRenderer(MimetypeRenderer):
         auto_play=False,
         post_script=None,
         animation_opts=None,
+        incremental=False,
     ):
 
         self.config = dict(config) if config else {}
@@ -263,6 +272,7 @@ class HtmlRenderer(MimetypeRenderer):
         self.full_html = full_html
         self.animation_opts = animation_opts
         self.post_script = post_script
+        self.incremental = incremental
 
     def activate(self):
         if self.global_init:
@@ -324,6 +334,113 @@ class HtmlRenderer(MimetypeRenderer):
             ipython_display.display_html(script, raw=True)
 
     def to_mimebundle(self, fig_dict):
+        return {"text/html": self._build_html(fig_dict)}
+
+    def to_bound_mimebundle(self, fig_dict, binding):
+        """
+        Build a mime bundle for the full display of a figure that is bound
+        to an IPython display_id
+
+        Parameters
+        ----------
+        fig_dict: dict
+            Figure dictionary
+        binding: DisplayBinding
+            The figure's display binding
+
+        Returns
+        -------
+        dict
+        """
+        register_script = """
+var displays = window._plotlyDisplays = window._plotlyDisplays || {{}};
+var entry = displays['{display_id}'] = displays['{display_id}'] || {{}};
+entry.gd = document.getElementById('{{plot_id}}');
+if (entry.pending) {{
+    entry.pending(entry.gd);
+    delete entry.pending;
+}}
+""".format(
+            display_id=binding.display_id
+        )
+        return {"text/html": self._build_html(fig_dict, [register_script])}
+
+    def to_update_mimebundle(self, fig_dict, binding):
+        """
+        Build a mime bundle containing a script that applies the changes
+        recorded by a display binding to the bound figure using Plotly.react
+
+        Only the traces that changed since the figure was last displayed in
+        full, and the layout if it changed, are included in the bundle.
+
+        Parameters
+        ----------
+        fig_dict: dict
+            Figure dictionary
+        binding: DisplayBinding
+            The figure's display binding
+
+        Returns
+        -------
+        dict
+        """
+        from plotly.io._utils import _encode_json
+
+        data = fig_dict.get("data", [])
+        jtraces = "{%s}" % ",".join(
+            '"{ind}":{trace}'.format(ind=ind, trace=_encode_json(data[ind]))
+            for ind in sorted(binding.trace_indexes)
+            if ind < len(data)
+        )
+
+        if not binding.layout_changed:
+            jlayout = "gd.layout"
+        elif isinstance(fig_dict, SerializedFigure):
+            jlayout = fig_dict.encode_prop("layout", {})
+        else:
+            jlayout = _encode_json(fig_dict.get("layout", {}))
+
+        config = _get_jconfig(self.config)
+        config.setdefault("responsive", True)
+
+        if self.requirejs:
+            require_start = 'require(["plotly"], function(Plotly) {'
+            require_end = "});"
+        else:
+            require_start = require_end = ""
+
+        script = """\
+<script type="text/javascript">
+{require_start}
+    var displays = window._plotlyDisplays = window._plotlyDisplays || {{}};
+    var entry = displays['{display_id}'] = displays['{display_id}'] || {{}};
+    var update = function(gd) {{
+        var data = gd.data.slice(0, {num_traces});
+        var traces = {traces};
+        for (var ind in traces) {{
+            data[ind] = traces[ind];
+        }}
+        Plotly.react(gd, data, {layout}, {config});
+    }};
+    if (entry.gd && document.body.contains(entry.gd)) {{
+        update(entry.gd);
+    }} else {{
+        entry.pending = update;
+    }}
+{require_end}
+</script>""".format(
+            require_start=require_start,
+            require_end=require_end,
+            display_id=binding.display_id,
+            num_traces=len(data),
+            traces=jtraces,
+            layout=jlayout,
+            config=json.dumps(config),
+        )
+
+        return {"text/html": script}
+
+    def _build_html(self, fig_dict, extra_post_script=None):
 
         from plotly.io import to_html
 
@@ -371,6 +488,9 @@ if (outputEl) {{
             else:
                 post_script.extend(self.post_script)
 
+        if extra_post_script:
+            post_script.extend(extra_post_script)
+
         html = to_html(
             fig_dict,
             config=self.config,
@@ -385,7 +505,59 @@ if (outputEl) {{
             validate=False,
         )
 
-        return {"text/html": html}
+        return html
+
+
+class DisplayBinding(object):
+    """
+    Association between a figure and the IPython outputs created by an
+    incremental HtmlRenderer
+
+    The figure reports every change made to it to its binding (see
+    BaseFigure._record_display_change), so that later calls to show() can
+    send only the traces and layout that changed since the figure was last
+    displayed in full.
+    """
+
+    def __init__(self):
+        # Output containing the full figure
+        self.display_id = str(uuid.uuid4())
+
+        # Output containing the latest Plotly.react update script
+        self.update_display_id = self.display_id + "-update"
+        self.has_update_display = False
+
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all recorded changes after the figure is displayed in full
+        """
+        self.trace_indexes = set()
+        self.layout_changed = False
+        self.restructured = False
+
+    def record_change(self, trace_indexes=(), layout=False, restructured=False):
+        """
+        Record a change to the bound figure
+
+        Parameters
+        ----------
+        trace_indexes : iterable of int
+            Indexes of the traces that changed
+        layout : bool
+            Whether the layout changed
+        restructured : bool
+            Whether traces were deleted or reordered, in which case the
+            figure must be displayed in full again
+
+        Returns
+        -------
+        None
+        """
+        self.trace_indexes.update(trace_indexes)
+        self.layout_changed = self.layout_changed or layout
+        self.restructured = self.restructured or restructured
 
 
 class NotebookRenderer(HtmlRenderer):
@@ -398,6 +570,12 @@ class NotebookRenderer(HtmlRenderer):
     This renderer automatically performs global notebook initialization when
     activated.
 
+    If incremental is True, a figure shown with this renderer is bound to an
+    IPython display_id. Subsequent calls to show() on the same figure update
+    the bound output in place using Plotly.react, sending only the traces
+    and layout that changed, rather than adding a new output containing the
+    complete figure.
+
     mime type: 'text/html'
     """
 
@@ -408,6 +586,7 @@ class NotebookRenderer(HtmlRenderer):
         auto_play=False,
         post_script=None,
         animation_opts=None,
+        incremental=False,
     ):
         super(NotebookRenderer, self).__init__(
             connected=connected,
@@ -418,6 +597,7 @@ class NotebookRenderer(HtmlRenderer):
             auto_play=auto_play,
             post_script=post_script,
             animation_opts=animation_opts,
+            incremental=incremental,
         )
 
 
@@ -434,7 +614,12 @@ class KaggleRenderer(HtmlRenderer):
     """
 
     def __init__(
-        self, config=None, auto_play=False, post_script=None, animation_opts=None
+        self,
+        config=None,
+        auto_play=False,
+        post_script=None,
+        animation_opts=None,
+        incremental=False,
     ):
 
         super(KaggleRenderer, self).__init__(
@@ -446,6 +631,7 @@ class KaggleRenderer(HtmlRenderer):
             auto_play=auto_play,
             post_script=post_script,
             animation_opts=animation_opts,
+            incremental=incremental,
         )
 
 
@@ -462,7 +648,12 @@ class AzureRenderer(HtmlRenderer):
     """
 
     def __init__(
-        self, config=None, auto_play=False, post_script=None, animation_opts=None
+        self,
+        config=None,
+        auto_play=False,
+        post_script=None,
+        animation_opts=None,
+        incremental=False,
     ):
 
         super(AzureRenderer, self).__init__(
@@ -474,6 +665,7 @@ class AzureRenderer(HtmlRenderer):
             auto_play=auto_play,
             post_script=post_script,
             animation_opts=animation_opts,
+            incremental=incremental,
         )
 
 
@@ -487,7 +679,12 @@ class ColabRenderer(HtmlRenderer):
     """
 
     def __init__(
-        self, config=None, auto_play=False, post_script=None, animation_opts=None
+        self,
+        config=None,
+        auto_play=False,
+        post_script=None,
+        animation_opts=None,
+        incremental=False,
     ):
 
         super(ColabRenderer, self).__init__(
@@ -499,9 +696,67 @@ class ColabRenderer(HtmlRenderer):
             auto_play=auto_play,
             post_script=post_script,
             animation_opts=animation_opts,
+            incremental=incremental,
         )
 
 
+# IFrame
+# Page written in place of a figure file until the background writer
+# replaces it with the complete figure
+_iframe_placeholder_html = """\
+<html>
+<head><meta charset="utf-8" /><meta http-equiv="refresh" content="0.5" /></head>
+<body></body>
+</html>"""
+
+
+def _replace_file(src, dst):
+    try:
+        os.replace(src, dst)
+    except AttributeError:
+        # Python 2.7
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+class BackgroundWriter(object):
+    """
+    Single background thread that runs file write jobs in submission order
+    """
+
+    def __init__(self):
+        self._queue = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.Queue()
+                thread = threading.Thread(target=self._run)
+                thread.daemon = True
+                thread.start()
+                atexit.register(self.join)
+        self._queue.put((fn, args))
+
+    def join(self):
+        if self._queue is not None:
+            self._queue.join()
+
+    def _run(self):
+        while True:
+            fn, args = self._queue.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                warnings.warn("Failed to write figure file: {e}".format(e=e))
+            finally:
+                self._queue.task_done()
+
+
+_iframe_writer = BackgroundWriter()
+
+
 class IFrameRenderer(MimetypeRenderer):
     """
     Renderer to display interactive figures using an IFrame.  HTML
@@ -523,6 +778,18 @@ class IFrameRenderer(MimetypeRenderer):
     each time the kernel is restarted.  This directory may be deleted whenever
     the kernel is restarted and it will be automatically recreated.
 
+    If include_plotlyjs is 'directory', the plotly.js bundle is written once
+    to `iframe_figures/plotly.min.js` and referenced by every figure file,
+    rather than being embedded in each of them.
+
+    If async_write is True, figure files are serialized and written by a
+    background thread so that displaying a figure does not block the
+    kernel.  A small placeholder page that reloads itself is written first,
+    so the iframe shows the figure as soon as its file is complete.
+
+    If max_figures is not None, the least recently written figure files are
+    deleted whenever the directory holds more than max_figures of them.
+
     mime type: 'text/html'
     """
 
@@ -534,6 +801,8 @@ class IFrameRenderer(MimetypeRenderer):
         animation_opts=None,
         include_plotlyjs=True,
         html_directory="iframe_figures",
+        async_write=False,
+        max_figures=None,
     ):
 
         self.config = config
@@ -542,10 +811,10 @@ class IFrameRenderer(MimetypeRenderer):
         self.animation_opts = animation_opts
         self.include_plotlyjs = include_plotlyjs
         self.html_directory = html_directory
+        self.async_write = async_write
+        self.max_figures = max_figures
 
     def to_mimebundle(self, fig_dict):
-        from plotly.io import write_html
-
         # Make iframe size slightly larger than figure size to avoid
         # having iframe have its own scroll bar.
         iframe_buffer = 20
@@ -571,20 +840,19 @@ class IFrameRenderer(MimetypeRenderer):
             if not isdir(self.html_directory):
                 raise
 
-        write_html(
-            fig_dict,
-            filename,
-            config=self.config,
-            auto_play=self.auto_play,
-            include_plotlyjs=self.include_plotlyjs,
-            include_mathjax="cdn",
-            auto_open=False,
-            post_script=self.post_script,
-            animation_opts=self.animation_opts,
-            default_width="100%",
-            default_height=525,
-            validate=False,
-        )
+        # Write the shared plotly.js bundle before any figure references it
+        if self.include_plotlyjs == "directory":
+            bundle_path = os.path.join(self.html_directory, "plotly.min.js")
+            if not os.path.exists(bundle_path):
+                with open(bundle_path, "w") as f:
+                    f.write(get_plotlyjs())
+
+        if self.async_write:
+            with open(filename, "w") as f:
+                f.write(_iframe_placeholder_html)
+            _iframe_writer.submit(self._write_figure, fig_dict, filename)
+        else:
+            self._write_figure(fig_dict, filename)
 
         # Build IFrame
         iframe_html = """\
@@ -602,6 +870,83 @@ class IFrameRenderer(MimetypeRenderer):
 
         return {"text/html": iframe_html}
 
+    def _write_figure(self, fig_dict, filename):
+        from plotly.io import write_html
+
+        # Write to a temporary file first so that a partially written figure
+        # is never served in place of the placeholder
+        tmp_filename = filename + ".tmp"
+        write_html(
+            fig_dict,
+            tmp_filename,
+            config=self.config,
+            auto_play=self.auto_play,
+            include_plotlyjs=self.include_plotlyjs,
+            include_mathjax="cdn",
+            auto_open=False,
+            post_script=self.post_script,
+            animation_opts=self.animation_opts,
+            default_width="100%",
+            default_height=525,
+            validate=False,
+        )
+        _replace_file(tmp_filename, filename)
+
+        if self.max_figures is not None:
+            self.prune(self.max_figures)
+
+    def prune(self, max_figures):
+        """
+        Delete the least recently written figure files in the html
+        directory so that at most max_figures of them remain
+
+        Parameters
+        ----------
+        max_figures: int
+            Number of figure files to keep
+
+        Returns
+        -------
+        None
+        """
+        try:
+            names = os.listdir(self.html_directory)
+        except OSError:
+            return
+
+        paths = [
+            os.path.join(self.html_directory, name)
+            for name in names
+            if name.startswith("figure_") and name.endswith(".html")
+        ]
+        if len(paths) <= max_figures:
+            return
+
+        def mtime(path):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0
+
+        paths.sort(key=mtime)
+        for path in paths[: len(paths) - max_figures]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def flush():
+        """
+        Block until all figure files queued by renderers with
+        async_write=True have been written
+
+        Returns
+        -------
+        None
+        """
+        _iframe_writer.join()
+
     def build_filename(self):
         ip = IPython.get_ipython() if IPython else None
         cell_number = list(ip.history_manager.get_tail(1))[0][1] + 1 if ip else 0
@@ -5,7 +5,7 @@ import webbrowser
 
 import six
 
-from plotly.io._utils import validate_coerce_fig_to_dict
+from plotly.io._utils import validate_coerce_fig_to_dict, SerializedFigure
 from plotly.offline.offline import _get_jconfig, get_plotlyjs
 from plotly import utils
 
@@ -134,17 +134,24 @@ def to_html(
     plotdivid = str(uuid.uuid4())
 
     # ## Serialize figure ##
-    jdata = json.dumps(
-        fig_dict.get("data", []), cls=utils.PlotlyJSONEncoder, sort_keys=True
-    )
-    jlayout = json.dumps(
-        fig_dict.get("layout", {}), cls=utils.PlotlyJSONEncoder, sort_keys=True
-    )
-
-    if fig_dict.get("frames", None):
-        jframes = json.dumps(fig_dict.get("frames", []), cls=utils.PlotlyJSONEncoder)
+    if isinstance(fig_dict, SerializedFigure):
+        # Reuse the encodings shared with the other renderers
+        jdata = fig_dict.encode_prop("data", [])
+        jlayout = fig_dict.encode_prop("layout", {})
     else:
+        jdata = json.dumps(
+            fig_dict.get("data", []), cls=utils.PlotlyJSONEncoder, sort_keys=True
+        )
+        jlayout = json.dumps(
+            fig_dict.get("layout", {}), cls=utils.PlotlyJSONEncoder, sort_keys=True
+        )
+
+    if not fig_dict.get("frames", None):
         jframes = None
+    elif isinstance(fig_dict, SerializedFigure):
+        jframes = fig_dict.encode_prop("frames")
+    else:
+        jframes = json.dumps(fig_dict.get("frames", []), cls=utils.PlotlyJSONEncoder)
 
     # ## Serialize figure config ##
     config = _get_jconfig(config)
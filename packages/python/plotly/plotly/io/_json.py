@@ -4,7 +4,11 @@ from six import string_types
 import json
 
 
-from plotly.io._utils import validate_coerce_fig_to_dict, validate_coerce_output_type
+from plotly.io._utils import (
+    validate_coerce_fig_to_dict,
+    validate_coerce_output_type,
+    SerializedFigure,
+)
 
 
 def to_json(fig, validate=True, pretty=False, remove_uids=True):
@@ -38,12 +42,20 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True):
     # ---------------
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
 
+    # Reuse cached encoding
+    # ---------------------
+    if isinstance(fig_dict, SerializedFigure) and not (pretty or remove_uids):
+        return fig_dict.to_json()
+
     # Remove trace uid
     # ----------------
     if remove_uids:
         for trace in fig_dict.get("data", []):
             trace.pop("uid", None)
 
+        if isinstance(fig_dict, SerializedFigure):
+            fig_dict.invalidate("data")
+
     # Dump to a JSON string and return
     # --------------------------------
     opts = {"sort_keys": True}
@@ -17,7 +17,7 @@ from six import string_types
 import _plotly_utils.utils
 import plotly
 from plotly.files import PLOTLY_DIR, ensure_writable_plotly_dir
-from plotly.io._utils import validate_coerce_fig_to_dict
+from plotly.io._utils import validate_coerce_fig_to_dict, SerializedFigure
 from plotly.optional_imports import get_module
 
 psutil = get_module("psutil")
@@ -1467,7 +1467,17 @@ def request_image_with_retrying(**kwargs):
         )
 
     request_params = {k: v for k, v, in kwargs.items() if v is not None}
-    json_str = json.dumps(request_params, cls=_plotly_utils.utils.PlotlyJSONEncoder)
+    figure = request_params.get("figure", None)
+    if isinstance(figure, SerializedFigure):
+        # Splice in the figure's cached encoding rather than re-encoding it
+        request_params.pop("figure")
+        params_str = json.dumps(request_params)[1:-1]
+        json_str = '{%s"figure": %s}' % (
+            params_str + ", " if params_str else "",
+            figure.to_json(),
+        )
+    else:
+        json_str = json.dumps(request_params, cls=_plotly_utils.utils.PlotlyJSONEncoder)
     response = post(server_url + "/", data=json_str)
 
     if response.status_code == 522:
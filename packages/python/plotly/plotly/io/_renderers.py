@@ -5,6 +5,7 @@ from copy import copy
 
 import six
 import os
+import threading
 from distutils.version import LooseVersion
 
 from plotly import optional_imports
@@ -12,6 +13,9 @@ from plotly import optional_imports
 from plotly.io._base_renderers import (
     MimetypeRenderer,
     ExternalRenderer,
+    HtmlRenderer,
+    DisplayBinding,
+    ImageRenderer,
     PlotlyRenderer,
     NotebookRenderer,
     KaggleRenderer,
@@ -28,7 +32,7 @@ from plotly.io._base_renderers import (
     CoCalcRenderer,
     DatabricksRenderer,
 )
-from plotly.io._utils import validate_coerce_fig_to_dict
+from plotly.io._utils import validate_coerce_fig_to_dict, SerializedFigure
 
 ipython = optional_imports.get_module("IPython")
 ipython_display = optional_imports.get_module("IPython.display")
@@ -251,26 +255,21 @@ Renderers configuration
         )
         return available
 
-    def _build_mime_bundle(self, fig_dict, renderers_string=None, **kwargs):
+    def _get_mime_renderers(self, renderers_string=None, **kwargs):
         """
-        Build a mime bundle dict containing a kev/value pair for each
-        MimetypeRenderer specified in either the default renderer string,
-        or in the supplied renderers_string argument.
-
-        Note that this method skips any renderers that are not subclasses
-        of MimetypeRenderer.
+        Return activated copies of each MimetypeRenderer specified in either
+        the default renderer string, or in the supplied renderers_string
+        argument, with renderer properties overridden by kwargs
 
         Parameters
         ----------
-        fig_dict: dict
-            Figure dictionary
         renderers_string: str or None (default None)
             Renderer string to process rather than the current default
             renderer string
 
         Returns
         -------
-        dict
+        list of MimetypeRenderer
         """
         if renderers_string:
             renderer_names = self._validate_coerce_renderers(renderers_string)
@@ -285,14 +284,77 @@ Renderers configuration
             self._activate_pending_renderers(cls=MimetypeRenderer)
             renderers_list = self._default_renderers
 
-        bundle = {}
+        mime_renderers = []
         for renderer in renderers_list:
             if isinstance(renderer, MimetypeRenderer):
                 renderer = copy(renderer)
                 for k, v in kwargs.items():
                     if hasattr(renderer, k):
                         setattr(renderer, k, v)
+                mime_renderers.append(renderer)
+
+        return mime_renderers
+
+    def _build_mime_bundle(self, fig_dict, renderers_string=None, **kwargs):
+        """
+        Build a mime bundle dict containing a kev/value pair for each
+        MimetypeRenderer specified in either the default renderer string,
+        or in the supplied renderers_string argument.
+
+        Note that this method skips any renderers that are not subclasses
+        of MimetypeRenderer.
 
+        Parameters
+        ----------
+        fig_dict: dict
+            Figure dictionary
+        renderers_string: str or None (default None)
+            Renderer string to process rather than the current default
+            renderer string
+
+        Returns
+        -------
+        dict
+        """
+        mime_renderers = self._get_mime_renderers(renderers_string, **kwargs)
+
+        # Encode the figure at most once and share the result across renderers
+        if not isinstance(fig_dict, SerializedFigure):
+            fig_dict = SerializedFigure(fig_dict)
+
+        # Each image renderer waits on a round trip to the orca server, so
+        # when there are several of them their requests are issued
+        # concurrently.
+        image_renderers = [r for r in mime_renderers if isinstance(r, ImageRenderer)]
+        image_bundles = {}
+        if len(image_renderers) > 1:
+            errors = []
+
+            def render_image(renderer):
+                try:
+                    image_bundles[id(renderer)] = renderer.to_mimebundle(fig_dict)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [
+                threading.Thread(target=render_image, args=(renderer,))
+                for renderer in image_renderers
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            if errors:
+                raise errors[0]
+
+        # Assemble bundle in renderer order so that right-most renderers
+        # take precedence
+        bundle = {}
+        for renderer in mime_renderers:
+            if id(renderer) in image_bundles:
+                bundle.update(image_bundles[id(renderer)])
+            else:
                 bundle.update(renderer.to_mimebundle(fig_dict))
 
         return bundle
@@ -370,27 +432,107 @@ def show(fig, renderer=None, validate=True, **kwargs):
     -------
     None
     """
-    fig_dict = validate_coerce_fig_to_dict(fig, validate)
+    # Validate once and share the figure's JSON encoding across all renderers
+    fig_dict = SerializedFigure(validate_coerce_fig_to_dict(fig, validate))
 
     # Mimetype renderers
-    bundle = renderers._build_mime_bundle(fig_dict, renderers_string=renderer, **kwargs)
-    if bundle:
-        if not ipython_display:
-            raise ValueError(
-                "Mime type rendering requires ipython but it is not installed"
-            )
-
-        if not nbformat or LooseVersion(nbformat.__version__) < LooseVersion("4.2.0"):
-            raise ValueError(
-                "Mime type rendering requires nbformat>=4.2.0 but it is not installed"
-            )
-
-        ipython_display.display(bundle, raw=True)
+    mime_renderers = renderers._get_mime_renderers(renderer, **kwargs)
+    if _supports_incremental_display(fig, mime_renderers):
+        _check_mime_display_requirements()
+        _show_incremental(fig, fig_dict, mime_renderers)
+    else:
+        bundle = renderers._build_mime_bundle(
+            fig_dict, renderers_string=renderer, **kwargs
+        )
+        if bundle:
+            _check_mime_display_requirements()
+            ipython_display.display(bundle, raw=True)
 
     # external renderers
     renderers._perform_external_rendering(fig_dict, renderers_string=renderer, **kwargs)
 
 
+def _check_mime_display_requirements():
+    if not ipython_display:
+        raise ValueError("Mime type rendering requires ipython but it is not installed")
+
+    if not nbformat or LooseVersion(nbformat.__version__) < LooseVersion("4.2.0"):
+        raise ValueError(
+            "Mime type rendering requires nbformat>=4.2.0 but it is not installed"
+        )
+
+
+def _supports_incremental_display(fig, mime_renderers):
+    """
+    Return whether a figure can be shown with incremental display updates.
+    This requires a figure object (not a dict) and that every active
+    mimetype renderer is an HtmlRenderer with incremental updates enabled.
+    """
+    from plotly.basedatatypes import BaseFigure
+
+    return (
+        isinstance(fig, BaseFigure)
+        and bool(mime_renderers)
+        and all(isinstance(r, HtmlRenderer) and r.incremental for r in mime_renderers)
+    )
+
+
+def _show_incremental(fig, fig_dict, mime_renderers):
+    """
+    Display a figure that is bound to an IPython display_id
+
+    The first time a figure is shown, it is displayed in full in a new output
+    and bound to that output. Later calls update the bound output in place:
+
+      - Figures rendered as full HTML documents (e.g. in Colab, where each
+        output is isolated in its own iframe) and figures whose traces were
+        deleted or reordered are displayed in full again, replacing the
+        original output.
+      - Otherwise, a Plotly.react script containing only the traces and
+        layout that changed since the last full display is written to a
+        companion output, which is itself updated in place on every call.
+    """
+    binding = fig._display_binding
+    if binding is None:
+        binding = DisplayBinding()
+        fig._display_binding = binding
+        bundle = {}
+        for r in mime_renderers:
+            bundle.update(r.to_bound_mimebundle(fig_dict, binding))
+        ipython_display.display(bundle, raw=True, display_id=binding.display_id)
+        return
+
+    full_display = (
+        binding.restructured
+        or fig_dict.get("frames", None)
+        or any(r.full_html for r in mime_renderers)
+    )
+
+    if full_display:
+        bundle = {}
+        for r in mime_renderers:
+            bundle.update(r.to_bound_mimebundle(fig_dict, binding))
+        ipython_display.update_display(bundle, raw=True, display_id=binding.display_id)
+        binding.reset()
+
+        # Clear the now stale update script
+        update_bundle = {"text/html": ""}
+    else:
+        update_bundle = {}
+        for r in mime_renderers:
+            update_bundle.update(r.to_update_mimebundle(fig_dict, binding))
+
+    if binding.has_update_display:
+        ipython_display.update_display(
+            update_bundle, raw=True, display_id=binding.update_display_id
+        )
+    elif not full_display:
+        ipython_display.display(
+            update_bundle, raw=True, display_id=binding.update_display_id
+        )
+        binding.has_update_display = True
+
+
 # Register renderers
 # ------------------
 
@@ -430,6 +572,9 @@ renderers["chrome"] = BrowserRenderer(config=config, using="chrome")
 renderers["chromium"] = BrowserRenderer(config=config, using="chromium")
 renderers["iframe"] = IFrameRenderer(config=config, include_plotlyjs=True)
 renderers["iframe_connected"] = IFrameRenderer(config=config, include_plotlyjs="cdn")
+renderers["iframe_directory"] = IFrameRenderer(
+    config=config, include_plotlyjs="directory", async_write=True
+)
 renderers["sphinx_gallery"] = SphinxGalleryRenderer()
 
 # Set default renderer
@@ -51,6 +51,10 @@ class TemplatesConfig(object):
         for template_name in default_templates:
             self._templates[template_name] = Lazy
 
+        # Merged templates by tuple of template names, e.g.
+        # ('plotly_white', 'presentation') for 'plotly_white+presentation'
+        self._merged_templates = {}
+
         self._validator = None
         self._default = None
 
@@ -67,45 +71,65 @@ class TemplatesConfig(object):
 
     def __getitem__(self, item):
         if isinstance(item, string_types):
-            template_names = item.split("+")
+            template_names = tuple(item.split("+"))
         else:
-            template_names = [item]
+            template_names = (item,)
 
-        templates = []
-        for template_name in template_names:
-            template = self._templates[template_name]
-            if template is Lazy:
-                from plotly.graph_objs.layout import Template
-
-                if template_name == "none":
-                    # "none" is a special built-in named template that applied no defaults
-                    template = Template(data_scatter=[{}])
-                    self._templates[template_name] = template
-                else:
-                    # Load template from package data
-                    path = os.path.join(
-                        "package_data", "templates", template_name + ".json"
-                    )
-                    template_str = pkgutil.get_data("plotly", path).decode("utf-8")
-                    template_dict = json.loads(template_str)
-                    template = Template(template_dict, _validate=False)
+        if len(template_names) == 1:
+            return self._get_template(template_names[0])
+
+        # Templates merged from several templates are kept like registered
+        # templates, until one of the templates is replaced or removed
+        template = self._merged_templates.get(template_names, None)
+        if template is None:
+            template = self.merge_templates(
+                *[self._get_template(name) for name in template_names]
+            )
+            self._merged_templates[template_names] = template
+
+        return template
 
-                    self._templates[template_name] = template
-            templates.append(self._templates[template_name])
+    def _get_template(self, template_name):
+        template = self._templates[template_name]
+        if template is Lazy:
+            from plotly.graph_objs.layout import Template
 
-        return self.merge_templates(*templates)
+            if template_name == "none":
+                # "none" is a special built-in named template that applied no defaults
+                template = Template(data_scatter=[{}])
+                self._templates[template_name] = template
+            else:
+                # Load template from package data
+                path = os.path.join(
+                    "package_data", "templates", template_name + ".json"
+                )
+                template_str = pkgutil.get_data("plotly", path).decode("utf-8")
+                template_dict = json.loads(template_str)
+                template = Template(template_dict, _validate=False)
+
+                self._templates[template_name] = template
+
+        return template
 
     def __setitem__(self, key, value):
         self._templates[key] = self._validate(value)
+        self._clear_merged_templates(key)
 
     def __delitem__(self, key):
         # Remove template
         del self._templates[key]
+        self._clear_merged_templates(key)
 
         # Check if we need to remove it as the default
         if self._default == key:
             self._default = None
 
+    def _clear_merged_templates(self, key):
+        # Remove the merged templates that include the template
+        for template_names in list(self._merged_templates):
+            if key in template_names:
+                del self._merged_templates[template_names]
+
     def _validate(self, value):
         if not self._validator:
             from plotly.validators.layout import TemplateValidator
@@ -137,6 +161,56 @@ class TemplatesConfig(object):
         for k, v in dict(d, **kwargs).items():
             self[k] = v
 
+    def preload(self, *template_names):
+        """
+        Load templates, and build their graph objects, ahead of their first
+        use.
+
+        Built-in templates are loaded from package data when they are first
+        used, and the graph objects of their properties (along with the
+        classes of these objects) are built when the properties are first
+        accessed. Preloading does this work up front, e.g. once in the parent
+        process of a pre-forking server rather than in each worker process.
+
+        Parameters
+        ----------
+        template_names: str
+            Names of registered templates, or of templates joined on '+'
+            characters (e.g. 'plotly_white+presentation'). If no names are
+            specified, all registered templates are preloaded.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> import plotly.io as pio
+        >>> pio.templates.preload()
+        >>> pio.templates.preload('plotly', 'plotly_white+presentation')
+        """
+        if not template_names:
+            template_names = list(self._templates)
+
+        for template_name in template_names:
+            self._build_graph_objects(self[template_name])
+
+    def _build_graph_objects(self, obj):
+        from _plotly_utils.basevalidators import (
+            CompoundValidator,
+            CompoundArrayValidator,
+        )
+
+        # Access each compound property of obj, which creates its graph object
+        # from the stored property values
+        for prop in list(obj._props or {}):
+            validator = obj._get_validator(prop)
+            if isinstance(validator, CompoundValidator):
+                self._build_graph_objects(obj[prop])
+            elif isinstance(validator, CompoundArrayValidator):
+                for element in obj[prop]:
+                    self._build_graph_objects(element)
+
     # ### Properties ###
     @property
     def default(self):
@@ -1,5 +1,8 @@
 from __future__ import absolute_import
 
+import json
+import threading
+
 import plotly
 import plotly.graph_objs as go
 
@@ -40,3 +43,97 @@ Invalid output type: {output_type}
     Must be one of: 'Figure', 'FigureWidget'"""
         )
     return cls
+
+
+def _encode_json(value):
+    """
+    Encode a single figure property as compact, key-sorted JSON
+    """
+    from _plotly_utils.utils import PlotlyJSONEncoder
+
+    return json.dumps(
+        value, cls=PlotlyJSONEncoder, sort_keys=True, separators=(",", ":")
+    )
+
+
+class SerializedFigure(dict):
+    """
+    Figure dict that caches the JSON encoding of its top-level properties
+
+    plotly.io.show wraps the figure dict in a SerializedFigure so that the
+    figure is encoded at most once, no matter how many renderers take part
+    in the mime bundle.  Encodings are discarded when a top-level property
+    is reassigned or removed, but nested mutations are not tracked, so the
+    figure should be treated as read-only once it has been serialized.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(SerializedFigure, self).__init__(*args, **kwargs)
+        self._encoded = {}
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        self._encoded.pop(key, None)
+        super(SerializedFigure, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._encoded.pop(key, None)
+        super(SerializedFigure, self).__delitem__(key)
+
+    def pop(self, key, *args):
+        self._encoded.pop(key, None)
+        return super(SerializedFigure, self).pop(key, *args)
+
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def invalidate(self, key=None):
+        """
+        Discard the cached encoding of a single top-level property, or of all
+        properties if key is None
+        """
+        if key is None:
+            self._encoded.clear()
+        else:
+            self._encoded.pop(key, None)
+
+    def encode_prop(self, key, default=None):
+        """
+        Return the compact, key-sorted JSON encoding of a top-level property
+
+        Parameters
+        ----------
+        key: str
+            Top-level figure property name (e.g. 'data', 'layout', 'frames')
+        default
+            Value to encode if the figure does not contain key
+
+        Returns
+        -------
+        str
+        """
+        if key not in self:
+            return _encode_json(default)
+
+        # Image renderers may request encodings from several threads at once
+        with self._lock:
+            if key not in self._encoded:
+                self._encoded[key] = _encode_json(self[key])
+            return self._encoded[key]
+
+    def to_json(self):
+        """
+        Return the compact, key-sorted JSON encoding of the full figure
+
+        This is identical to the output of plotly.io.to_json with
+        validate=False and remove_uids=False, but is assembled from the
+        cached encodings of the top-level properties.
+
+        Returns
+        -------
+        str
+        """
+        return "{%s}" % ",".join(
+            "%s:%s" % (json.dumps(k), self.encode_prop(k)) for k in sorted(self)
+        )
@@ -0,0 +1,193 @@
+"""
+Downsampling of large series for display
+
+These functions select a subset of the points of a series that preserves
+its visual shape, so that series with millions of points can be displayed
+by shipping only a few thousand points to the browser. They are used by
+the resampling mode of FigureWidget, see
+`plotly.graph_objects.FigureWidget.enable_resampling`.
+"""
+from __future__ import absolute_import, division
+
+from plotly.optional_imports import get_module
+
+methods = ("minmax", "lttb")
+
+
+def _get_numpy():
+    np = get_module("numpy")
+    if np is None:
+        raise ImportError("Resampling requires the numpy package")
+    return np
+
+
+def _as_float(v):
+    """
+    Return a float64 array for a numeric or datetime64 array
+    """
+    np = _get_numpy()
+    v = np.asarray(v)
+    if v.dtype.kind in ("M", "m"):
+        v = v.view("int64")
+    return v.astype("float64", copy=False)
+
+
+def minmax_indices(y, n_out):
+    """
+    Return indexes of the minimum and maximum points of equally sized
+    buckets of a series
+
+    The series is split into (n_out - 2) // 2 buckets of consecutive points,
+    and the minimum and maximum of each bucket are selected along with the
+    first and last points. This preserves the
+    extremes (e.g. spikes) of the series, and is fast enough to be used on
+    tens of millions of points.
+
+    Parameters
+    ----------
+    y : array like
+        Numeric or datetime values of the series
+    n_out : int
+        Maximum number of points to select
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted array of the indexes of the selected points
+    """
+    np = _get_numpy()
+    y = _as_float(y)
+    n = len(y)
+
+    if n <= n_out:
+        return np.arange(n)
+
+    # Leave room for the first and last points
+    bucket_size = -(-n // max((n_out - 2) // 2, 1))
+    n_full = n // bucket_size
+
+    # Buckets of full size, then the remaining points
+    n_split = n_full * bucket_size
+    bucket_groups = [(0, y[:n_split].reshape(n_full, bucket_size))]
+    if n_split < n:
+        bucket_groups.append((n_split, y[n_split:].reshape(1, -1)))
+
+    inds = [[0, n - 1]]
+    for bucket_start, buckets in bucket_groups:
+
+        isnan = np.isnan(buckets)
+        if isnan.any():
+            # Ignore NaN values when looking for the extremes
+            argmin = np.where(isnan, np.inf, buckets).argmin(axis=1)
+            argmax = np.where(isnan, -np.inf, buckets).argmax(axis=1)
+        else:
+            argmin = buckets.argmin(axis=1)
+            argmax = buckets.argmax(axis=1)
+
+        offsets = bucket_start + np.arange(len(buckets)) * buckets.shape[1]
+        inds.extend([argmin + offsets, argmax + offsets])
+
+    return np.unique(np.concatenate(inds))
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Return indexes of the points selected by the Largest-Triangle-Three-
+    Buckets algorithm
+
+    The series is split into n_out - 2 buckets of consecutive points. In
+    each bucket the point that forms the largest triangle with the point
+    selected in the previous bucket and the average of the next bucket is
+    selected. The first and last points are always selected.
+
+    Parameters
+    ----------
+    x : array like
+        Sorted numeric or datetime x values of the series
+    y : array like
+        Numeric y values of the series
+    n_out : int
+        Number of points to select
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted array of the indexes of the selected points
+    """
+    np = _get_numpy()
+    x = _as_float(x)
+    y = _as_float(y)
+    n = len(y)
+
+    if n <= n_out or n_out < 3:
+        return np.arange(n) if n <= n_out else np.array([0, n - 1])
+
+    # Bucket edges of the n - 2 interior points
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype("int64") + 1
+    edges[-1] = n - 1
+
+    # Average point of each bucket, computed in one pass
+    counts = np.diff(edges)
+    cum_x = np.concatenate([[0.0], np.cumsum(np.nan_to_num(x[1:-1]))])
+    cum_y = np.concatenate([[0.0], np.cumsum(np.nan_to_num(y[1:-1]))])
+    avg_x = (cum_x[edges[1:] - 1] - cum_x[edges[:-1] - 1]) / counts
+    avg_y = (cum_y[edges[1:] - 1] - cum_y[edges[:-1] - 1]) / counts
+
+    # The point after the last bucket is the last point
+    avg_x = np.append(avg_x, x[-1])
+    avg_y = np.append(avg_y, y[-1])
+
+    inds = np.empty(n_out, dtype="int64")
+    inds[0] = 0
+    inds[-1] = n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        bx = x[start:stop]
+        by = y[start:stop]
+
+        # Twice the area of the triangles formed by the previous selected
+        # point, each point of the bucket and the next bucket's average
+        areas = np.abs(
+            (x[prev] - avg_x[i + 1]) * (by - y[prev])
+            - (x[prev] - bx) * (avg_y[i + 1] - y[prev])
+        )
+        areas[np.isnan(areas)] = -1
+        prev = start + int(areas.argmax())
+        inds[i + 1] = prev
+
+    return inds
+
+
+def downsample_indices(x, y, n_out, method="minmax"):
+    """
+    Return indexes of a subset of the points of a series that preserves its
+    visual shape
+
+    Parameters
+    ----------
+    x : array like
+        Sorted numeric or datetime x values of the series
+    y : array like
+        Numeric y values of the series
+    n_out : int
+        Maximum number of points to select
+    method : str
+        'minmax' to select the minimum and maximum of each bucket of points,
+        or 'lttb' to use the Largest-Triangle-Three-Buckets algorithm
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted array of the indexes of the selected points
+    """
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    elif method == "lttb":
+        return lttb_indices(x, y, n_out)
+    else:
+        raise ValueError(
+            "Invalid resampling method {method}, must be one of {methods}".format(
+                method=repr(method), methods=methods
+            )
+        )
@@ -4,6 +4,75 @@ from .optional_imports import get_module
 np = get_module("numpy")
 
 
+# numpy dtypes that map directly to JavaScript typed arrays
+_typed_array_dtypes = (
+    "int8",
+    "int16",
+    "int32",
+    "uint8",
+    "uint16",
+    "uint32",
+    "float32",
+    "float64",
+)
+
+# Largest integer magnitude that a float64 represents exactly
+_max_safe_integer = 2 ** 53
+
+
+def _to_buffer_array(v):
+    """
+    Convert a numpy array into a C-contiguous, native byte order array whose
+    dtype maps directly to a JavaScript typed array, or return None if this
+    is not possible without loss of precision
+
+    64-bit integer arrays are downcast to 32-bit integers when all of their
+    values fit, and are otherwise sent as float64 as long as all of their
+    values are within the range that float64 represents exactly.
+
+    Parameters
+    ----------
+    v: numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray or None
+    """
+    if v.dtype.kind not in ("u", "i", "f"):
+        return None
+
+    if v.dtype.kind == "f" and v.dtype.itemsize < 4:
+        # No Float16Array in JavaScript
+        v = v.astype("float32")
+    elif v.dtype.kind == "f" and v.dtype.itemsize > 8:
+        return None
+    elif v.dtype.kind in ("u", "i") and v.dtype.itemsize == 8:
+        if v.size == 0:
+            v = v.astype(v.dtype.kind + "4")
+        else:
+            vmin, vmax = v.min(), v.max()
+            if v.dtype.kind == "u" and vmax <= np.iinfo("uint32").max:
+                v = v.astype("uint32")
+            elif (
+                v.dtype.kind == "i"
+                and vmin >= np.iinfo("int32").min
+                and vmax <= np.iinfo("int32").max
+            ):
+                v = v.astype("int32")
+            elif vmax <= _max_safe_integer and vmin >= -_max_safe_integer:
+                v = v.astype("float64")
+            else:
+                return None
+
+    if not v.dtype.isnative:
+        v = v.astype(v.dtype.newbyteorder("="))
+
+    if v.dtype.name not in _typed_array_dtypes:
+        return None
+
+    return np.ascontiguousarray(v)
+
+
 def _py_to_js(v, widget_manager):
     """
     Python -> Javascript ipywidget serializer
@@ -38,18 +107,17 @@ def _py_to_js(v, widget_manager):
     # Handle numpy array
     # ------------------
     elif np is not None and isinstance(v, np.ndarray):
-        # Convert 1D numpy arrays with numeric types to memoryviews with
+        # Convert numeric numpy arrays of any dimension to memoryviews with
         # datatype and shape metadata.
-        if (
-            v.ndim == 1
-            and v.dtype.kind in ["u", "i", "f"]
-            and v.dtype != "int64"
-            and v.dtype != "uint64"
-        ):
-
+        buffer_array = _to_buffer_array(v)
+        if buffer_array is not None:
             # We have a numpy array the we can directly map to a JavaScript
             # Typed array
-            return {"buffer": memoryview(v), "dtype": str(v.dtype), "shape": v.shape}
+            return {
+                "buffer": memoryview(buffer_array.ravel(order="C")),
+                "dtype": str(buffer_array.dtype),
+                "shape": buffer_array.shape,
+            }
         else:
             # Convert all other numpy arrays to lists
             return v.tolist()
@@ -65,6 +133,20 @@ def _py_to_js(v, widget_manager):
         return v
 
 
+def _is_typed_array_spec(v):
+    """
+    Return whether v is a serialized JavaScript typed array, as produced by
+    the frontend's js2py_serializer
+    """
+    return (
+        np is not None
+        and isinstance(v, dict)
+        and set(v) == {"dtype", "shape", "value"}
+        and v["dtype"] in _typed_array_dtypes
+        and isinstance(v["value"], (bytes, bytearray, memoryview))
+    )
+
+
 def _js_to_py(v, widget_manager):
     """
     Javascript -> Python ipywidget deserializer
@@ -81,9 +163,19 @@ def _js_to_py(v, widget_manager):
     any
         Deserialized object for use by the Python side of the library
     """
+    # Handle typed array
+    # ------------------
+    # JavaScript typed arrays are transferred as binary buffers along with
+    # their dtype and shape. These are converted into read-only numpy arrays
+    # without copying
+    if _is_typed_array_spec(v):
+        arr = np.frombuffer(v["value"], dtype=v["dtype"]).reshape(v["shape"])
+        arr.flags["WRITEABLE"] = False
+        return arr
+
     # Handle dict
     # -----------
-    if isinstance(v, dict):
+    elif isinstance(v, dict):
         return {k: _js_to_py(v, widget_manager) for k, v in v.items()}
 
     # Handle list/tuple
@@ -35,6 +35,84 @@ SubplotRef = collections.namedtuple(
 )
 
 
+class SubplotGrid(object):
+    """
+    Grid of the subplot references of a figure created by make_subplots
+
+    The references of the cells are stored in a single row-major list, and
+    grid[r][c] is the tuple of SubplotRef objects of the cell in the
+    zero-based row r and column c, or None for empty cells.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self._cells = [None] * (rows * cols)
+
+    def get_cell(self, r, c):
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError("subplot grid cell index out of range")
+        return self._cells[r * self.cols + c]
+
+    def set_cell(self, r, c, subplot_refs):
+        self._cells[r * self.cols + c] = subplot_refs
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, r):
+        if r < 0:
+            r += self.rows
+        if not 0 <= r < self.rows:
+            raise IndexError("subplot grid row index out of range")
+        return self._cells[r * self.cols : (r + 1) * self.cols]
+
+    def __iter__(self):
+        for r in range(self.rows):
+            yield self[r]
+
+    def __eq__(self, other):
+        if isinstance(other, SubplotGrid):
+            return (self.rows, self.cols, self._cells) == (
+                other.rows,
+                other.cols,
+                other._cells,
+            )
+        try:
+            return list(self) == [list(row) for row in other]
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "SubplotGrid(rows={rows}, cols={cols})".format(
+            rows=self.rows, cols=self.cols
+        )
+
+
+def _get_grid_cell(grid_ref, r, c):
+    # Subplot references of the cell in the zero-based row r and column c.
+    # Grids may also be lists of lists, e.g. in figures pickled by previous
+    # versions.
+    if isinstance(grid_ref, SubplotGrid):
+        return grid_ref.get_cell(r, c)
+    else:
+        return grid_ref[r][c]
+
+
+def _cumulative_starts(sizes, spacing):
+    # Start coordinate of each row or column, given their sizes and the
+    # spacing between them
+    starts = []
+    total = 0.0
+    for i, size in enumerate(sizes):
+        starts.append(total + i * spacing)
+        total += size
+    return starts
+
+
 def _get_initial_max_subplot_ids():
     max_subplot_ids = {subplot_type: 0 for subplot_type in _single_subplot_types}
     max_subplot_ids["xaxis"] = 0
@@ -607,7 +685,9 @@ The row_titles argument to make_subplots must be a list or tuple
 
     # Init layout
     # -----------
-    layout = go.Layout()
+    # The layout is assembled as a dict of plain properties, and the figure
+    # is constructed from it once at the end
+    layout = {}
 
     # Build grid reference
     # --------------------
@@ -617,21 +697,14 @@ The row_titles argument to make_subplots must be a list or tuple
 
     # Build 2D array of tuples of the start x and start y coordinate of each
     # subplot
-    grid = [
-        [
-            (
-                (sum(widths[:c]) + c * horizontal_spacing),
-                (sum(heights[:r]) + r * vertical_spacing),
-            )
-            for c in col_seq
-        ]
-        for r in row_seq
-    ]
+    x_starts = _cumulative_starts(widths, horizontal_spacing)
+    y_starts = _cumulative_starts(heights, vertical_spacing)
+    grid = [[(x_starts[c], y_starts[r]) for c in col_seq] for r in row_seq]
 
     domains_grid = [[None for _ in range(cols)] for _ in range(rows)]
 
     # Initialize subplot reference lists for the grid and insets
-    grid_ref = [[None for c in range(cols)] for r in range(rows)]
+    grid_ref = SubplotGrid(rows, cols)
 
     list_of_domains = []  # added for subplot titles
 
@@ -684,7 +757,7 @@ The row_titles argument to make_subplots must be a list or tuple
             subplot_refs = _init_subplot(
                 layout, subplot_type, secondary_y, x_domain, y_domain, max_subplot_ids
             )
-            grid_ref[r][c] = subplot_refs
+            grid_ref.set_cell(r, c, subplot_refs)
 
     _configure_shared_axes(layout, grid_ref, specs, "x", shared_xaxes, row_dir)
     _configure_shared_axes(layout, grid_ref, specs, "y", shared_yaxes, row_dir)
@@ -747,7 +820,7 @@ The row_titles argument to make_subplots must be a list or tuple
         subplot_titles, list_of_domains
     )
 
-    layout["annotations"] = plot_title_annotations
+    annotations = plot_title_annotations
 
     # Add column titles
     if column_titles:
@@ -768,7 +841,7 @@ The row_titles argument to make_subplots must be a list or tuple
             column_titles, domains_list
         )
 
-        layout["annotations"] += tuple(column_title_annotations)
+        annotations.extend(column_title_annotations)
 
     if row_titles:
         domains_list = []
@@ -782,7 +855,7 @@ The row_titles argument to make_subplots must be a list or tuple
             row_titles, domains_list, title_edge="right"
         )
 
-        layout["annotations"] += tuple(column_title_annotations)
+        annotations.extend(column_title_annotations)
 
     if x_title:
         domains_list = [(0, max_width), (0, 1)]
@@ -792,7 +865,7 @@ The row_titles argument to make_subplots must be a list or tuple
             [x_title], domains_list, title_edge="bottom", offset=30
         )
 
-        layout["annotations"] += tuple(column_title_annotations)
+        annotations.extend(column_title_annotations)
 
     if y_title:
         domains_list = [(0, 1), (0, 1)]
@@ -802,14 +875,20 @@ The row_titles argument to make_subplots must be a list or tuple
             [y_title], domains_list, title_edge="left", offset=40
         )
 
-        layout["annotations"] += tuple(column_title_annotations)
+        annotations.extend(column_title_annotations)
 
     # Handle displaying grid information
     if print_grid:
         print(grid_str)
 
+    if annotations:
+        layout["annotations"] = annotations
+
     # Build resulting figure
-    fig = go.Figure(layout=layout)
+    # The layout only holds the valid axes, domains and annotations built
+    # above, so it is set in one update without validating it again
+    fig = go.Figure()
+    fig._update_validated_layout(layout)
 
     # Attach subplot grid info to the figure
     fig.__dict__["_grid_ref"] = grid_ref
@@ -845,9 +924,9 @@ def _configure_shared_axes(layout, grid_ref, specs, x_or_y, shared, row_dir):
             else:
                 axis_name = subplot_ref.layout_keys[layout_key_ind]
                 axis_to_match = layout[axis_name]
-                axis_to_match.matches = first_axis_id
+                axis_to_match["matches"] = first_axis_id
                 if remove_label:
-                    axis_to_match.showticklabels = False
+                    axis_to_match["showticklabels"] = False
 
         return first_axis_id
 
@@ -992,7 +1071,19 @@ def _init_subplot_domain(x_domain, y_domain):
     return (subplot_ref,)
 
 
+# Subplot type of each trace type, looked up by _subplot_type_for_trace_type
+_trace_subplot_types = {}
+
+
 def _subplot_type_for_trace_type(trace_type):
+    if trace_type not in _trace_subplot_types:
+        _trace_subplot_types[trace_type] = _lookup_subplot_type_for_trace_type(
+            trace_type
+        )
+    return _trace_subplot_types[trace_type]
+
+
+def _lookup_subplot_type_for_trace_type(trace_type):
     from plotly.validators import DataValidator
 
     trace_validator = DataValidator()
@@ -1051,6 +1142,15 @@ def _init_subplot(
     # See GH1031
     x_domain = [max(0.0, x_domain[0]), min(1.0, x_domain[1])]
     y_domain = [max(0.0, y_domain[0]), min(1.0, y_domain[1])]
+    if not (x_domain[0] <= 1.0 and y_domain[0] <= 1.0) or not (
+        x_domain[1] >= 0.0 and y_domain[1] >= 0.0
+    ):
+        raise ValueError(
+            "Invalid subplot domain, x: {x_domain}, y: {y_domain}\n"
+            "    Domain values must be between 0 and 1".format(
+                x_domain=x_domain, y_domain=y_domain
+            )
+        )
 
     if subplot_type == "xy":
         subplot_refs = _init_subplot_xy(
@@ -1136,6 +1236,12 @@ def _build_subplot_title_annotations(
     else:
         raise ValueError("Invalid annotation edge '{edge}'".format(edge=title_edge))
 
+    # Titles are coerced like the text of annotations, since the
+    # annotations are added to the layout without validating them again
+    from plotly.validator_cache import ValidatorCache
+
+    text_validator = ValidatorCache.get_validator("layout.annotation", "text")
+
     plot_titles = []
     for index in range(len(subplot_titles)):
         if not subplot_titles[index] or index >= len(subtitle_pos_y):
@@ -1146,7 +1252,7 @@ def _build_subplot_title_annotations(
                 "xref": "paper",
                 "x": subtitle_pos_x[index],
                 "yref": "paper",
-                "text": subplot_titles[index],
+                "text": text_validator.validate_coerce(subplot_titles[index]),
                 "showarrow": False,
                 "font": dict(size=16),
                 "xanchor": xanchor,
@@ -1316,7 +1422,7 @@ def _set_trace_grid_reference(trace, layout, grid_ref, row, col, secondary_y=Fal
             "Col value is out of range. " "Note: the starting cell is (1, 1)"
         )
     try:
-        subplot_refs = grid_ref[row - 1][col - 1]
+        subplot_refs = _get_grid_cell(grid_ref, row - 1, col - 1)
     except IndexError:
         raise Exception(
             "The (row, col) pair sent is out of "
@@ -1345,24 +1451,41 @@ for the specs argument to plotly.subplots.make_subplots for more information.
     else:
         trace_kwargs = subplot_refs[0].trace_kwargs
 
-    for k in trace_kwargs:
-        if k not in trace:
-            raise ValueError(
-                """\
+    if _subplot_type_for_trace_type(trace.type) != subplot_refs[0].subplot_type:
+        raise ValueError(
+            """\
 Trace type '{typ}' is not compatible with subplot type '{subplot_type}'
 at grid position ({row}, {col}) 
 
 See the docstring for the specs argument to plotly.subplots.make_subplots 
 for more information on subplot types""".format(
-                    typ=trace.type,
-                    subplot_type=subplot_refs[0].subplot_type,
-                    row=row,
-                    col=col,
-                )
+                typ=trace.type,
+                subplot_type=subplot_refs[0].subplot_type,
+                row=row,
+                col=col,
             )
+        )
 
     # Update trace reference
-    trace.update(trace_kwargs)
+    _set_trace_kwargs(trace, trace_kwargs)
+
+
+def _set_trace_kwargs(trace, trace_kwargs):
+    if trace.parent is not None:
+        trace.update(trace_kwargs)
+        return
+
+    # The subplot references of the grid are valid for the traces of the
+    # subplot type, so they are set on traces that are not in a figure yet
+    # without validating them again
+    props = trace._props
+    for k, v in trace_kwargs.items():
+        if k == "domain":
+            domain = props.setdefault("domain", {})
+            domain["x"] = list(v["x"])
+            domain["y"] = list(v["y"])
+        else:
+            props[k] = v
 
 
 def _get_grid_subplot(fig, row, col, secondary_y=False):
@@ -1376,8 +1499,11 @@ def _get_grid_subplot(fig, row, col, secondary_y=False):
             "to create the figure with a subplot grid."
         )
 
-    rows = len(grid_ref)
-    cols = len(grid_ref[0])
+    if isinstance(grid_ref, SubplotGrid):
+        rows, cols = grid_ref.rows, grid_ref.cols
+    else:
+        rows = len(grid_ref)
+        cols = len(grid_ref[0])
 
     # Validate row
     if not isinstance(row, int) or row < 1 or rows < row:
@@ -1398,7 +1524,7 @@ The col argument to get_subplot must be an integer where 1 <= row <= {cols}
             )
         )
 
-    subplot_refs = fig._grid_ref[row - 1][col - 1]
+    subplot_refs = _get_grid_cell(grid_ref, row - 1, col - 1)
     if not subplot_refs:
         return None
 
@@ -1410,13 +1536,15 @@ The col argument to get_subplot must be an integer where 1 <= row <= {cols}
     else:
         layout_keys = subplot_refs[0].layout_keys
 
+    layout = fig.layout
     if len(layout_keys) == 0:
         return SubplotDomain(**subplot_refs[0].trace_kwargs["domain"])
     elif len(layout_keys) == 1:
-        return fig.layout[layout_keys[0]]
+        return _get_layout_subplot(layout, layout_keys[0])
     elif len(layout_keys) == 2:
         return SubplotXY(
-            xaxis=fig.layout[layout_keys[0]], yaxis=fig.layout[layout_keys[1]]
+            xaxis=_get_layout_subplot(layout, layout_keys[0]),
+            yaxis=_get_layout_subplot(layout, layout_keys[1]),
         )
     else:
         raise ValueError(
@@ -1427,6 +1555,15 @@ Unexpected subplot type with layout_keys of {}""".format(
         )
 
 
+def _get_layout_subplot(layout, layout_key):
+    # Subplot objects that already exist are looked up directly, without
+    # parsing the key as a property path
+    subplot = layout._compound_props.get(layout_key, None)
+    if subplot is None:
+        subplot = layout[layout_key]
+    return subplot
+
+
 def _get_subplot_ref_for_trace(trace):
 
     if "domain" in trace:
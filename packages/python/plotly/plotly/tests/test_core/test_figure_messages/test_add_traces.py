@@ -63,3 +63,28 @@ class TestAddTracesMessage(TestCase):
                 {"type": "histogram2dcontour", "line": {"color": "cyan"}},
             ]
         )
+
+    def test_add_validated_traces(self):
+        sankey = go.Sankey(arrangement="snap")
+        contour = go.Histogram2dContour(line={"color": "cyan"})
+        self.figure._add_validated_traces([sankey, contour])
+
+        # The traces are added as is
+        self.assertIs(self.figure.data[-2], sankey)
+        self.assertIs(self.figure.data[-1], contour)
+        self.assertEqual(self.figure.data[-1].line.color, "cyan")
+        self.assertEqual([trace._trace_ind for trace in self.figure.data], [0, 1, 2, 3])
+
+        # Properties are stored in the figure
+        contour.line.color = "red"
+        self.assertEqual(
+            self.figure.to_plotly_json()["data"][-1]["line"]["color"], "red"
+        )
+
+        # Check message
+        self.figure._send_addTraces_msg.assert_called_once_with(
+            [
+                {"type": "sankey", "arrangement": "snap"},
+                {"type": "histogram2dcontour", "line": {"color": "red"}},
+            ]
+        )
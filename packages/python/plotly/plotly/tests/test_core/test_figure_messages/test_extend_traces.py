@@ -0,0 +1,106 @@
+import sys
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+import plotly.graph_objs as go
+
+if sys.version_info >= (3, 3):
+    from unittest.mock import MagicMock
+else:
+    from mock import MagicMock
+
+
+class TestExtendTracesMessage(TestCase):
+    def setUp(self):
+        # Construct with mocked _send_extendTraces_msg method
+        self.figure = go.Figure(
+            data=[
+                go.Scatter(x=[1, 2], y=[3, 4]),
+                go.Scatter(x=np.array([1.0, 2.0]), y=np.array([3.0, 4.0])),
+                go.Bar(),
+            ]
+        )
+
+        # Mock out the message methods
+        self.figure._send_extendTraces_msg = MagicMock()
+        self.figure._send_prependTraces_msg = MagicMock()
+        self.figure._send_restyle_msg = MagicMock()
+
+    def test_extend_list(self):
+        self.figure.extend_traces({"x": [[3, 4]], "y": [[5, 6]]}, 0)
+
+        self.assertEqual(self.figure.data[0].x, (1, 2, 3, 4))
+        self.assertEqual(self.figure.data[0].y, (3, 4, 5, 6))
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"x": [[3, 4]], "y": [[5, 6]]}, [0], None
+        )
+        self.assertFalse(self.figure._send_restyle_msg.called)
+
+    def test_extend_numpy_max_points(self):
+        self.figure.extend_traces(
+            {"x": [np.array([3.0, 4.0])]}, trace_indexes=[1], max_points=3
+        )
+
+        np.testing.assert_array_equal(self.figure.data[1].x, [2.0, 3.0, 4.0])
+        np.testing.assert_array_equal(self.figure.data[1].y, [3.0, 4.0])
+
+        # Only the new points are sent
+        args, _ = self.figure._send_extendTraces_msg.call_args
+        np.testing.assert_array_equal(args[0]["x"][0], [3.0, 4.0])
+        self.assertEqual(args[1:], ([1], 3))
+
+    def test_extend_multiple_traces_max_points_dict(self):
+        self.figure.extend_traces(
+            {"x": [[3], [3.0]], "y": [[5], [5.0]]},
+            trace_indexes=[0, 1],
+            max_points={"x": 2},
+        )
+
+        self.assertEqual(self.figure.data[0].x, (2, 3))
+        self.assertEqual(self.figure.data[0].y, (3, 4, 5))
+        np.testing.assert_array_equal(self.figure.data[1].x, [2.0, 3.0])
+        np.testing.assert_array_equal(self.figure.data[1].y, [3.0, 4.0, 5.0])
+
+    def test_extend_unset_property(self):
+        self.figure.extend_traces({"x": [[1, 2]], "marker.color": [[3, 4]]}, 2)
+
+        self.assertEqual(self.figure.data[2].x, (1, 2))
+        self.assertEqual(self.figure.data[2].marker.color, (3, 4))
+
+    def test_prepend(self):
+        self.figure.prepend_traces(
+            {"x": [[-1, 0], np.array([0.0])]}, trace_indexes=[0, 1], max_points=3
+        )
+
+        self.assertEqual(self.figure.data[0].x, (-1, 0, 1))
+        np.testing.assert_array_equal(self.figure.data[1].x, [0.0, 1.0, 2.0])
+        self.figure._send_prependTraces_msg.assert_called_once()
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+    def test_on_change_callback(self):
+        fn = MagicMock()
+        self.figure.data[0].on_change(fn, "x")
+
+        self.figure.extend_traces({"x": [[3]]}, 0)
+        fn.assert_called_once_with(self.figure.data[0], (1, 2, 3))
+
+    def test_invalid_lengths(self):
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"x": [[3], [4]]}, 0)
+
+    def test_invalid_property(self):
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"bogus": [[3]]}, 0)
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"name": [["a"]]}, 0)
+
+    def test_invalid_max_points(self):
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"x": [[3]]}, 0, max_points=-1)
+
+    def test_invalid_trace_index(self):
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"x": [[3]]}, 5)
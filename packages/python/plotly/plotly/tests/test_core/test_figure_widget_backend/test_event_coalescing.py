@@ -0,0 +1,158 @@
+import sys
+from unittest import TestCase
+
+import pytest
+
+import plotly.graph_objs as go
+
+if sys.version_info >= (3, 3):
+    from unittest.mock import MagicMock
+else:
+    from mock import MagicMock
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+
+class TestEventCoalescing(TestCase):
+    if figure_widget_available:
+
+        def setUp(self):
+            self.fig = go.FigureWidget(
+                data=[go.Scatter(y=[1, 2, 3]), go.Bar(y=[3, 2, 1])],
+                layout={"xaxis": {"range": [0, 1]}},
+            )
+
+            # Capture scheduled callbacks instead of using an event loop
+            self.scheduled = []
+            self.fig._call_later = MagicMock(
+                side_effect=lambda delay, callback: self.scheduled.append(callback)
+                or True
+            )
+
+            self.layout_callback = MagicMock()
+            self.fig.layout.xaxis.on_change(self.layout_callback, "range")
+
+        def relayout(self, relayout_data, source_view_id="view1"):
+            self.fig._js2py_relayout = {
+                "relayout_data": relayout_data,
+                "source_view_id": source_view_id,
+            }
+
+        def restyle(self, style_data, style_traces, source_view_id="view1"):
+            self.fig._js2py_restyle = {
+                "style_data": style_data,
+                "style_traces": style_traces,
+                "source_view_id": source_view_id,
+            }
+
+        def test_immediate_by_default(self):
+            self.relayout({"xaxis.range": [1, 2]})
+            self.assertEqual(self.fig.layout.xaxis.range, (1, 2))
+            self.assertEqual(self.layout_callback.call_count, 1)
+            self.assertFalse(self.fig._call_later.called)
+
+        def test_coalesce_relayout(self):
+            self.fig.event_coalescing_window = 0.1
+            for i in range(10):
+                self.relayout({"xaxis.range": [i, i + 1], "xaxis.autorange": False})
+
+            # Nothing processed until the window ends
+            self.assertEqual(self.fig.layout.xaxis.range, (0, 1))
+            self.assertEqual(len(self.scheduled), 1)
+            self.assertEqual(self.fig._call_later.call_args[0][0], 0.1)
+
+            self.scheduled.pop()()
+            self.assertEqual(self.fig.layout.xaxis.range, (9, 10))
+            self.assertEqual(self.layout_callback.call_count, 1)
+
+            # A new window starts with the next event
+            self.relayout({"xaxis.range": [5, 6]})
+            self.assertEqual(len(self.scheduled), 1)
+
+        def test_coalesce_preserves_last_write_order(self):
+            self.fig.event_coalescing_window = 0.1
+            self.relayout({"xaxis.range": [2, 3]})
+            self.relayout({"xaxis": {"range": [4, 5]}})
+            self.relayout({"xaxis.range[1]": 6})
+            self.scheduled.pop()()
+
+            self.assertEqual(self.fig.layout.xaxis.range, (4, 6))
+
+        def test_coalesce_restyle(self):
+            self.fig.event_coalescing_window = 0.1
+            self.restyle({"visible": ["legendonly"]}, [0])
+            self.restyle({"visible": [True]}, [0])
+            self.restyle({"visible": ["legendonly"]}, [1])
+            self.relayout({"xaxis.range": [2, 3]})
+
+            self.assertIsNone(self.fig.data[0].visible)
+            self.scheduled.pop()()
+
+            self.assertEqual(self.fig.data[0].visible, True)
+            self.assertEqual(self.fig.data[1].visible, "legendonly")
+            self.assertEqual(self.fig.layout.xaxis.range, (2, 3))
+
+        def test_disable_window_flushes(self):
+            self.fig.event_coalescing_window = 0.1
+            self.relayout({"xaxis.range": [2, 3]})
+            self.fig.event_coalescing_window = None
+            self.assertEqual(self.fig.layout.xaxis.range, (2, 3))
+
+        def test_stale_scheduled_flush(self):
+            self.fig.event_coalescing_window = 0.1
+            self.relayout({"xaxis.range": [2, 3]})
+
+            # Update events flush the window before its scheduled flush
+            self.fig._js2py_update = {
+                "style_data": {},
+                "style_traces": None,
+                "layout_data": {"title.text": "Title"},
+                "source_view_id": "view1",
+            }
+            self.assertEqual(self.fig.layout.xaxis.range, (2, 3))
+
+            # The flush of the first window doesn't flush the next window
+            self.relayout({"xaxis.range": [4, 5]})
+            stale_flush, flush = self.scheduled
+            stale_flush()
+            self.assertEqual(self.fig.layout.xaxis.range, (2, 3))
+
+            flush()
+            self.assertEqual(self.fig.layout.xaxis.range, (4, 5))
+
+        @pytest.mark.skipif(sys.version_info < (3,), reason="asyncio kernels")
+        def test_current_tornado_loop_not_running(self):
+            tornado_ioloop = pytest.importorskip("tornado.ioloop")
+            loop = tornado_ioloop.IOLoop()
+            loop.make_current()
+            try:
+                fig = go.FigureWidget(layout={"xaxis": {"range": [0, 1]}})
+                fig.event_coalescing_window = 0.1
+                fig._js2py_relayout = {
+                    "relayout_data": {"xaxis.range": [1, 2]},
+                    "source_view_id": "view1",
+                }
+                self.assertEqual(fig.layout.xaxis.range, (1, 2))
+            finally:
+                loop.clear_current()
+                loop.close()
+
+        def test_no_event_loop(self):
+            fig = go.FigureWidget(layout={"xaxis": {"range": [0, 1]}})
+            fig.event_coalescing_window = 0.1
+            fig._js2py_relayout = {
+                "relayout_data": {"xaxis.range": [1, 2]},
+                "source_view_id": "view1",
+            }
+            self.assertEqual(fig.layout.xaxis.range, (1, 2))
+
+        def test_invalid_window(self):
+            with pytest.raises(ValueError):
+                self.fig.event_coalescing_window = -1
+
+            with pytest.raises(ValueError):
+                self.fig.event_coalescing_window = "1s"
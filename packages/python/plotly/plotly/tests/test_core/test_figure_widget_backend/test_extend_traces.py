@@ -0,0 +1,66 @@
+from unittest import TestCase
+import plotly.graph_objs as go
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+
+class TestExtendTracesMessages(TestCase):
+    if figure_widget_available:
+
+        def setUp(self):
+            self.fig = go.FigureWidget(data=[go.Scatter(x=[1, 2], y=[3, 4])])
+            self.msgs = []
+            self.fig.observe(
+                lambda change: self.msgs.append(change["new"]),
+                names=["_py2js_extendTraces", "_py2js_prependTraces"],
+            )
+
+        def test_extend_traces_msg(self):
+            self.fig.extend_traces({"x": [[3]], "y": [[5]]}, 0, max_points=2)
+
+            # Message is set, then reset to None
+            self.assertEqual(len(self.msgs), 2)
+            msg = self.msgs[0]
+            self.assertIsNone(self.msgs[1])
+
+            self.assertEqual(msg["extend_data"], {"x": [[3]], "y": [[5]]})
+            self.assertEqual(msg["extend_traces"], [0])
+            self.assertEqual(msg["max_points"], 2)
+            self.assertEqual(msg["trace_edit_id"], self.fig._last_trace_edit_id)
+            self.assertEqual(msg["layout_edit_id"], self.fig._last_layout_edit_id)
+
+            self.assertEqual(self.fig.data[0].x, (2, 3))
+            self.assertEqual(self.fig._data[0]["y"], [4, 5])
+
+        def test_prepend_traces_msg(self):
+            self.fig.prepend_traces({"x": [[0]]}, 0)
+
+            msg = self.msgs[0]
+            self.assertEqual(msg["prepend_data"], {"x": [[0]]})
+            self.assertEqual(msg["prepend_traces"], [0])
+            self.assertIsNone(msg["max_points"])
+            self.assertEqual(self.fig.data[0].x, (0, 1, 2))
+
+        def test_extend_traces_msg_max_points_dict(self):
+            self.fig.add_scatter(x=[5], y=[6])
+            self.fig.extend_traces(
+                {"x": [[3], [7]], "y": [[5], [8]]}, [0, 1], max_points={"x": 2}
+            )
+
+            # Every key of the update maps to one value per trace index
+            msg = self.msgs[0]
+            self.assertEqual(msg["max_points"], {"x": [2, 2], "y": [None, None]})
+            self.assertEqual(self.fig.data[0].x, (2, 3))
+            self.assertEqual(self.fig.data[0].y, (3, 4, 5))
+            self.assertEqual(self.fig.data[1].x, (5, 7))
+
+        def test_prepend_traces_msg_max_points_dict(self):
+            self.fig.prepend_traces({"x": [[0]]}, 0, max_points={"x": 2, "y": 1})
+
+            msg = self.msgs[0]
+            self.assertEqual(msg["max_points"], {"x": [2]})
+            self.assertEqual(self.fig.data[0].x, (0, 1))
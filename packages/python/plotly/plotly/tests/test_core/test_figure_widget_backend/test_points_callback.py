@@ -0,0 +1,110 @@
+from unittest import TestCase
+
+import numpy as np
+
+import plotly.graph_objs as go
+from plotly.callbacks import Points
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+
+class TestPoints(TestCase):
+    def test_readonly_arrays(self):
+        points = Points(point_inds=[0, 2], xs=[1.0, 3.0], ys=["a", 2])
+
+        np.testing.assert_array_equal(points.point_inds, [0, 2])
+        self.assertFalse(points.point_inds.flags["WRITEABLE"])
+        self.assertEqual(points.ys.dtype, np.dtype("object"))
+
+    def test_numpy_input_not_copied(self):
+        inds = np.arange(5)
+        points = Points(point_inds=inds)
+
+        self.assertTrue(np.shares_memory(points.point_inds, inds))
+        self.assertFalse(points.point_inds.flags["WRITEABLE"])
+        self.assertTrue(inds.flags["WRITEABLE"])
+
+    def test_repr_elided(self):
+        points = Points(point_inds=np.arange(1000))
+        self.assertIn("...", repr(points))
+
+
+class TestPointsCallback(TestCase):
+    if figure_widget_available:
+
+        def setUp(self):
+            self.fig = go.FigureWidget(data=[go.Scatter(y=[1, 2, 3]) for _ in range(4)])
+            self.selections = []
+            for trace in self.fig.data[:2]:
+                trace.on_selection(
+                    lambda trace, points, selector: self.selections.append(
+                        (trace, points)
+                    )
+                )
+
+        def send_selected(self, trace_indexes, point_indexes):
+            self.fig._js2py_pointsCallback = {
+                "event_type": "plotly_selected",
+                "points": {
+                    "trace_indexes": np.array(trace_indexes, dtype="int32"),
+                    "point_indexes": np.array(point_indexes, dtype="int32"),
+                    "xs": np.array(point_indexes, dtype="float64"),
+                    "ys": np.array(point_indexes, dtype="float64") + 1,
+                },
+                "selector": {
+                    "type": "box",
+                    "selector_state": {"xrange": [0, 3], "yrange": [0, 3]},
+                },
+            }
+
+        def test_group_points_by_trace(self):
+            trace_points = self.fig._group_points_by_trace(
+                {
+                    "trace_indexes": np.array([2, 0, 2, 0]),
+                    "point_indexes": np.array([0, 1, 2, 0]),
+                    "xs": [10, 11, 12, 13],
+                    "ys": np.array([20, 21, 22, 23]),
+                }
+            )
+
+            self.assertEqual(sorted(trace_points), [0, 2])
+            np.testing.assert_array_equal(trace_points[0]["point_inds"], [1, 0])
+            np.testing.assert_array_equal(trace_points[0]["xs"], [11, 13])
+            np.testing.assert_array_equal(trace_points[2]["ys"], [20, 22])
+
+        def test_selection_dispatch(self):
+            self.send_selected([2, 2, 0], [0, 1, 2])
+
+            # Trace 0 has points, trace 1 has a callback, trace 2 has points
+            # but no callback
+            self.assertEqual(
+                [trace for trace, _ in self.selections],
+                [self.fig.data[0], self.fig.data[1]],
+            )
+            np.testing.assert_array_equal(self.selections[0][1].point_inds, [2])
+            self.assertEqual(len(self.selections[1][1].point_inds), 0)
+
+            # selectedpoints updated on all traces
+            np.testing.assert_array_equal(self.fig.data[0].selectedpoints, [2])
+            self.assertEqual(len(self.fig.data[1].selectedpoints), 0)
+            np.testing.assert_array_equal(self.fig.data[2].selectedpoints, [0, 1])
+            self.assertEqual(len(self.fig.data[3].selectedpoints), 0)
+
+        def test_deselect_clears_selectedpoints(self):
+            self.send_selected([3], [1])
+            self.fig._js2py_pointsCallback = {
+                "event_type": "plotly_deselect",
+                "points": {
+                    "trace_indexes": [],
+                    "point_indexes": [],
+                    "xs": [],
+                    "ys": [],
+                },
+            }
+
+            for trace in self.fig.data:
+                self.assertIsNone(trace.selectedpoints)
@@ -0,0 +1,148 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+import plotly.graph_objs as go
+from plotly.resampling import downsample_indices, lttb_indices, minmax_indices
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+
+def test_minmax_indices_keeps_extremes():
+    y = np.zeros(10001)
+    y[1234] = 10
+    y[5678] = -10
+    y[9000] = np.nan
+
+    inds = minmax_indices(y, 100)
+    assert len(inds) <= 100
+    assert inds[0] == 0 and inds[-1] == 10000
+    assert 1234 in inds and 5678 in inds
+    assert 9000 not in inds
+    np.testing.assert_array_equal(inds, np.unique(inds))
+
+
+def test_lttb_indices():
+    x = np.arange(10000)
+    y = np.sin(x / 100.0)
+
+    inds = lttb_indices(x, y, 200)
+    assert len(inds) == 200
+    assert inds[0] == 0 and inds[-1] == 9999
+    assert np.all(np.diff(inds) > 0)
+
+
+def test_short_series_unchanged():
+    np.testing.assert_array_equal(
+        downsample_indices(np.arange(5), np.arange(5), 10), np.arange(5)
+    )
+
+
+def test_invalid_method():
+    with pytest.raises(ValueError):
+        downsample_indices(np.arange(5), np.arange(5), 3, method="bogus")
+
+
+class TestFigureWidgetResampling(TestCase):
+    if figure_widget_available:
+
+        def setUp(self):
+            self.x = np.arange(100000)
+            self.y = np.random.randn(100000)
+            self.fig = go.FigureWidget()
+            self.fig.enable_resampling(max_points=500)
+            self.fig.add_scattergl(x=self.x, y=self.y, customdata=self.x * 2)
+
+        def test_downsampled_on_add(self):
+            trace = self.fig.data[0]
+            self.assertLessEqual(len(trace.x), 500)
+            np.testing.assert_array_equal(trace.customdata, trace.x * 2)
+
+            full_data = self.fig.get_full_resolution_data(0)
+            np.testing.assert_array_equal(full_data["y"], self.y)
+            self.assertEqual(set(full_data), {"x", "y", "customdata"})
+
+        def test_zoom(self):
+            self.fig.layout.xaxis.range = [1000, 1100]
+
+            # All the points in the range, and one point on either side
+            np.testing.assert_array_equal(self.fig.data[0].x, np.arange(999, 1102))
+            np.testing.assert_array_equal(self.fig.data[0].y, self.y[999:1102])
+
+            self.fig.layout.xaxis.autorange = True
+            self.assertLessEqual(len(self.fig.data[0].x), 500)
+            self.assertEqual(self.fig.data[0].x[-1], 99999)
+
+        def test_zoom_from_frontend(self):
+            self.fig._js2py_relayout = {
+                "relayout_data": {"xaxis.range[0]": 10.5, "xaxis.range[1]": 20},
+                "source_view_id": "view-1",
+            }
+            np.testing.assert_array_equal(self.fig.data[0].x, np.arange(10, 22))
+
+        def test_reassign_then_zoom(self):
+            fig = go.FigureWidget()
+            fig.enable_resampling(max_points=100)
+            fig.add_scatter(x=np.arange(10000.0), y=np.arange(10000.0) + 100)
+
+            # The new values replace the full resolution data
+            fig.data[0].y = np.zeros(10000) + 5
+            np.testing.assert_array_equal(
+                fig.get_full_resolution_data(0)["y"], np.zeros(10000) + 5
+            )
+
+            fig.layout.xaxis.range = [0, 5000]
+            self.assertLessEqual(len(fig.data[0].y), 100)
+            self.assertTrue(np.all(fig.data[0].y == 5))
+            self.assertLessEqual(fig.data[0].x[-1], 5001)
+
+            # Short values end resampling, with the full resolution x
+            fig.data[0].y = np.arange(50.0)
+            self.assertIsNone(fig.get_full_resolution_data(0))
+            self.assertEqual(len(fig.data[0].x), 10000)
+
+            fig.layout.xaxis.range = [0, 10]
+            self.assertEqual(len(fig.data[0].y), 50)
+
+        def test_existing_and_small_traces(self):
+            fig = go.FigureWidget(
+                data=[go.Scatter(y=np.arange(2000.0)), go.Scatter(y=[1, 2, 3])]
+            )
+            fig.enable_resampling(max_points=100, method="lttb")
+
+            self.assertEqual(len(fig.data[0].y), 100)
+            self.assertEqual(fig.data[1].y, (1, 2, 3))
+            self.assertIsNone(fig.get_full_resolution_data(1))
+
+            fig.layout.xaxis.range = [10, 20]
+            np.testing.assert_array_equal(fig.data[0].x, np.arange(9, 22))
+
+        def test_dates(self):
+            x = np.arange("2020-01-01", "2020-01-11", dtype="datetime64[m]")
+            fig = go.FigureWidget()
+            fig.enable_resampling(max_points=100)
+            fig.add_scatter(x=x, y=np.arange(len(x)))
+            self.assertLessEqual(len(fig.data[0].x), 100)
+
+            fig.layout.xaxis.range = ["2020-01-02 00:00", "2020-01-02 00:10"]
+            self.assertEqual(len(fig.data[0].x), 13)
+            self.assertEqual(fig.data[0].y[1], 1440)
+
+        def test_unsorted_x_not_resampled(self):
+            x = np.random.permutation(1000)
+            fig = go.FigureWidget()
+            fig.enable_resampling(max_points=100)
+            fig.add_scatter(x=x, y=x)
+            self.assertEqual(len(fig.data[0].x), 1000)
+
+        def test_invalid_arguments(self):
+            with pytest.raises(ValueError):
+                self.fig.enable_resampling(max_points=2)
+
+            with pytest.raises(ValueError):
+                self.fig.enable_resampling(method="bogus")
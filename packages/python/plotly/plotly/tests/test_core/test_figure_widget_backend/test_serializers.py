@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from plotly.serializers import _py_to_js, _js_to_py
+
+
+def _decode(res):
+    # Rebuild an array from a serialized buffer as the JavaScript side does
+    return np.frombuffer(res["buffer"], dtype=res["dtype"]).reshape(res["shape"])
+
+
+@pytest.mark.parametrize(
+    "dtype", ["int8", "int16", "int32", "uint8", "uint16", "uint32", "float32"]
+)
+def test_1d_typed_array(dtype):
+    v = np.arange(10, dtype=dtype)
+    res = _py_to_js(v, None)
+    assert res["dtype"] == dtype
+    assert res["shape"] == (10,)
+    np.testing.assert_array_equal(_decode(res), v)
+
+
+def test_2d_array_as_single_buffer():
+    v = np.arange(12, dtype="float64").reshape(3, 4)
+    res = _py_to_js({"z": [v]}, None)["z"][0]
+    assert res["dtype"] == "float64"
+    assert res["shape"] == (3, 4)
+    np.testing.assert_array_equal(_decode(res), v)
+
+
+def test_non_contiguous_array():
+    v = np.arange(12, dtype="float64").reshape(3, 4).T
+    res = _py_to_js(v, None)
+    assert res["shape"] == (4, 3)
+    np.testing.assert_array_equal(_decode(res), v)
+
+
+def test_non_native_byte_order():
+    v = np.arange(5, dtype=">f8")
+    res = _py_to_js(v, None)
+    assert res["dtype"] == "float64"
+    np.testing.assert_array_equal(_decode(res), v)
+
+
+@pytest.mark.parametrize(
+    "v,dtype",
+    [
+        (np.array([-3, 0, 2 ** 31 - 1], dtype="int64"), "int32"),
+        (np.array([0, 2 ** 32 - 1], dtype="uint64"), "uint32"),
+        (np.array([-(2 ** 40), 2 ** 40], dtype="int64"), "float64"),
+        (np.array([], dtype="int64"), "int32"),
+    ],
+)
+def test_64bit_integers_downcast(v, dtype):
+    res = _py_to_js(v, None)
+    assert res["dtype"] == dtype
+    np.testing.assert_array_equal(_decode(res), v)
+
+
+def test_64bit_integer_overflow_falls_back_to_list():
+    v = np.array([0, 2 ** 60], dtype="int64")
+    assert _py_to_js(v, None) == [0, 2 ** 60]
+
+
+def test_non_numeric_array_to_list():
+    v = np.array(["a", "b"])
+    assert _py_to_js(v, None) == ["a", "b"]
+
+
+def test_js_to_py_typed_array():
+    v = np.arange(6, dtype="int32")
+    res = _js_to_py(
+        {
+            "points": {
+                "dtype": "int32",
+                "shape": [2, 3],
+                "value": memoryview(v.tobytes()),
+            }
+        },
+        None,
+    )["points"]
+    assert res.shape == (2, 3)
+    assert not res.flags["WRITEABLE"]
+    np.testing.assert_array_equal(res, v.reshape(2, 3))
+
+
+def test_js_to_py_plain_dict():
+    v = {"dtype": "int32", "shape": [1], "value": 3}
+    assert _js_to_py(v, None) == v
@@ -181,6 +181,27 @@ class TemplateTest(TestCase):
         fig = go.Figure()
         self.assertEqual(fig.layout.template, template)
 
+    def test_template_preload(self):
+        pio.templates.preload("ggplot2", "test_template+presentation")
+
+        # Preloaded templates have their graph objects built
+        template = pio.templates._templates["ggplot2"]
+        self.assertIsInstance(template, go.layout.Template)
+        self.assertIn("xaxis", template.layout._compound_props)
+        self.assertIn("scatter", template.data._compound_array_props)
+        self.assertIs(pio.templates["ggplot2"], template)
+
+        # As are merged templates
+        merged = pio.templates["test_template+presentation"]
+        self.assertIs(pio.templates["test_template+presentation"], merged)
+        self.assertIn("font", merged.layout._compound_props)
+        self.assertEqual(merged.layout.font.family, "Rockwell")
+
+    def test_template_preload_all(self):
+        pio.templates.preload()
+        for template in pio.templates._templates.values():
+            self.assertIsInstance(template, go.layout.Template)
+
 
 class TestToTemplated(TestCaseNoTemplate):
     def test_move_layout_nested_properties(self):
@@ -523,6 +544,37 @@ class TestMergeTemplates(TestCase):
         expected = self.expected1_2
         self.assertEqual(result, expected)
 
+    def test_flaglist_string_getitem_memoized(self):
+        result = pio.templates["template1+template2"]
+        self.assertIs(pio.templates["template1+template2"], result)
+
+        # Replacing one of the templates invalidates the merged template
+        template3 = go.layout.Template(layout={"margin": {"l": 0, "r": 0}})
+        pio.templates["template2"] = template3
+        result = pio.templates["template1+template2"]
+        expected = go.layout.Template(self.template1)
+        expected.update(template3)
+        self.assertEqual(result, expected)
+
+        # And so does removing it
+        del pio.templates["template2"]
+        with pytest.raises(KeyError):
+            pio.templates["template1+template2"]
+
+    def test_template_object_assignment(self):
+        fig = go.Figure()
+        fig.layout.template = self.template1
+
+        # The template is copied
+        self.assertEqual(fig.layout.template, self.template1)
+        self.assertIsNot(fig.layout.template, self.template1)
+        fig.layout.template.layout.font.size = 10
+        self.assertEqual(self.template1, self.template1_orig)
+
+        # The copy validates further changes
+        with pytest.raises(ValueError):
+            fig.layout.template.layout = {"bogus": 1}
+
     def test_update_template_with_flaglist(self):
         fig = go.Figure()
         fig.update(layout_template="template1+template2")
@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+import pytest
+
+import plotly.graph_objs as go
+
+
+class TestTraceUidIndex(TestCase):
+    def setUp(self):
+        self.fig = go.Figure(
+            [go.Scatter(uid="a"), go.Bar(uid="b"), go.Scatter(uid="c")]
+        )
+
+    def test_lookup(self):
+        self.assertEqual(self.fig._get_trace_index_by_uid("a"), 0)
+        self.assertEqual(self.fig._get_trace_index_by_uid("c"), 2)
+
+    def test_add_traces(self):
+        self.fig.add_traces([go.Scatter(uid="d"), go.Scatter(uid="e")])
+        self.assertEqual(self.fig._trace_uid_inds["e"], 4)
+        self.assertEqual(self.fig._get_trace_index_by_uid("d"), 3)
+
+    def test_move_and_delete_traces(self):
+        self.fig.data = [self.fig.data[2], self.fig.data[0]]
+        self.assertEqual(self.fig._trace_uid_inds, {"c": 0, "a": 1})
+        with pytest.raises(ValueError):
+            self.fig._get_trace_index_by_uid("b")
+
+    def test_uid_assigned_after_construction(self):
+        self.fig.data[1].uid = "z"
+        self.assertEqual(self.fig._get_trace_index_by_uid("z"), 1)
+        with pytest.raises(ValueError):
+            self.fig._get_trace_index_by_uid("b")
@@ -150,3 +150,60 @@ def test_imshow_labels_and_ranges():
 
     with pytest.raises(ValueError):
         fig = px.imshow([[1, 2], [3, 4], [5, 6]], x=["a"])
+
+
+def decode_image_source(source):
+    PIL_Image = pytest.importorskip("PIL.Image")
+    import base64
+    import io
+
+    header, data = source.split(",")
+    return header, np.asarray(PIL_Image.open(io.BytesIO(base64.b64decode(data))))
+
+
+def test_binary_string():
+    img = np.zeros((20, 30, 3), dtype=np.uint8)
+    img[:10, :, 0] = 255
+    fig = px.imshow(img, binary_string=True)
+    assert len(fig.data) == 0
+    image = fig.layout.images[0]
+    header, decoded = decode_image_source(image.source)
+    assert header == "data:image/png;base64"
+    np.testing.assert_array_equal(decoded, img)
+    assert (image.x, image.y, image.sizex, image.sizey) == (-0.5, -0.5, 30, 20)
+    assert fig.layout.xaxis.range == (-0.5, 29.5)
+    assert fig.layout.yaxis.range == (19.5, -0.5)
+
+    # Contrast rescaling, downscaling and jpeg compression
+    fig = px.imshow(
+        img, zmax=128, binary_string=True, binary_format="jpg", binary_max_size=15
+    )
+    header, decoded = decode_image_source(fig.layout.images[0].source)
+    assert header == "data:image/jpeg;base64"
+    assert decoded.shape == (10, 15, 3)
+
+
+def test_binary_string_single_channel():
+    img = np.arange(200.0).reshape((10, 20))
+    x = np.linspace(0, 1, 20)
+    fig = px.imshow(
+        img, x=x, origin="lower", binary_string=True, binary_hover_max_size=5
+    )
+    _, decoded = decode_image_source(fig.layout.images[0].source)
+    # Grayscale image, with the first row at the bottom
+    assert decoded.shape == (10, 20)
+    assert decoded[-1, 0] == 0 and decoded[0, -1] == 255
+    assert fig.layout.yaxis.range == (-0.5, 9.5)
+    assert fig.layout.images[0].y == 9.5
+    assert fig.layout.coloraxis.colorscale is None
+
+    # Values of a subsample of the pixels are displayed on hover
+    (trace,) = fig.data
+    assert trace.type == "heatmap"
+    assert trace.opacity == 0
+    np.testing.assert_array_equal(trace.z, img[::4, ::4])
+    assert trace.dx == 4 * x[1]
+    assert "%{z}" in trace.hovertemplate
+
+    with pytest.raises(ValueError):
+        px.imshow(img, x=x ** 2, binary_string=True)
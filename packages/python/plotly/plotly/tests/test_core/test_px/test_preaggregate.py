@@ -0,0 +1,93 @@
+import plotly.express as px
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_array_equal, assert_allclose
+
+from plotly.express._binning import auto_bin
+
+
+def test_auto_bin():
+    # Integers are centered in bins of size 1
+    spec = auto_bin(np.array([1, 2, 2, 3, 3, 3]))
+    assert (spec.start, spec.size, spec.nbins) == (0.5, 1, 3)
+
+    # Bin sizes are rounded like axis ticks
+    spec = auto_bin(np.array([0.0, 10.0]), nbins=4)
+    assert spec.size == 5
+    assert spec.start <= 0 and spec.end > 10
+
+    spec = auto_bin(np.array(["a", "b", "a", None]))
+    assert spec.categories == ["a", "b"]
+
+
+def test_histogram_preaggregate():
+    df = pd.DataFrame(dict(x=[1, 2, 2, 3, 3, 3], y=[1.0, 2.0, 4.0, 1.0, 2.0, 3.0]))
+    fig = px.histogram(df, x="x", preaggregate=True)
+    trace = fig.data[0]
+    assert trace.type == "bar"
+    assert_array_equal(trace.x, [1, 2, 3])
+    assert_array_equal(trace.y, [1, 2, 3])
+    assert trace.hovertext == ("1", "2", "3")
+    assert trace.hovertemplate == "x=%{hovertext}<br>count=%{y}<extra></extra>"
+    assert fig.layout.bargap == 0
+
+    fig = px.histogram(df, x="x", y="y", histfunc="avg", preaggregate=True)
+    assert_array_equal(fig.data[0].y, [1, 3, 2])
+
+    fig = px.histogram(
+        df, x="x", histnorm="percent", cumulative=True, preaggregate=True
+    )
+    assert_allclose(fig.data[0].y, [100 / 6, 50, 100])
+    assert fig.data[0].hovertext is None
+
+
+def test_histogram_preaggregate_shared_bins():
+    df = pd.DataFrame(dict(x=[0.5, 1.5, 11.3, 12.7, 13.1], c=["a", "a", "b", "b", "b"]))
+    fig = px.histogram(df, x="x", color="c", nbins=3, preaggregate=True)
+    a, b = fig.data
+    # Empty bins at the ends of traces are trimmed
+    assert_array_equal(a.x, [2.5])
+    assert a.width == 5
+    assert_array_equal(b.x, [12.5])
+    assert_array_equal(b.y, [3])
+    assert b.hovertext == ("10 - 14",)
+
+
+def test_histogram_preaggregate_categories():
+    tips = px.data.tips()
+    fig = px.histogram(tips, y="day", color="sex", orientation="h", preaggregate=True)
+    for trace, sex in zip(fig.data, ["Female", "Male"]):
+        assert trace.orientation == "h"
+        counts = tips[tips.sex == sex].day.value_counts()
+        assert_array_equal(trace.x, counts[list(trace.y)].values)
+    assert fig.layout.bargap is None
+
+
+def test_density_heatmap_preaggregate():
+    tips = px.data.tips()
+    fig = px.density_heatmap(
+        tips,
+        x="total_bill",
+        y="tip",
+        z="size",
+        histfunc="sum",
+        marginal_x="histogram",
+        preaggregate=True,
+    )
+    heatmap, histogram = fig.data
+    assert heatmap.type == "heatmap"
+    assert heatmap.coloraxis == "coloraxis"
+    assert np.shape(heatmap.z) == (len(heatmap.y), len(heatmap.x))
+    assert np.sum(heatmap.z) == tips["size"].sum()
+    # The marginal histogram shares the bins of the heatmap
+    assert_array_equal(histogram.x, heatmap.x[: len(histogram.x)])
+    assert np.sum(histogram.y) == len(tips)
+
+
+def test_preaggregate_unsupported():
+    df = pd.DataFrame(dict(x=pd.date_range("2020-01-01", periods=3), y=[1, 2, 3]))
+    with pytest.raises(ValueError):
+        px.histogram(df, x="x", preaggregate=True)
+    with pytest.raises(ValueError):
+        px.histogram(df, x="y", log_x=True, preaggregate=True)
@@ -1,5 +1,6 @@
 import plotly.express as px
 import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -235,7 +236,88 @@ def test_orthogonal_orderings():
             assert_orderings(days, days, times, times)
 
 
+def test_group_rows():
+    df = pd.DataFrame(
+        dict(
+            x=[0, 1, 2, 3, 4, 5],
+            color=["b", "a", None, "b", "a", "b"],
+            symbol=[1, 1, 2, 2, 1, 1],
+        )
+    )
+    fig = px.scatter(df, x="x", y="x", color="color", symbol="symbol")
+
+    # Rows keep their order within groups, rows with missing values are dropped
+    assert [trace.name for trace in fig.data] == ["b, 1", "b, 2", "a, 1"]
+    assert [tuple(trace.x) for trace in fig.data] == [(0, 5), (3,), (1, 4)]
+
+    fig = px.scatter(df, x="x", y="x", category_orders=dict(color=["a", "b"]))
+    assert len(fig.data) == 1
+    assert tuple(fig.data[0].x) == tuple(df.x)
+
+
+def test_animation_frames():
+    gapminder = px.data.gapminder()
+    fig = px.scatter(
+        gapminder,
+        x="gdpPercap",
+        y="lifeExp",
+        size="pop",
+        color="continent",
+        hover_name="country",
+        animation_frame="year",
+        animation_group="country",
+    )
+    years = gapminder.year.unique()
+    assert [frame.name for frame in fig.frames] == [str(year) for year in years]
+    asia = gapminder[gapminder.continent == "Asia"]
+
+    # The traces of the figure are complete
+    trace = fig.data[0]
+    assert trace.marker.color is not None
+    assert np.all(trace.x == asia[asia.year == years[0]].gdpPercap)
+    assert len(trace.ids) == len(trace.x)
+
+    # Frames only contain the properties that change over time
+    frames = fig.to_plotly_json()["frames"]
+    for frame, year in zip(frames, years):
+        frame_trace = frame["data"][0]
+        assert set(frame_trace) == {"type", "x", "y", "marker", "hovertemplate"}
+        assert frame_trace["type"] == "scatter"
+        assert np.all(frame_trace["x"] == asia[asia.year == year].gdpPercap)
+        assert np.all(frame_trace["marker"]["size"] == asia[asia.year == year]["pop"])
+        assert set(frame_trace["marker"]) == {"size"}
+        assert "year=%s" % year in frame_trace["hovertemplate"]
+
+
 def test_permissive_defaults():
     msg = "'PxDefaults' object has no attribute 'should_not_work'"
     with pytest.raises(AttributeError, match=msg):
         px.defaults.should_not_work = "test"
+
+
+def test_trace_props():
+    tips = px.data.tips()
+    fig = px.scatter(
+        tips,
+        x="total_bill",
+        y="tip",
+        color="day",
+        symbol="smoker",
+        marginal_y="histogram",
+    )
+    scatters = [trace for trace in fig.data if trace.type == "scatter"]
+    histograms = [trace for trace in fig.data if trace.type == "histogram"]
+    assert len(scatters) == len(histograms) == 8
+    for trace in scatters:
+        assert trace.marker.symbol in ["circle", "diamond"]
+        assert trace.legendgroup == trace.name
+    # Marginals take the color of their group, and ignore the symbol
+    colors = {trace.name: trace.marker.color for trace in scatters}
+    for trace in histograms:
+        assert trace.marker.color == colors[trace.name]
+        assert trace.showlegend is False
+
+    # Traces are not shared with the figure of another call
+    fig2 = px.scatter(tips, x="total_bill", y="tip", color="day")
+    fig2.data[0].marker.color = "black"
+    assert fig.data[0].marker.color != "black"
@@ -277,6 +277,35 @@ def test_sunburst_treemap_with_path_non_rectangular():
     assert fig.data[0].values[-1] == np.sum(values)
 
 
+def test_sunburst_treemap_with_path_large():
+    rng = np.random.RandomState(0)
+    n = 10000
+    df = pd.DataFrame(
+        dict(
+            region=rng.choice(["North", "South"], n),
+            country=rng.choice(list("abcdefgh"), n),
+            city=rng.choice(list("abcdefghij"), n),
+            values=rng.randint(1, 10, n),
+        )
+    )
+    df = df.groupby(["region", "country", "city"], as_index=False).sum()
+    fig = px.treemap(df, path=["region", "country", "city"], values="values")
+    trace = fig.data[0]
+    ids = np.array(trace.ids)
+    parents = np.array(trace.parents)
+    values = np.array(trace.values)
+    assert len(set(ids)) == len(ids) == len(df) + 2 * 8 + 2
+    # Labels are repeated under different parents, ids are not
+    assert len(set(trace.labels)) < len(ids)
+    # The value of each node is the sum of the values of its children
+    for node_id, value in zip(ids, values):
+        children = parents == node_id
+        if children.any():
+            assert values[children].sum() == value
+    assert set(parents[parents != ""]) <= set(ids)
+    assert values[parents == ""].sum() == df["values"].sum()
+
+
 def test_pie_funnelarea_colorscale():
     labels = ["A", "B", "C", "D"]
     values = [3, 2, 1, 4]
@@ -298,6 +327,31 @@ def test_pie_funnelarea_colorscale():
         assert np.all([col in color_seq for col in fig.data[0].marker.colors])
 
 
+def test_pie_like_discrete_color_map():
+    labels = ["A", "B", "C", "D", "E", "F"]
+    values = [3, 2, 1, 4, 2, 5]
+    colors = ["y", "x", "z", "x", None, "w"]
+    color_seq = ["red", "green", "blue", "orange"]
+    for func in [px.pie, px.funnel_area, px.sunburst, px.treemap]:
+        fig = func(
+            names=labels,
+            values=values,
+            color=colors,
+            color_discrete_sequence=color_seq,
+            color_discrete_map={"x": "black", "v": "white", "w": None},
+        )
+        # Values are mapped in order of first appearance, after the values of
+        # color_discrete_map
+        assert list(fig.data[0].marker.colors) == [
+            "orange",
+            "black",
+            "red",
+            "black",
+            "green",
+            "blue",
+        ]
+
+
 def test_funnel():
     fig = px.funnel(
         x=[5, 4, 3, 3, 2, 1],
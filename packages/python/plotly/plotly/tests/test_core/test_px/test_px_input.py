@@ -2,6 +2,9 @@ import plotly.express as px
 import numpy as np
 import pandas as pd
 import pytest
+import subprocess
+import sys
+from plotly.express._columns import Columns
 from plotly.express._core import build_dataframe
 from pandas.util.testing import assert_frame_equal
 
@@ -323,3 +326,86 @@ def test_size_column():
     df = px.data.tips()
     fig = px.scatter(df, x=df["size"], y=df.tip)
     assert fig.data[0].hovertemplate == "size=%{x}<br>tip=%{y}<extra></extra>"
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        dict(dimensions=None),
+        dict(dimensions=["a", "b"], color="c"),
+        dict(x="a", y="b", color="c", hover_data=["d"]),
+        dict(x="a", y="b", hover_data={"c": True, "e": np.zeros(100000)}),
+        dict(lat="a", lon="b", size="c", animation_frame="d"),
+    ],
+)
+def test_build_df_without_copies(args):
+    tracemalloc = pytest.importorskip("tracemalloc")
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({name: rng.rand(100000) for name in "abcd"})
+    args = dict(args, data_frame=df)
+
+    tracemalloc.start()
+    out = build_dataframe(args, all_attrables, array_attrables)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Columns reference the data of the input data frame
+    assert peak < df.memory_usage().sum() / 10
+    for name in out["data_frame"].columns:
+        if name in df.columns:
+            assert np.shares_memory(out["data_frame"][name].values, df[name].values)
+
+
+def test_build_df_from_dict_of_arrays():
+    data = dict(a=np.arange(3), b=np.array(["x", "y", "z"]))
+    args = dict(data_frame=data, x="a", y="b", color=np.array([1.0, 2.0, 3.0]))
+    out = build_dataframe(args, all_attrables, array_attrables)
+    assert isinstance(out["data_frame"], Columns)
+    assert out["data_frame"].columns == ["a", "b", "color"]
+    assert out["data_frame"]["a"] is data["a"]
+    assert (out["x"], out["y"], out["color"]) == ("a", "b", "color")
+
+    # Lists and pandas objects are gathered in a pandas DataFrame
+    args = dict(data_frame=data, x="a", y=["u", "v", "w"])
+    out = build_dataframe(args, all_attrables, array_attrables)
+    assert isinstance(out["data_frame"], pd.DataFrame)
+
+
+@pytest.mark.parametrize(
+    "fn,kwargs",
+    [
+        (px.scatter, dict(x="x", y="y", color="c", facet_col="f", hover_data=["n"])),
+        (px.scatter, dict(x="x", y="y", color="x", custom_data=["c", "n"])),
+        (px.line_polar, dict(r="y", theta="n", color="c", line_close=True)),
+        (px.histogram, dict(x="x", color="c", marginal="box")),
+        (px.parallel_categories, dict(dimensions=["c", "f"])),
+        (px.pie, dict(names="c", values="y", color="f")),
+        (px.sunburst, dict(path=["f", "c"], values="y")),
+        (px.scatter, dict(x="x", y="y", animation_frame="t", animation_group="n")),
+    ],
+)
+def test_dict_of_arrays_like_data_frame(fn, kwargs):
+    rng = np.random.RandomState(0)
+    data = dict(
+        x=rng.randn(40),
+        y=rng.rand(40),
+        n=np.tile(np.arange(10), 4),
+        t=np.repeat(np.arange(4), 10),
+        c=rng.choice(list("abc"), 40),
+        f=rng.choice(list("pq"), 40),
+    )
+    fig = fn(data, **kwargs)
+    assert fig.to_json() == fn(pd.DataFrame(data), **kwargs).to_json()
+
+
+def test_dict_of_arrays_without_pandas():
+    # pandas is only imported when it is needed
+    code = """
+import sys
+import numpy as np
+import plotly.express as px
+px.scatter(dict(x=np.arange(5), y=np.arange(5), c=np.array(list("aabba"))),
+           x="x", y="y", color="c").to_json()
+assert "pandas" not in sys.modules
+"""
+    subprocess.check_call([sys.executable, "-c", code])
@@ -0,0 +1,80 @@
+import plotly.express as px
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_array_equal
+
+from plotly.express._raster import RasterCanvas, pixel_bins
+
+
+def test_raster_canvas():
+    x_bins = pixel_bins(np.array([0.0, 10.0]), 10)
+    y_bins = pixel_bins(np.array([0.0, 5.0]), 5)
+    canvas = RasterCanvas(x_bins, y_bins)
+    canvas.add(np.array([0.0, 0.5, 10.0]), np.array([0.0, 0.0, 5.0]), color="#ff0000")
+    canvas.add(np.array([0.0]), np.array([0.0]), color="rgb(0, 0, 255)")
+    image = canvas.to_image()
+    z = image["z"]
+    assert z.shape == (5, 10, 4)
+    # Colors of points of the same pixel are blended
+    assert_array_equal(z[0, 0], [170, 0, 85, 1])
+    assert_array_equal(z[4, 9, :3], [255, 0, 0])
+    assert 0 < z[4, 9, 3] < 1
+    assert z[2, 2, 3] == 0
+
+    # Lines are drawn through the pixels between points
+    canvas = RasterCanvas(x_bins, y_bins)
+    canvas.add(np.array([0.0, 10.0]), np.array([0.0, 0.0]), lines=True)
+    assert_array_equal(canvas.counts.reshape(5, 10)[0] > 0, True)
+
+
+def test_scatter_raster():
+    iris = px.data.iris()
+    fig = px.scatter(
+        iris,
+        x="sepal_width",
+        y="sepal_length",
+        color="species",
+        facet_col="species",
+        render_mode="raster",
+        width=600,
+    )
+    images = [trace for trace in fig.data if trace.type == "image"]
+    legend_items = [trace for trace in fig.data if trace.type == "scatter"]
+    assert [image.xaxis for image in images] == ["x", "x2", "x3"]
+    assert np.shape(images[0].z) == (450, 200, 4)
+    assert [trace.name for trace in legend_items] == list(iris.species.unique())
+    assert legend_items[0].x == (None,)
+    assert fig.layout.yaxis.autorange is True
+
+    fig = px.scatter(
+        iris,
+        x="sepal_width",
+        y="sepal_length",
+        color="petal_length",
+        render_mode="raster",
+    )
+    (heatmap,) = fig.data
+    assert heatmap.type == "heatmap"
+    assert heatmap.coloraxis == "coloraxis"
+    assert np.nanmax(heatmap.z) == iris.petal_length.max()
+
+
+def test_line_and_density_heatmap_raster():
+    df = pd.DataFrame(dict(x=np.arange(1000), y=np.sin(np.arange(1000) / 50)))
+    fig = px.line(df, x="x", y="y", render_mode="raster", width=100, height=50)
+    assert fig.data[0].type == "image"
+    # Lines are continuous across columns of pixels
+    assert np.all(np.asarray(fig.data[0].z)[:, :, 3].max(axis=0) > 0)
+
+    fig = px.density_heatmap(df, x="x", y="y", render_mode="raster", width=100)
+    assert np.shape(fig.data[0].z) == (450, 100)
+    assert np.sum(fig.data[0].z) == len(df)
+
+
+def test_raster_invalid():
+    tips = px.data.tips()
+    with pytest.raises(ValueError):
+        px.scatter(tips, x="day", y="tip", render_mode="raster")
+    with pytest.raises(ValueError):
+        px.scatter(tips, x="total_bill", y="tip", log_x=True, render_mode="raster")
@@ -1,5 +1,7 @@
 import plotly.express as px
 import numpy as np
+import pandas as pd
+import pytest
 
 
 def test_trendline_nan_values():
@@ -12,3 +14,101 @@ def test_trendline_nan_values():
         for trendline in fig["data"][1::2]:
             assert trendline.x[0] >= start_date
             assert len(trendline.x) == len(trendline.y)
+
+
+@pytest.mark.parametrize("mode", ["ols", "lowess"])
+def test_trendline_engines(mode):
+    df = px.data.tips()
+    figs = [
+        px.scatter(
+            df,
+            x="total_bill",
+            y="tip",
+            color="sex",
+            facet_col="day",
+            trendline=mode,
+            trendline_engine=engine,
+        )
+        for engine in ["numpy", "statsmodels"]
+    ]
+    assert len(figs[0].data) == len(figs[1].data) == 16
+    for numpy_trace, statsmodels_trace in zip(figs[0].data, figs[1].data):
+        assert numpy_trace.hovertemplate == statsmodels_trace.hovertemplate
+        np.testing.assert_allclose(numpy_trace.x, statsmodels_trace.x)
+        np.testing.assert_allclose(numpy_trace.y, statsmodels_trace.y)
+
+    # Small groups, with and without ties in x, where exact fits and zero
+    # median residuals are common
+    rng = np.random.RandomState(0)
+    groups = [([1, 2, 3, 4, 5], [1, 3, 2, 5, 4])]
+    for n in range(3, 11):
+        for x in [rng.rand(n), rng.randint(0, n // 2 + 1, n)]:
+            groups.append((x, rng.randint(0, 4, n)))
+    df = pd.concat(
+        [pd.DataFrame(dict(x=x, y=y, g=str(i))) for i, (x, y) in enumerate(groups)]
+    )
+    figs = [
+        px.scatter(df, x="x", y="y", color="g", trendline=mode, trendline_engine=engine)
+        for engine in ["numpy", "statsmodels"]
+    ]
+    assert len(figs[0].data) == len(figs[1].data) == 2 * len(groups)
+    for numpy_trace, statsmodels_trace in zip(figs[0].data, figs[1].data):
+        np.testing.assert_allclose(numpy_trace.x, statsmodels_trace.x)
+        np.testing.assert_allclose(numpy_trace.y, statsmodels_trace.y, atol=1e-12)
+
+
+def test_trendline_results():
+    df = px.data.tips()
+    fig = px.scatter(df, x="total_bill", y="tip", color="sex", trendline="ols")
+    results = px.get_trendline_results(fig)
+    assert list(results["sex"]) == ["Female", "Male"]
+
+    fit_results = results["px_fit_results"].iloc[0]
+    female = df[df.sex == "Female"]
+    slope, intercept = np.polyfit(female.total_bill, female.tip, 1)
+    np.testing.assert_allclose(fit_results.params, [intercept, slope])
+    assert fit_results.nobs == len(female)
+    assert 0 < fit_results.rsquared < 1
+
+    # Other attributes are those of the statsmodels results
+    np.testing.assert_allclose(
+        fit_results.rsquared_adj,
+        1 - (1 - fit_results.rsquared) * (len(female) - 1) / (len(female) - 2),
+    )
+    assert "OLS Regression Results" in str(fit_results.summary())
+
+
+def test_trendline_dates():
+    df = pd.DataFrame(
+        dict(
+            date=pd.date_range("2020-01-01", periods=10, freq="D"),
+            value=np.arange(10.0) * 2,
+        )
+    )
+    for mode in ["ols", "lowess"]:
+        fig = px.scatter(df, x="date", y="value", trendline=mode)
+        assert fig.data[1].x[0] == df.date[0]
+        np.testing.assert_allclose(fig.data[1].y, df.value, atol=1e-6)
+
+
+def test_trendline_lowess_large_groups():
+    import statsmodels.api as sm
+
+    rng = np.random.RandomState(0)
+    x = np.linspace(0, 10, 5000)
+    y = np.sin(x) + rng.randn(len(x)) * 0.1
+    fig = px.scatter(x=x, y=y, trendline="lowess")
+
+    # Fitted to the averages of bins of points
+    assert len(fig.data[1].x) <= 2002
+    assert fig.data[1].x[0] == 0 and fig.data[1].x[-1] == 10
+
+    expected = sm.nonparametric.lowess(y, x)
+    np.testing.assert_allclose(
+        fig.data[1].y, np.interp(fig.data[1].x, *expected.T), atol=0.01
+    )
+
+
+def test_trendline_invalid_engine():
+    with pytest.raises(ValueError, match="trendline_engine"):
+        px.scatter(x=[1, 2], y=[1, 2], trendline="ols", trendline_engine="bogus")
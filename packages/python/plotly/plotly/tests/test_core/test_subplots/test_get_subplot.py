@@ -168,3 +168,63 @@ class TestGetSubplot(TestCase):
         self.assertRaises(ValueError, lambda: fig.get_subplot(5, 1))
         self.assertRaises(ValueError, lambda: fig.get_subplot(1, 0))
         self.assertRaises(ValueError, lambda: fig.get_subplot(1, 3))
+
+    def test_get_subplot_layout_objects(self):
+        fig = subplots.make_subplots(
+            rows=2, cols=2, specs=[[{}, {}], [{"type": "polar"}, {}]]
+        )
+
+        self.assertIs(fig.get_subplot(1, 2).xaxis, fig.layout.xaxis2)
+        self.assertIs(fig.get_subplot(2, 1), fig.layout.polar)
+
+        # Subplots that are replaced are looked up again
+        fig.layout.xaxis2 = {"title": {"text": "Replaced"}}
+        self.assertEqual(fig.get_subplot(1, 2).xaxis.title.text, "Replaced")
+        self.assertIs(fig.get_subplot(1, 2).xaxis, fig.layout.xaxis2)
+
+    def test_add_traces_rows_cols(self):
+        fig = subplots.make_subplots(
+            rows=2,
+            cols=2,
+            specs=[
+                [{}, {"secondary_y": True}],
+                [{"type": "domain"}, {"type": "polar"}],
+            ],
+        )
+        fig.add_traces(
+            [
+                go.Scatter(y=[2, 1, 3]),
+                go.Bar(y=[1, 3, 2]),
+                go.Pie(values=[1, 2], domain={"row": 1}),
+                go.Barpolar(r=[1, 2]),
+            ],
+            rows=[1, 1, 2, 2],
+            cols=[1, 2, 1, 2],
+            secondary_ys=[False, True, False, False],
+        )
+
+        self.assertEqual((fig.data[0].xaxis, fig.data[0].yaxis), ("x", "y"))
+        self.assertEqual((fig.data[1].xaxis, fig.data[1].yaxis), ("x2", "y3"))
+        self.assertEqual(fig.data[2].domain.row, 1)
+        self.assertEqual(fig.data[2].domain.x, fig.get_subplot(2, 1).x)
+        self.assertEqual(fig.data[3].subplot, "polar")
+        self.assertEqual(
+            fig.to_plotly_json()["data"][2]["domain"],
+            go.Pie(domain=fig.data[2].domain).to_plotly_json()["domain"],
+        )
+
+        # Traces that don't match the subplot type aren't added
+        with self.assertRaisesRegexp(ValueError, "not compatible"):
+            fig.add_trace(go.Scattermapbox(lat=[1]), row=2, col=2)
+        with self.assertRaisesRegexp(ValueError, "not compatible"):
+            fig.add_trace(go.Scatter(y=[1]), row=2, col=1)
+        self.assertEqual(len(fig.data), 4)
+
+    def test_add_trace_grid_of_lists(self):
+        # e.g. the grids of figures pickled by previous versions
+        fig = subplots.make_subplots(rows=2, cols=2)
+        fig._grid_ref = [list(row) for row in fig._grid_ref]
+
+        fig.add_scatter(y=[2, 1, 3], row=2, col=1)
+        self.assertEqual(fig.data[0].xaxis, "x3")
+        self.assertIs(fig.get_subplot(2, 1).yaxis, fig.layout.yaxis3)
@@ -1924,3 +1924,64 @@ class TestMakeSubplots(TestCase):
         expected.update_traces(uid=None)
 
         self.assertEqual(fig.to_plotly_json(), expected.to_plotly_json())
+
+    def test_layout_is_valid(self):
+        fig = subplots.make_subplots(
+            rows=2,
+            cols=3,
+            specs=[
+                [{"secondary_y": True}, {"type": "scene"}, {"type": "domain"}],
+                [{"colspan": 2}, None, {"type": "polar"}],
+            ],
+            shared_xaxes=True,
+            shared_yaxes="all",
+            subplot_titles=["A", "B", "C", "D", 5],
+            row_titles=["R1", "R2"],
+            x_title="X",
+            insets=[{"cell": (1, 1), "l": 0.7, "b": 0.3}],
+        )
+
+        # The layout of make_subplots is the same once validated again
+        validated = Figure(layout=fig.to_plotly_json()["layout"])
+        self.assertEqual(fig.to_plotly_json(), validated.to_plotly_json())
+
+        # Subplot titles are coerced like annotation text
+        self.assertEqual(fig.layout.annotations[4].text, "5")
+
+        # Subplot containers are available from the layout
+        self.assertEqual(fig.layout.xaxis.matches, None)
+        self.assertEqual(fig.layout.xaxis2.anchor, "y3")
+        self.assertEqual(fig.layout.scene.domain.y, validated.layout.scene.domain.y)
+        self.assertEqual(
+            [xaxis.plotly_name for xaxis in fig.select_xaxes()],
+            ["xaxis", "xaxis2", "xaxis3"],
+        )
+
+        fig.layout.xaxis2.title.text = "Shared"
+        self.assertEqual(
+            fig.to_plotly_json()["layout"]["xaxis2"]["title"]["text"], "Shared"
+        )
+
+    def test_invalid_domain(self):
+        with self.assertRaises(ValueError):
+            subplots.make_subplots(rows=1, cols=2, specs=[[{"l": 2.0}, {}]])
+
+    def test_grid_ref(self):
+        fig = subplots.make_subplots(
+            rows=2, cols=3, specs=[[{}, {"type": "domain"}, None], [{}, {}, {}]]
+        )
+        grid_ref = fig._grid_ref
+
+        self.assertIsInstance(grid_ref, subplots.SubplotGrid)
+        self.assertEqual(len(grid_ref), 2)
+        self.assertEqual(len(grid_ref[0]), 3)
+        self.assertEqual(grid_ref[0][0][0].trace_kwargs, {"xaxis": "x", "yaxis": "y"})
+        self.assertEqual(grid_ref[0][1][0].subplot_type, "domain")
+        self.assertIsNone(grid_ref[0][2])
+        self.assertEqual(grid_ref[-1][2][0].layout_keys, ("xaxis4", "yaxis4"))
+        self.assertEqual(grid_ref, [list(row) for row in grid_ref])
+        with self.assertRaises(IndexError):
+            grid_ref[2]
+
+        # Figures constructed from the figure share its grid
+        self.assertEqual(Figure(fig)._grid_ref, grid_ref)
@@ -1,4 +1,5 @@
 import json
+import os
 import sys
 import base64
 import threading
@@ -120,6 +121,46 @@ def test_plotly_mimetype_renderer_show(fig1, renderer):
     mock_display.assert_called_once_with(expected, raw=True)
 
 
+# Shared serialization
+# --------------------
+def test_serialized_figure_to_json(fig1):
+    from plotly.io._utils import SerializedFigure
+
+    fig_dict = fig1.to_dict()
+    expected = pio.to_json(fig_dict, validate=False, remove_uids=False)
+    assert SerializedFigure(fig_dict).to_json() == expected
+
+
+def test_serialized_figure_invalidation(fig1):
+    from plotly.io._utils import SerializedFigure
+
+    fig_dict = SerializedFigure(fig1.to_dict())
+    fig_dict.to_json()
+    fig_dict["layout"] = {"title": {"text": "New title"}}
+    assert json.loads(fig_dict.to_json())["layout"] == {"title": {"text": "New title"}}
+
+
+def test_combined_renderers_serialize_once(fig1):
+    import plotly.io._utils as io_utils
+
+    expected_json = json.loads(pio.to_json(fig1, remove_uids=False))
+
+    with mock.patch.object(
+        io_utils, "_encode_json", wraps=io_utils._encode_json
+    ) as mock_encode:
+        with mock.patch("IPython.display.display") as mock_display:
+            pio.show(fig1, renderer="plotly_mimetype+notebook_connected+json")
+
+    # One encoding per top-level figure property ('data' and 'layout')
+    assert mock_encode.call_count == 2
+
+    bundle = mock_display.call_args[0][0]
+    assert bundle["application/json"] == expected_json
+    assert "config" not in bundle["application/json"]
+    assert bundle[plotly_mimetype]["data"] == expected_json["data"]
+    assert "text/html" in bundle
+
+
 # Static Image
 # ------------
 # See plotly/tests/test_orca/test_image_renderers.py
@@ -217,6 +258,127 @@ def test_notebook_connected_show(fig1, name, connected):
     assert mock_kwargs == {"raw": True}
 
 
+# Incremental display updates
+# ---------------------------
+def test_notebook_incremental_show():
+    fig = go.Figure(
+        data=[go.Scatter(y=[1, 3, 2], name="first"), go.Bar(y=[4, 5], name="second")]
+    )
+
+    # First show displays the full figure in a bound output
+    with mock.patch("IPython.display.display") as mock_display:
+        pio.show(fig, renderer="notebook", incremental=True)
+
+    binding = fig._display_binding
+    assert binding is not None
+    mock_display.assert_called_once()
+    assert mock_display.call_args[1]["display_id"] == binding.display_id
+    full_html = mock_display.call_args[0][0]["text/html"]
+    assert binding.display_id in full_html
+    assert '"second"' in full_html
+
+    # Update a single trace
+    fig.data[0].marker.color = "red"
+    assert binding.trace_indexes == {0}
+    assert not binding.layout_changed
+
+    with mock.patch("IPython.display.display") as mock_display:
+        pio.show(fig, renderer="notebook", incremental=True)
+
+    mock_display.assert_called_once()
+    assert mock_display.call_args[1]["display_id"] == binding.update_display_id
+    update_html = mock_display.call_args[0][0]["text/html"]
+    assert "Plotly.react" in update_html
+    assert '"first"' in update_html
+    assert '"second"' not in update_html
+    assert "gd.layout" in update_html
+
+    # Later updates replace the update output in place
+    fig.update_layout(title_text="New title")
+    with mock.patch("IPython.display.update_display") as mock_update_display:
+        pio.show(fig, renderer="notebook", incremental=True)
+
+    mock_update_display.assert_called_once()
+    assert mock_update_display.call_args[1]["display_id"] == binding.update_display_id
+    update_html = mock_update_display.call_args[0][0]["text/html"]
+    assert "New title" in update_html
+
+
+def test_notebook_incremental_show_restructured():
+    fig = go.Figure(data=[go.Scatter(y=[1, 3, 2]), go.Bar(y=[4, 5])])
+
+    with mock.patch("IPython.display.display"):
+        pio.show(fig, renderer="notebook", incremental=True)
+
+    binding = fig._display_binding
+
+    # Deleting a trace requires the bound output to be replaced in full
+    fig.data = fig.data[1:]
+    assert binding.restructured
+
+    with mock.patch("IPython.display.update_display") as mock_update_display:
+        with mock.patch("IPython.display.display") as mock_display:
+            pio.show(fig, renderer="notebook", incremental=True)
+
+    mock_display.assert_not_called()
+    mock_update_display.assert_called_once()
+    assert mock_update_display.call_args[1]["display_id"] == binding.display_id
+    assert not binding.restructured
+
+
+def test_incremental_requires_figure_object(fig1):
+    with mock.patch("IPython.display.display") as mock_display:
+        pio.show(fig1.to_dict(), renderer="notebook", incremental=True)
+
+    assert "display_id" not in mock_display.call_args[1]
+
+
+# IFrame
+# ------
+def test_iframe_directory_renderer(fig1, tmpdir):
+    from plotly.io._base_renderers import IFrameRenderer
+
+    html_directory = str(tmpdir.join("iframe_figures"))
+    renderer = IFrameRenderer(
+        include_plotlyjs="directory",
+        html_directory=html_directory,
+        async_write=True,
+        max_figures=2,
+    )
+
+    filenames = [
+        "{dirname}/figure_{i}.html".format(dirname=html_directory, i=i)
+        for i in range(3)
+    ]
+
+    for i, filename in enumerate(filenames):
+        with mock.patch.object(renderer, "build_filename", return_value=filename):
+            bundle = renderer.to_mimebundle(fig1.to_dict())
+        assert 'src="{filename}"'.format(filename=filename) in bundle["text/html"]
+
+        # Make sure that modification times are distinct
+        renderer.flush()
+        time.sleep(0.01)
+        os.utime(filename, (i, i))
+
+    # plotly.js is written once and shared by all figure files
+    assert os.path.exists(os.path.join(html_directory, "plotly.min.js"))
+
+    # Only the two most recently written figures are kept
+    assert sorted(os.listdir(html_directory)) == [
+        "figure_1.html",
+        "figure_2.html",
+        "plotly.min.js",
+    ]
+
+    with open(filenames[-1]) as f:
+        html = f.read()
+
+    assert '<script src="plotly.min.js"></script>' in html
+    assert get_plotlyjs() not in html
+    assert "Figure title" in html
+
+
 # Browser
 # -------
 @pytest.mark.parametrize("renderer", ["browser", "chrome", "firefox"])
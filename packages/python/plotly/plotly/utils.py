@@ -23,7 +23,8 @@ def _list_repr_elided(v, threshold=200, edgeitems=3, indent=0, width=80):
     -------
     str
     """
-    if isinstance(v, list):
+    np = get_module("numpy", should_load=False)
+    if isinstance(v, list) or (np is not None and isinstance(v, np.ndarray)):
         open_char, close_char = "[", "]"
     elif isinstance(v, tuple):
         open_char, close_char = "(", ")"